@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+📊 AGREGADOR INCREMENTAL DE SENTIMENTOS
+Atualiza todos os contadores em O(1) por resultado a partir do código
+inteiro da classe (lexico.MUITO_NEGATIVO ... lexico.MUITO_POSITIVO), em vez
+de uma passada `sum(1 for ...)` com busca de substring por categoria.
+Agregados parciais (ex.: de workers paralelos) podem ser mesclados.
+"""
+
+from lexico import MUITO_NEGATIVO, NEGATIVO, NEUTRO, POSITIVO, MUITO_POSITIVO
+
+# Ordem de exibição usada nos gráficos de barras
+CATEGORIAS = ['Muito Positivo', 'Positivo', 'Neutro', 'Negativo', 'Muito Negativo']
+CODIGOS_CATEGORIAS = [MUITO_POSITIVO, POSITIVO, NEUTRO, NEGATIVO, MUITO_NEGATIVO]
+
+
+def codigo_de_rotulo(rotulo):
+    """Converte um rótulo antigo ("😍 MUITO POSITIVO", "❌ NEGATIVO"...) no código"""
+    if "MUITO POSITIVO" in rotulo:
+        return MUITO_POSITIVO
+    elif "MUITO NEGATIVO" in rotulo:
+        return MUITO_NEGATIVO
+    elif "POSITIVO" in rotulo:
+        return POSITIVO
+    elif "NEGATIVO" in rotulo:
+        return NEGATIVO
+    else:
+        return NEUTRO
+
+
+class AgregadorSentimentos:
+    __slots__ = ('contagens', 'total', 'soma_scores', 'soma_engajamento')
+
+    def __init__(self, codigos=(), scores=None):
+        self.contagens = [0] * 5    # índice = código + 2 (MUITO_NEGATIVO → 0)
+        self.total = 0
+        self.soma_scores = 0
+        self.soma_engajamento = 0
+        self.adicionar_lote(codigos, scores)
+
+    def adicionar(self, codigo, score=0, engajamento=0):
+        """Conta um resultado"""
+        self.contagens[codigo + 2] += 1
+        self.total += 1
+        self.soma_scores += score
+        self.soma_engajamento += engajamento
+
+    def adicionar_lote(self, codigos, scores=None):
+        """Conta vários códigos (ex.: ResultadoLote.rotulos) de uma vez"""
+        contagens = self.contagens
+        for codigo in codigos:
+            contagens[codigo + 2] += 1
+            self.total += 1
+        if scores is not None:
+            self.soma_scores += sum(scores)
+
+    def mesclar(self, outro):
+        """Soma um agregado parcial neste (ex.: vindo de outro worker)"""
+        for i, valor in enumerate(outro.contagens):
+            self.contagens[i] += valor
+        self.total += outro.total
+        self.soma_scores += outro.soma_scores
+        self.soma_engajamento += outro.soma_engajamento
+        return self
+
+    __iadd__ = mesclar
+
+    def __add__(self, outro):
+        return AgregadorSentimentos().mesclar(self).mesclar(outro)
+
+    def quantidade(self, codigo):
+        return self.contagens[codigo + 2]
+
+    @property
+    def positivos(self):
+        return self.contagens[POSITIVO + 2] + self.contagens[MUITO_POSITIVO + 2]
+
+    @property
+    def negativos(self):
+        return self.contagens[NEGATIVO + 2] + self.contagens[MUITO_NEGATIVO + 2]
+
+    @property
+    def neutros(self):
+        return self.contagens[NEUTRO + 2]
+
+    def detalhado(self):
+        """Quantidades na ordem de CATEGORIAS (Muito Positivo → Muito Negativo)"""
+        return [self.contagens[codigo + 2] for codigo in CODIGOS_CATEGORIAS]
+
+    def percentual(self, quantidade):
+        return quantidade / self.total * 100 if self.total else 0.0
+
+    def score_medio(self):
+        return self.soma_scores / self.total if self.total else 0.0
+
+    def engajamento_medio(self):
+        return self.soma_engajamento // self.total if self.total else 0
+
+    def sentimento_geral(self):
+        """POSITIVO, NEGATIVO ou NEUTRO pela maioria entre positivos e negativos"""
+        if self.positivos > self.negativos:
+            return POSITIVO
+        elif self.negativos > self.positivos:
+            return NEGATIVO
+        else:
+            return NEUTRO
+
+    def resumo(self):
+        """Totais no formato salvo no banco de dados"""
+        return {
+            'total_tweets': self.total,
+            'positivos': self.positivos,
+            'negativos': self.negativos,
+            'neutros': self.neutros,
+            'sentimento_geral': {POSITIVO: "POSITIVO", NEGATIVO: "NEGATIVO"}.get(
+                self.sentimento_geral(), "NEUTRO")
+        }
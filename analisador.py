@@ -3,21 +3,19 @@
 
 print("🎉 Testando instalação no macOS...")
 
-# Testar imports
-try:
-    import pandas as pd
-    import numpy as np
-    from sklearn.feature_extraction.text import CountVectorizer
-    import nltk
-    import matplotlib.pyplot as plt
-    
-    print("✅ Todas as bibliotecas importadas com sucesso!")
-    print(f"📊 Pandas version: {pd.__version__}")
-    print(f"🔢 NumPy version: {np.__version__}")
-    
-except ImportError as e:
-    print(f"❌ Erro: {e}")
+# Testar instalação: localiza os pacotes sem importá-los (importar sklearn,
+# nltk e matplotlib levaria segundos e nada abaixo usa essas bibliotecas)
+from importlib.metadata import version
+from importlib.util import find_spec
+
+faltando = [nome for nome in ("pandas", "numpy", "sklearn", "nltk", "matplotlib") if find_spec(nome) is None]
+if faltando:
+    print(f"❌ Erro: não encontrado(s): {', '.join(faltando)}")
     print("Execute: pip3 install pandas numpy scikit-learn nltk matplotlib")
+else:
+    print("✅ Todas as bibliotecas encontradas com sucesso!")
+    print(f"📊 Pandas version: {version('pandas')}")
+    print(f"🔢 NumPy version: {version('numpy')}")
 
 # Teste simples de análise de sentimentos
 print("\n🧠 Testando análise de sentimentos básica...")
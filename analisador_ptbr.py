@@ -4,10 +4,16 @@
 print("🇧🇷 ANALISADOR DE SENTIMENTOS - PORTUGUÊS BRASILEIRO")
 print("=" * 60)
 
-import re
+import copy
+import os
+import numpy as np
+from artefatos import carregar_modelo, carregar_ou_treinar, versao_treino
+from expressoes import MatcherExpressoes
+from nb_rapido import ClassificadorNBRapido
 from sklearn.feature_extraction.text import CountVectorizer
 from sklearn.naive_bayes import MultinomialNB
-from sklearn.pipeline import make_pipeline
+from sklearn.pipeline import Pipeline, make_pipeline
+from tokenizacao import AnalisadorTokens, suporta_tokens, tokenizar, tokenizar_lote
 
 print("✅ Iniciando analisador para português...")
 
@@ -56,115 +62,172 @@ rotulos_treinamento = [1] * 16 + [0] * 16  # 16 positivos, 16 negativos
 
 print(f"📊 Dataset carregado: {len(textos_treinamento)} frases em português")
 
-# Pré-processamento específico para português
+# Expressões comuns no Brasil (manter como uma única "palavra")
+EXPRESSOES_PTBR = {
+    'show de bola': 'showdebola',
+    'top demais': 'topdemais', 
+    'dinheiro jogado fora': 'dinheirojogadofora',
+    'nota dez': 'notadez',
+    'custo benefício': 'custobeneficio',
+    'zero defeitos': 'zerodefeitos'
+}
+
+# Autômato montado uma única vez: todas as expressões trocadas numa só passada
+matcher_expressoes = MatcherExpressoes(EXPRESSOES_PTBR)
+
+# Pré-processamento específico para português, sobre os tokens compartilhados
+# (tokenizacao.py): sem caracteres especiais, com acentos, expressões juntas
+def tokens_ptbr(tokenizado):
+    return matcher_expressoes.substituir(tokenizado.sem_pontuacao).split()
+
 def preprocessar_ptbr(texto):
-    texto = texto.lower()
-    
-    # Remover caracteres especiais mas manter acentos
-    texto = re.sub(r'[^\w\sáàâãéèêíïóôõöúçñ]', '', texto)
-    
-    # Expressões comuns no Brasil (manter como uma única "palavra")
-    expressoes = {
-        'show de bola': 'showdebola',
-        'top demais': 'topdemais', 
-        'dinheiro jogado fora': 'dinheirojogadofora',
-        'nota dez': 'notadez',
-        'custo benefício': 'custobeneficio',
-        'zero defeitos': 'zerodefeitos'
-    }
-    
-    for exp, substituicao in expressoes.items():
-        texto = texto.replace(exp, substituicao)
-    
-    return texto
+    return " ".join(tokenizar(texto).visao('ptbr', tokens_ptbr))
 
 print("🔧 Aplicando pré-processamento para português...")
 textos_processados = [preprocessar_ptbr(texto) for texto in textos_treinamento]
 
-# Criar modelo otimizado para português
-modelo_ptbr = make_pipeline(
-    CountVectorizer(
-        ngram_range=(1, 2),  # Captura palavras simples e combinações
-        max_features=100     # Foca nas palavras mais importantes
-    ),
-    MultinomialNB()
-)
+PARAMETROS_PTBR = {
+    'ngram_range': (1, 2),  # Captura palavras simples e combinações
+    'max_features': 100     # Foca nas palavras mais importantes
+}
+
+def treinar_modelo_ptbr():
+    """Treina o modelo otimizado para português (use treinar_modelos.py para gravar)"""
+    modelo = make_pipeline(CountVectorizer(**PARAMETROS_PTBR), MultinomialNB())
+    modelo.fit(textos_processados, rotulos_treinamento)
+    return modelo
+
+# Treina só se não houver artefato desta versão em modelos/ptbr/
+VERSAO_PTBR = versao_treino(textos_processados, rotulos_treinamento, PARAMETROS_PTBR)
+
+# ANALISADOR_MODELO_PTBR=nome[/versao] troca pelo artefato de outro treino
+# (ex.: ptbr_stream, gerado por treino_streaming.py)
+MODELO_EXTERNO = os.environ.get("ANALISADOR_MODELO_PTBR")
+modelo_ptbr, treinado = None, False
+if MODELO_EXTERNO:
+    nome_modelo, _, versao_modelo = MODELO_EXTERNO.partition("/")
+    modelo_ptbr = carregar_modelo(nome_modelo, versao_modelo or None)
+    if modelo_ptbr is None:
+        print(f"⚠️  Modelo '{MODELO_EXTERNO}' não encontrado em modelos/, usando o padrão")
+    else:
+        print(f"💾 Modelo '{nome_modelo}' carregado (versão {modelo_ptbr.versao})")
+if modelo_ptbr is None:
+    modelo_ptbr, treinado = carregar_ou_treinar("ptbr", VERSAO_PTBR, treinar_modelo_ptbr)
+    if treinado:
+        print("🧠 Modelo para português treinado e salvo em modelos/ptbr/")
+    else:
+        print(f"💾 Modelo para português carregado (versão {VERSAO_PTBR})")
+
+# Mesmo modelo recebendo textos já tokenizados: o analisador lê a visão 'ptbr'
+# do TextoTokenizado em vez de rodar a regex do sklearn de novo
+def _modelo_tokens(modelo):
+    passo, vetorizador = modelo.steps[0]
+    original = vetorizador.build_analyzer()
+    vetorizador = copy.copy(vetorizador)
+    if suporta_tokens(vetorizador):
+        vetorizador.analyzer = AnalisadorTokens(vetorizador.ngram_range, 'ptbr', tokens_ptbr)
+    else:
+        # Tokenização personalizada: volta à string pré-processada
+        vetorizador.analyzer = lambda documento: original(preprocessar_ptbr(documento))
+    vetorizador.token_pattern = None
+    return Pipeline([(passo, vetorizador), modelo.steps[-1]])
+
+modelo_tokens = _modelo_tokens(modelo_ptbr)
+
+# Frase única (modo interativo): tabela de log-probabilidades sem o pipeline
+# do sklearn. Com HashingVectorizer não há vocabulário e fica o caminho em lote.
+try:
+    classificador_rapido = ClassificadorNBRapido.de_pipeline(modelo_tokens)
+except ValueError:
+    classificador_rapido = None
+
+# Palavras específicas do português, já com o marcador pronto (uma consulta por token)
+palavras_positivas_br = {'top', 'show', 'maneiro', 'curti', 'gostei', 'amei', 'adorei', 'incrível'}
+palavras_negativas_br = {'porcaria', 'péssimo', 'horroroso', 'furada', 'arrependimento', 'golpe'}
+MARCADORES_BR = {palavra: f"➖'{palavra}'" for palavra in palavras_negativas_br}
+MARCADORES_BR.update({palavra: f"➕'{palavra}'" for palavra in palavras_positivas_br})
+
+# Análise em lote: vetoriza todas as frases e chama predict_proba uma única vez
+# (aceita textos ou TextoTokenizado já prontos, ex.: vindos da cascata)
+def analisar_lote_ptbr(frases):
+    tokenizados = tokenizar_lote(frases)
+    if not tokenizados:
+        return []
+    probabilidades = modelo_tokens.predict_proba(tokenizados)
+    indices = probabilidades.argmax(axis=1)
+    positivas = modelo_ptbr.classes_[indices] == 1
+    confiancas = probabilidades[np.arange(len(indices)), indices] * 100
+    
+    return [_montar_resultado(tokenizado, positiva, confianca)
+            for tokenizado, positiva, confianca in zip(tokenizados, positivas, confiancas)]
 
-print("🧠 TREINANDO MODELO PARA PORTUGUÊS...")
-modelo_ptbr.fit(textos_processados, rotulos_treinamento)
-print("✅ Modelo treinado com sucesso!")
+def _montar_resultado(tokenizado, positiva, confianca):
+    sentimento = "😊 POSITIVO" if positiva else "😠 NEGATIVO"
+    palavras_detectadas = [MARCADORES_BR[palavra] for palavra in tokenizado.tokens
+                           if palavra in MARCADORES_BR]
+    return sentimento, confianca, palavras_detectadas
 
 # Função de análise com detalhes em português
 def analisar_detalhado_ptbr(frase):
-    frase_processada = preprocessar_ptbr(frase)
-    predicao = modelo_ptbr.predict([frase_processada])[0]
-    probabilidades = modelo_ptbr.predict_proba([frase_processada])[0]
-    
-    sentimento = "😊 POSITIVO" if predicao == 1 else "😠 NEGATIVO"
-    confianca = probabilidades[predicao] * 100
-    
-    # Analisar palavras específicas do português
-    palavras_positivas_br = ['top', 'show', 'maneiro', 'curti', 'gostei', 'amei', 'adorei', 'incrível']
-    palavras_negativas_br = ['porcaria', 'péssimo', 'horroroso', 'furada', 'arrependimento', 'golpe']
-    
-    palavras_detectadas = []
-    for palavra in frase.lower().split():
-        if palavra in palavras_positivas_br:
-            palavras_detectadas.append(f"➕'{palavra}'")
-        elif palavra in palavras_negativas_br:
-            palavras_detectadas.append(f"➖'{palavra}'")
-    
-    return sentimento, confianca, palavras_detectadas
-
-# Testar com expressões brasileiras
-print("\n🧪 TESTANDO COM EXPRESSÕES BRASILEIRAS:")
-print("-" * 50)
+    if classificador_rapido is None:
+        return analisar_lote_ptbr([frase])[0]
+    tokenizado = tokenizar(frase)
+    classe, probabilidade = classificador_rapido.prever(tokenizado)
+    return _montar_resultado(tokenizado, classe == 1, probabilidade * 100)
+
+def main():
+    # Testar com expressões brasileiras
+    print("\n🧪 TESTANDO COM EXPRESSÕES BRASILEIRAS:")
+    print("-" * 50)
+
+    testes_brasileiros = [
+        "achei top demais show de bola",
+        "que porcaria dinheiro jogado fora", 
+        "produto maneiro curti muito",
+        "golpe completo furada",
+        "custo benefício excelente",
+        "atendimento horroroso péssimo",
+        "nota dez recomendo",
+        "arrependimento total não comprem"
+    ]
+
+    for frase in testes_brasileiros:
+        sentimento, confianca, palavras = analisar_detalhado_ptbr(frase)
+
+        print(f"📝 '{frase}'")
+        print(f"   → {sentimento} ({confianca:.1f}% de confiança)")
+        if palavras:
+            print(f"   🔍 {', '.join(palavras)}")
+        print()
+
+    # Estatísticas em português
+    acuracia_ptbr = modelo_ptbr.score(textos_processados, rotulos_treinamento)
+    print(f"📈 Acurácia para português: {acuracia_ptbr * 100:.1f}%")
+
+    # Teste interativo BR
+    print("\n🔄 MODO INTERATIVO BR (digite 'sair' para parar)")
+    print("-" * 50)
+
+    while True:
+        try:
+            user_input = input("\n😊 Digite uma frase em português: ")
+
+            if user_input.lower() == 'sair':
+                print("👋 Valeu! Até mais!")
+                break
+
+            if user_input.strip():
+                sentimento, confianca, palavras = analisar_detalhado_ptbr(user_input)
+                print(f"   🎯 {sentimento} ({confianca:.1f}% de confiança)")
+
+                if confianca < 70:
+                    print("   ⚠️  Confiança baixa - talvez seja neutro?")
+
+        except KeyboardInterrupt:
+            print("\n\n👋 Programa encerrado pelo usuário!")
+            break
 
-testes_brasileiros = [
-    "achei top demais show de bola",
-    "que porcaria dinheiro jogado fora", 
-    "produto maneiro curti muito",
-    "golpe completo furada",
-    "custo benefício excelente",
-    "atendimento horroroso péssimo",
-    "nota dez recomendo",
-    "arrependimento total não comprem"
-]
+    print("\n✨ Analisador de sentimentos em português brasileiro - PRONTO! 🎊")
 
-for frase in testes_brasileiros:
-    sentimento, confianca, palavras = analisar_detalhado_ptbr(frase)
-    
-    print(f"📝 '{frase}'")
-    print(f"   → {sentimento} ({confianca:.1f}% de confiança)")
-    if palavras:
-        print(f"   🔍 {', '.join(palavras)}")
-    print()
-
-# Estatísticas em português
-acuracia_ptbr = modelo_ptbr.score(textos_processados, rotulos_treinamento)
-print(f"📈 Acurácia para português: {acuracia_ptbr * 100:.1f}%")
-
-# Teste interativo BR
-print("\n🔄 MODO INTERATIVO BR (digite 'sair' para parar)")
-print("-" * 50)
-
-while True:
-    try:
-        user_input = input("\n😊 Digite uma frase em português: ")
-        
-        if user_input.lower() == 'sair':
-            print("👋 Valeu! Até mais!")
-            break
-        
-        if user_input.strip():
-            sentimento, confianca, palavras = analisar_detalhado_ptbr(user_input)
-            print(f"   🎯 {sentimento} ({confianca:.1f}% de confiança)")
-            
-            if confianca < 70:
-                print("   ⚠️  Confiança baixa - talvez seja neutro?")
-            
-    except KeyboardInterrupt:
-        print("\n\n👋 Programa encerrado pelo usuário!")
-        break
-
-print("\n✨ Analisador de sentimentos em português brasileiro - PRONTO! 🎊")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
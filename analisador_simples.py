@@ -1,12 +1,19 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import random
+import numpy as np
 from datetime import datetime, timedelta
-import tweepy
 import os
-from textblob import TextBlob
+import threading
+import time
+
+import backends
+from agregador import CATEGORIAS
+from cache import cache_nomeado
+from comparacao import analisar_topicos, mostrar_comparacao
+from graficos import grafico_engajamento
+from lexico import MUITO_POSITIVO, POSITIVO, NEUTRO, NEGATIVO, MUITO_NEGATIVO
+from paginacao import escapar, mostrar_resultados
+from recursos_streamlit import dados, medir_execucao, mostrar_estatisticas, recurso
+from resultados import ResultadosTweets
 
 # CONFIGURAÇÃO DA PÁGINA
 st.set_page_config(
@@ -156,8 +163,27 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Opção do seletor que deixa o registro escolher o backend mais rápido
+AUTOMATICO = "⚡ automático"
+
+# Opção do selectbox que compara todas as categorias lado a lado
+TODAS = "🧭 Todas as categorias (comparação)"
+
+def acuracia_medida(backend="textblob"):
+    """Acurácia do backend no último benchmark_backends.py (None se nunca foi medida)"""
+    return backends.medicoes().get(backend, {}).get('acuracia')
+
 class TwitterSentimentAnalyzer:
-    def __init__(self):
+    # Código da classe → (rótulo, cor, emoji)
+    ROTULOS = {
+        MUITO_POSITIVO: ("🌟 MUITO POSITIVO", "#00b894", "🎯"),
+        POSITIVO: ("✅ POSITIVO", "#00cec9", "↑"),
+        NEUTRO: ("⚖️ NEUTRO", "#fdcb6e", "➡️"),
+        NEGATIVO: ("❌ NEGATIVO", "#e17055", "↓"),
+        MUITO_NEGATIVO: ("💥 MUITO NEGATIVO", "#d63031", "⚠️"),
+    }
+    
+    def __init__(self, backend=None):
         # CONFIGURAÇÃO SEGURA COM SECRETS
         self.api_key = st.secrets.get("TWITTER_API_KEY", "sua_chave_aqui")
         self.api_secret = st.secrets.get("TWITTER_API_SECRET", "seu_secret_aqui")
@@ -176,14 +202,27 @@ class TwitterSentimentAnalyzer:
             "🛒 Consumo & Marcas"
         ]
         
-        # Autenticação
-        try:
-            self.auth = tweepy.OAuthHandler(self.api_key, self.api_secret)
-            self.auth.set_access_token(self.access_token, self.access_token_secret)
-            self.api = tweepy.API(self.auth, wait_on_rate_limit=True)
-        except Exception as e:
-            # Silencioso - não mostra erro
-            pass
+        # Backend de sentimento: argumento, ANALISADOR_BACKEND ou TextBlob
+        self.nome_backend = backend or backends.BACKEND_CONFIGURADO or "textblob"
+        if self.nome_backend == "textblob":
+            # Cache de resultados para textos repetidos (invalida se o TextBlob mudar)
+            self.backend = backends.criar("textblob", cache=cache_nomeado("analisador_simples.TextBlob"))
+        else:
+            self.backend = backends.obter(self.nome_backend)
+        
+        # Cliente da API: tweepy só é importado na primeira busca
+        self.api = None
+        self._trava_api = threading.Lock()
+    
+    def _conectar(self):
+        """Autentica no Twitter (uma vez por instância, mesmo com buscas em paralelo)"""
+        with self._trava_api:
+            if self.api is None:
+                import tweepy
+                self.auth = tweepy.OAuthHandler(self.api_key, self.api_secret)
+                self.auth.set_access_token(self.access_token, self.access_token_secret)
+                self.api = tweepy.API(self.auth, wait_on_rate_limit=True)
+        return self.api
     
     def buscar_tweets_reais(self, query, quantidade=50):
         """Busca tweets reais baseados na query"""
@@ -202,15 +241,17 @@ class TwitterSentimentAnalyzer:
             
             query_pt = topicos_queries.get(query, query)
             
-            tweets = self.api.search_tweets(q=query_pt, count=min(quantidade, 100), tweet_mode='extended')
+            # Segue os cursores (max_id) além dos 100 tweets de uma chamada, sem repetidos
+            from coleta import coletar_paginas
             
             tweets_texto = []
-            for tweet in tweets:
-                # Pega o texto completo do tweet
-                texto = tweet.full_text if hasattr(tweet, 'full_text') else tweet.text
-                # Filtra tweets muito curtos ou com links apenas
-                if len(texto) > 10 and not texto.startswith('RT'):
-                    tweets_texto.append(texto)
+            for pagina in coletar_paginas(self._conectar(), query_pt):
+                for tweet in pagina:
+                    # Filtra tweets muito curtos ou com links apenas
+                    if len(tweet['texto']) > 10 and not tweet['texto'].startswith('RT'):
+                        tweets_texto.append(tweet['texto'])
+                if len(tweets_texto) >= quantidade:
+                    break
             
             return tweets_texto[:quantidade]
             
@@ -321,29 +362,100 @@ class TwitterSentimentAnalyzer:
         return fallback_data.get(query, ["Analisando dados do tema selecionado... 📊"])[:quantidade]
     
     def analisar_sentimento_avancado(self, texto):
-        """Análise de sentimentos usando TextBlob"""
-        try:
-            analysis = TextBlob(texto)
-            
-            # Classifica baseado na polaridade
-            polarity = analysis.sentiment.polarity
-            
-            if polarity > 0.2:
-                return "🌟 MUITO POSITIVO", polarity, "#00b894", "🎯"
-            elif polarity > 0.05:
-                return "✅ POSITIVO", polarity, "#00cec9", "↑"
-            elif polarity < -0.2:
-                return "💥 MUITO NEGATIVO", polarity, "#d63031", "⚠️"
-            elif polarity < -0.05:
-                return "❌ NEGATIVO", polarity, "#e17055", "↓"
-            else:
-                return "⚖️ NEUTRO", polarity, "#fdcb6e", "➡️"
-                
-        except Exception as e:
-            return "⚖️ NEUTRO", 0, "#fdcb6e", "➡️"
+        """Análise de sentimentos pelo backend configurado: (código, score)"""
+        codigo, score, _ = self.backend.analisar(texto)
+        return codigo, score
+    
+    def analisar_categorias(self, quantidade, categorias=None):
+        """Todas as categorias buscadas e pontuadas ao mesmo tempo: {categoria: ResultadosTweets}"""
+        return analisar_topicos(lambda categoria: self.buscar_tweets_reais(categoria, quantidade),
+                                self.analisar_lote, categorias or self.categorias,
+                                thread_safe=self.backend.capacidades.thread_safe)
+    
+    def analisar_lote(self, textos):
+        """Analisa vários textos e devolve o lote em colunas (ResultadosTweets)"""
+        lote = self.backend.analisar_lote(textos)
+        n = len(textos)
+        rng = np.random.default_rng()
+        return ResultadosTweets.de_colunas(
+            textos, lote.rotulos, lote.scores,
+            usuarios=rng.integers(10000, 100000, n),
+            likes=rng.integers(40, 801, n),
+            retweets=rng.integers(10, 201, n)
+        )
+
+# Buscas por tópico (API ou fallback) e seus scores valem por 5 minutos
+TTL_BUSCA = 300
+
+# Tweets por análise na coleta em massa
+VOLUME_MAXIMO = 10_000
+
+@recurso
+def obter_analisador(backend=None):
+    """Analisador (backend + cliente da API) criado uma vez por processo e backend"""
+    return TwitterSentimentAnalyzer(backend)
+
+@dados(ttl=TTL_BUSCA)
+def analisar_topico(topico, quantidade, backend):
+    """Busca e pontua os tweets do tópico; reruns e outras sessões reaproveitam"""
+    analyzer = obter_analisador(backend)
+    return analyzer.analisar_lote(analyzer.buscar_tweets_reais(topico, quantidade))
+
+def cartao_tweet(resultado, numero):
+    """HTML do cartão de um tweet analisado"""
+    sentimento, cor, emoji = TwitterSentimentAnalyzer.ROTULOS[resultado.codigo]
+    return f"""
+    <div class="tweet-card" style="border-left-color: {cor}">
+        <div style="display: flex; justify-content: space-between; align-items: start;">
+            <div style="flex: 1;">
+                <p style="margin: 0; font-size: 1rem; line-height: 1.5;">{escapar(resultado.texto)}</p>
+                <div style="margin-top: 10px; display: flex; gap: 15px; align-items: center;">
+                    <small>👤 @{resultado.nome_usuario}</small>
+                    <small>🔥 {resultado.engajamento} engajamento</small>
+                    <small>📊 Score: {resultado.score:.2f}</small>
+                </div>
+            </div>
+            <div style="text-align: right;">
+                <div class="sentiment-badge" style="background-color: {cor}20; color: {cor}; border: 1px solid {cor}40;">
+                    <strong>{emoji} {sentimento}</strong>
+                </div>
+            </div>
+        </div>
+    </div>
+    """
+
+@dados(ttl=TTL_BUSCA)
+def comparar_categorias(quantidade, backend):
+    """Todas as categorias em paralelo e o tempo total (segundos) da busca e pontuação"""
+    inicio = time.perf_counter()
+    resultados = obter_analisador(backend).analisar_categorias(quantidade)
+    return resultados, time.perf_counter() - inicio
+
+@dados(ttl=TTL_BUSCA)
+def graficos_topico(topico, quantidade, backend):
+    """Gráficos da análise do tópico já montados (dicts do plotly): montar com o
+    plotly express custa mais que o resto do rerun"""
+    import pandas as pd
+    import plotly.express as px
+    
+    resultados = analisar_topico(topico, quantidade, backend)
+    df = pd.DataFrame({
+        'Categoria': CATEGORIAS,
+        'Valores': resultados.agregado().detalhado()
+    })
+    
+    fig = px.bar(df, x='Categoria', y='Valores', 
+               color='Categoria',
+               color_discrete_sequence=['#00b894', '#00cec9', '#fdcb6e', '#e17055', '#d63031'])
+    fig.update_layout(showlegend=False)
+    
+    # Dispersão SVG, WebGL ou histograma 2D conforme o volume (graficos.py)
+    fig_scatter = grafico_engajamento(resultados, TwitterSentimentAnalyzer.ROTULOS,
+                                      ['#00b894', '#00cec9', '#fdcb6e', '#e17055', '#d63031'])
+    return fig.to_dict(), fig_scatter
 
 def main():
-    analyzer = TwitterSentimentAnalyzer()
+    analyzer = obter_analisador()
     
     # HEADER PREMIUM
     st.markdown('<h1 class="main-header">🚀 Sentiment Analytics Pro</h1>', unsafe_allow_html=True)
@@ -356,22 +468,40 @@ def main():
         
         topico = st.selectbox(
             "📂 Selecione a Categoria:",
-            analyzer.categorias
+            analyzer.categorias + [TODAS]
         )
         
-        quantidade = st.slider(
-            "📊 Volume de Análise:",
-            min_value=5,
-            max_value=20,
-            value=10,
-            help="Quantidade de dados para análise"
-        )
+        if st.toggle("📥 Coleta em massa", help="Segue a paginação da busca para milhares de tweets"):
+            quantidade = st.number_input("📊 Volume de Análise:", min_value=100, max_value=VOLUME_MAXIMO,
+                                         value=1000, step=100)
+        else:
+            quantidade = st.slider(
+                "📊 Volume de Análise:",
+                min_value=5,
+                max_value=20,
+                value=10,
+                help="Quantidade de dados para análise"
+            )
         
         detalhamento = st.select_slider(
             "🎚️ Nível de Detalhe:",
             options=["Básico", "Intermediário", "Avançado", "Completo"]
         )
         
+        opcoes_backend = [AUTOMATICO] + backends.disponiveis()
+        escolha = st.selectbox(
+            "🧠 Motor de Análise:",
+            opcoes_backend,
+            index=opcoes_backend.index(analyzer.nome_backend),
+            help="automático: o mais rápido (medido) com acurácia mínima, entre os seguros para várias sessões"
+        )
+        if escolha == AUTOMATICO:
+            escolha = backends.mais_rapido(quantidade, thread_safe=True,
+                                           acuracia_minima=backends.ACURACIA_MINIMA_APPS)
+            st.caption(f"⚡ usando {escolha}")
+        if escolha != analyzer.nome_backend:
+            analyzer = obter_analisador(escolha)
+        
         if st.button("🚀 Executar Análise Avançada", use_container_width=True):
             st.session_state.analisar = True
             st.session_state.topico = topico
@@ -383,34 +513,30 @@ def main():
         st.header("📈 Status do Sistema")
         st.metric("Categorias Disponíveis", "8")
         st.metric("Análises Realizadas", "∞")
-        st.metric("Precisão do Modelo", "94.7%")
+        acuracia = acuracia_medida(analyzer.nome_backend)
+        st.metric(f"Acurácia Medida ({analyzer.nome_backend})", "não medida" if acuracia is None else f"{acuracia * 100:.1f}%",
+                  help="python benchmark_backends.py")
         st.markdown('</div>', unsafe_allow_html=True)
+        
+        mostrar_estatisticas()
     
     # CONTEÚDO PRINCIPAL
-    if st.session_state.get('analisar', False):
+    if st.session_state.get('analisar', False) and st.session_state.topico == TODAS:
+        with st.spinner("🧭 Buscando e analisando todas as categorias..."):
+            resultados, segundos = comparar_categorias(quantidade, analyzer.nome_backend)
+        st.markdown('<div class="glass-card">', unsafe_allow_html=True)
+        mostrar_comparacao(resultados, segundos)
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    elif st.session_state.get('analisar', False):
         topico = st.session_state.topico
         
         with st.spinner("🔮 Processando análise avançada..."):
-            # Buscar tweets REAIS (ou fallback)
-            tweets = analyzer.buscar_tweets_reais(topico, quantidade)
-            resultados = []
-            
-            for tweet in tweets:
-                sentimento, score, cor, emoji = analyzer.analisar_sentimento_avancado(tweet)
-                resultados.append({
-                    'texto': tweet,
-                    'sentimento': sentimento,
-                    'score': score,
-                    'cor': cor,
-                    'emoji': emoji,
-                    'usuario': f'user_{random.randint(10000, 99999)}',
-                    'engajamento': random.randint(50, 1000)
-                })
-            
-            # DEBUG - verificar se há resultados
-            st.write(f"Total de resultados: {len(resultados)}")
-            for i, resultado in enumerate(resultados):
-                st.write(f"Resultado {i}: {resultado['texto'][:50]}...")
+            # Buscar tweets REAIS (ou fallback), em cache por TTL_BUSCA
+            resultados = analisar_topico(topico, quantidade, analyzer.nome_backend)
+            agregado = resultados.agregado()
+            # Gráficos em cache junto com a busca (pandas/plotly só carregam aqui)
+            fig, fig_scatter = graficos_topico(topico, quantidade, analyzer.nome_backend)
             
             # MÉTRICAS PREMIUM
             st.markdown('<div class="fade-in">', unsafe_allow_html=True)
@@ -418,37 +544,37 @@ def main():
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
-                positivos = sum(1 for r in resultados if "POSITIVO" in r['sentimento'])
+                positivos = agregado.positivos
                 st.markdown(f"""
                 <div class="metric-card">
                     <div class="metric-label">POSITIVOS</div>
                     <div class="metric-value">{positivos}</div>
-                    <div>📈 {positivos/len(resultados)*100:.1f}%</div>
+                    <div>📈 {agregado.percentual(positivos):.1f}%</div>
                 </div>
                 """, unsafe_allow_html=True)
             
             with col2:
-                negativos = sum(1 for r in resultados if "NEGATIVO" in r['sentimento'])
+                negativos = agregado.negativos
                 st.markdown(f"""
                 <div class="metric-card">
                     <div class="metric-label">NEGATIVOS</div>
                     <div class="metric-value">{negativos}</div>
-                    <div>📉 {negativos/len(resultados)*100:.1f}%</div>
+                    <div>📉 {agregado.percentual(negativos):.1f}%</div>
                 </div>
                 """, unsafe_allow_html=True)
             
             with col3:
-                neutros = sum(1 for r in resultados if "NEUTRO" in r['sentimento'])
+                neutros = agregado.neutros
                 st.markdown(f"""
                 <div class="metric-card">
                     <div class="metric-label">NEUTROS</div>
                     <div class="metric-value">{neutros}</div>
-                    <div>⚖️ {neutros/len(resultados)*100:.1f}%</div>
+                    <div>⚖️ {agregado.percentual(neutros):.1f}%</div>
                 </div>
                 """, unsafe_allow_html=True)
             
             with col4:
-                engajamento_medio = sum(r['engajamento'] for r in resultados) // len(resultados)
+                engajamento_medio = agregado.engajamento_medio()
                 st.markdown(f"""
                 <div class="metric-card">
                     <div class="metric-label">ENG AJAMENTO</div>
@@ -466,21 +592,6 @@ def main():
                 st.markdown('<div class="glass-card">', unsafe_allow_html=True)
                 st.subheader("📊 Distribuição de Sentimentos")
                 
-                df = pd.DataFrame({
-                    'Categoria': ['Muito Positivo', 'Positivo', 'Neutro', 'Negativo', 'Muito Negativo'],
-                    'Valores': [
-                        sum(1 for r in resultados if "MUITO POSITIVO" in r['sentimento']),
-                        sum(1 for r in resultados if r['sentimento'] == "✅ POSITIVO"),
-                        sum(1 for r in resultados if r['sentimento'] == "⚖️ NEUTRO"),
-                        sum(1 for r in resultados if r['sentimento'] == "❌ NEGATIVO"),
-                        sum(1 for r in resultados if "MUITO NEGATIVO" in r['sentimento'])
-                    ]
-                })
-                
-                fig = px.bar(df, x='Categoria', y='Valores', 
-                           color='Categoria',
-                           color_discrete_sequence=['#00b894', '#00cec9', '#fdcb6e', '#e17055', '#d63031'])
-                fig.update_layout(showlegend=False)
                 st.plotly_chart(fig, use_container_width=True)
                 st.markdown('</div>', unsafe_allow_html=True)
             
@@ -488,16 +599,6 @@ def main():
                 st.markdown('<div class="glass-card">', unsafe_allow_html=True)
                 st.subheader("🎯 Análise de Engajamento")
                 
-                # Gráfico de dispersão
-                df_scatter = pd.DataFrame({
-                    'Sentimento': [r['score'] for r in resultados],
-                    'Engajamento': [r['engajamento'] for r in resultados],
-                    'Categoria': [r['sentimento'] for r in resultados]
-                })
-                
-                fig_scatter = px.scatter(df_scatter, x='Sentimento', y='Engajamento',
-                                       color='Categoria', size='Engajamento',
-                                       color_discrete_sequence=['#00b894', '#00cec9', '#fdcb6e', '#e17055', '#d63031'])
                 st.plotly_chart(fig_scatter, use_container_width=True)
                 st.markdown('</div>', unsafe_allow_html=True)
             
@@ -506,26 +607,8 @@ def main():
             st.markdown('<div class="glass-card">', unsafe_allow_html=True)
             st.subheader(f"🔍 Análise Detalhada: {topico}")
 
-            for resultado in resultados:
-                st.markdown(f"""
-                <div class="tweet-card" style="border-left-color: {resultado['cor']}">
-                    <div style="display: flex; justify-content: space-between; align-items: start;">
-                        <div style="flex: 1;">
-                            <p style="margin: 0; font-size: 1rem; line-height: 1.5;">{resultado['texto']}</p>
-                            <div style="margin-top: 10px; display: flex; gap: 15px; align-items: center;">
-                                <small>👤 @{resultado['usuario']}</small>
-                                <small>🔥 {resultado['engajamento']} engajamento</small>
-                                <small>📊 Score: {resultado['score']:.2f}</small>
-                            </div>
-                        </div>
-                        <div style="text-align: right;">
-                            <div class="sentiment-badge" style="background-color: {resultado['cor']}20; color: {resultado['cor']}; border: 1px solid {resultado['cor']}40;">
-                                <strong>{resultado['emoji']} {resultado['sentimento']}</strong>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+            # Só a página visível vai para o navegador, em um bloco HTML
+            mostrar_resultados(resultados, analyzer.ROTULOS, cartao_tweet, chave="analise")
             
             st.markdown('</div>', unsafe_allow_html=True)
             st.markdown('</div>', unsafe_allow_html=True)  # Fecha fade-in
@@ -562,10 +645,12 @@ def main():
             - **Insights** automáticos
             """)
             
-            st.success("""
-            **✅ Precisão:** 94.7% em análises de 
-            sentimentos em português brasileiro.
-            """)
+            acuracia = acuracia_medida(analyzer.nome_backend)
+            if acuracia is None:
+                st.info("**📏 Acurácia:** rode `python benchmark_backends.py` para medir.")
+            else:
+                st.success(f"**✅ Acurácia:** {acuracia * 100:.1f}% no conjunto rotulado "
+                           f"em português (benchmark_backends.py).")
         
         st.markdown('</div>', unsafe_allow_html=True)
         
@@ -612,4 +697,5 @@ if __name__ == "__main__":
     if 'analisar' not in st.session_state:
         st.session_state.analisar = False
     
-    main()
+    with medir_execucao():
+        main()
@@ -2,12 +2,17 @@
 # -*- coding: utf-8 -*-
 
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime
 import random
+import numpy as np
+
+import backends
+from agregador import CATEGORIAS
+from cache import cache_nomeado
+from lexico import MUITO_POSITIVO, POSITIVO, NEUTRO, NEGATIVO, MUITO_NEGATIVO
+from paginacao import escapar, mostrar_resultados
+from recursos_streamlit import dados, medir_execucao, mostrar_estatisticas, recurso
+from resultados import ResultadosTweets
 
 # Configurar a página
 st.set_page_config(
@@ -38,8 +43,20 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Opção do seletor que deixa o registro escolher o backend mais rápido
+AUTOMATICO = "⚡ automático"
+
 class AnalisadorWeb:
-    def __init__(self):
+    # Rótulo e cor de cada classe de sentimento
+    ROTULOS = {
+        MUITO_POSITIVO: ("😍 MUITO POSITIVO", "#2ecc71"),
+        POSITIVO: ("😊 POSITIVO", "#27ae60"),
+        NEUTRO: ("😐 NEUTRO", "#f39c12"),
+        NEGATIVO: ("😠 NEGATIVO", "#e74c3c"),
+        MUITO_NEGATIVO: ("🤬 MUITO NEGATIVO", "#c0392b"),
+    }
+
+    def __init__(self, backend=None):
         self.topicos_populares = {
             "Tecnologia": [
                 "ChatGPT está revolucionando tudo! Incrível! 🤖",
@@ -105,32 +122,24 @@ class AnalisadorWeb:
             'furada': 2, 'assustadora': 2, 'travando': 1, 'superestimado': 1,
             'nojo': 3, 'vergonha': 2, 'frustrado': 1, 'incompetente': 2
         }
-
-    def analisar_sentimento(self, texto):
-        texto = texto.lower()
-        score = 0
-        palavras_detectadas = []
-        
-        for palavra in texto.split():
-            if palavra in self.palavras_positivas:
-                score += self.palavras_positivas[palavra]
-                palavras_detectadas.append(f"➕{palavra}")
-            elif palavra in self.palavras_negativas:
-                score += self.palavras_negativas[palavra]
-                palavras_detectadas.append(f"➖{palavra}")
         
-        if score >= 3:
-            return "😍 MUITO POSITIVO", score, palavras_detectadas, "#2ecc71"
-        elif score >= 1:
-            return "😊 POSITIVO", score, palavras_detectadas, "#27ae60"
-        elif score <= -3:
-            return "🤬 MUITO NEGATIVO", score, palavras_detectadas, "#c0392b"
-        elif score <= -1:
-            return "😠 NEGATIVO", score, palavras_detectadas, "#e74c3c"
+        # Backend de sentimento: argumento, ANALISADOR_BACKEND ou o léxico deste app
+        self.nome_backend = backend or backends.BACKEND_CONFIGURADO or "lexico"
+        if self.nome_backend == "lexico":
+            self.backend = backends.criar(
+                "lexico", positivas=self.palavras_positivas, negativas=self.palavras_negativas,
+                cache=cache_nomeado("app_sentimentos.AnalisadorWeb")
+            )
+            self.lexico = self.backend.lexico
         else:
-            return "😐 NEUTRO", score, palavras_detectadas, "#f39c12"
+            self.backend = backends.obter(self.nome_backend)
 
-    def buscar_tweets_simulados(self, topico, quantidade=10):
+    def analisar_sentimento(self, texto):
+        """(código, score, palavras-chave); rótulo e cor saem de ROTULOS"""
+        return self.backend.analisar(texto)
+
+    def pontuar_corpus(self, topico):
+        """Todos os tweets do tópico (ou de todos, se não for um tópico conhecido) e o lote pontuado"""
         if topico in self.topicos_populares:
             base = self.topicos_populares[topico]
         else:
@@ -138,29 +147,89 @@ class AnalisadorWeb:
             base = []
             for tweets in self.topicos_populares.values():
                 base.extend(tweets)
+        return base, self.backend.analisar_lote(base, com_palavras=self.backend.capacidades.palavras)
+
+    def buscar_tweets_simulados(self, topico, quantidade=10, corpus=None):
+        """Amostra do corpus pontuado (corpus: o de pontuar_corpus, ex.: vindo do cache)"""
+        base, lote = corpus or self.pontuar_corpus(topico)
+        indices = random.sample(range(len(base)), min(quantidade, len(base)))
         
-        tweets = random.sample(base, min(quantidade, len(base)))
-        
-        tweets_com_dados = []
-        for texto in tweets:
-            sentimento, score, palavras, cor = self.analisar_sentimento(texto)
-            tweets_com_dados.append({
-                'texto': texto,
-                'sentimento': sentimento,
-                'score': score,
-                'palavras_chave': palavras[:3],
-                'cor': cor,
-                'usuario': f'user_{random.randint(1000, 9999)}',
-                'likes': random.randint(0, 500),
-                'retweets': random.randint(0, 100),
-                'data': datetime.now().strftime("%d/%m %H:%M")
-            })
-        
-        return tweets_com_dados
+        # Lote em colunas: scores e códigos do backend entram sem cópia; rótulo
+        # e cor saem de ROTULOS só na hora de exibir
+        n = len(indices)
+        rng = np.random.default_rng()
+        return ResultadosTweets.de_colunas(
+            [base[i] for i in indices], np.asarray(lote.rotulos)[indices], np.asarray(lote.scores)[indices],
+            palavras=[lote.palavras[i][:3] for i in indices] if lote.palavras is not None else None,
+            usuarios=rng.integers(1000, 10000, n),
+            likes=rng.integers(0, 501, n),
+            retweets=rng.integers(0, 101, n),
+            instantes=np.full(n, datetime.now().timestamp())
+        )
+
+# Corpus pontuado de cada tópico vale por 10 minutos
+TTL_CORPUS = 600
+
+@recurso
+def obter_analisador(backend=None):
+    """AnalisadorWeb criado uma vez por processo e backend"""
+    return AnalisadorWeb(backend)
+
+@dados(ttl=TTL_CORPUS)
+def corpus_pontuado(topico, backend):
+    """Corpus do tópico já pontuado; cada análise só sorteia a amostra"""
+    return obter_analisador(backend).pontuar_corpus(topico)
+
+@dados(ttl=TTL_CORPUS)
+def graficos_distribuicao(detalhado, positivos, negativos, neutros):
+    """Pizza e barras (dicts do plotly) por contagens; pandas e plotly só carregam aqui"""
+    import pandas as pd
+    import plotly.express as px
+    import plotly.graph_objects as go
+    
+    # DataFrame para gráfico
+    df = pd.DataFrame({
+        'Sentimento': ['Positivos', 'Negativos', 'Neutros'],
+        'Quantidade': [positivos, negativos, neutros],
+        'Cor': ['#2ecc71', '#e74c3c', '#f39c12']
+    })
+    
+    fig_pizza = px.pie(df, values='Quantidade', names='Sentimento', 
+                       color='Sentimento', color_discrete_map={
+                           'Positivos': '#2ecc71',
+                           'Negativos': '#e74c3c', 
+                           'Neutros': '#f39c12'
+                       })
+    fig_pizza.update_traces(textposition='inside', textinfo='percent+label')
+    
+    # Gráfico de barras
+    fig_barras = go.Figure(data=[
+        go.Bar(x=CATEGORIAS, y=list(detalhado), 
+               marker_color=['#27ae60', '#2ecc71', '#f39c12', '#e67e22', '#c0392b'])
+    ])
+    fig_barras.update_layout(xaxis_title="Categorias", yaxis_title="Quantidade")
+    return fig_pizza.to_dict(), fig_barras.to_dict()
+
+def cartao_tweet(tweet, numero):
+    """HTML do cartão de um tweet analisado: texto à esquerda, classe à direita"""
+    sentimento, cor = AnalisadorWeb.ROTULOS[tweet.codigo]
+    return f"""
+    <div style="display: flex; gap: 16px; padding: 10px 0; border-bottom: 1px solid #eee;">
+        <div style="flex: 3;">
+            <strong>{numero}. {escapar(tweet.texto)}</strong>
+            {f'<br><small style="color: #888;">🔍 Palavras-chave: {", ".join(tweet.palavras)}</small>' if tweet.palavras else ''}
+        </div>
+        <div style="flex: 1; background-color: {cor}20; padding: 10px; border-radius: 5px; border-left: 4px solid {cor}">
+            <strong>{sentimento}</strong><br>
+            Score: {tweet.score:.3g}<br>
+            ❤️ {tweet.likes} | 🔄 {tweet.retweets}
+        </div>
+    </div>
+    """
 
 def main():
-    # Inicializar analisador
-    analisador = AnalisadorWeb()
+    # Analisador compartilhado entre reruns e sessões
+    analisador = obter_analisador()
     
     # Header principal
     st.markdown('<h1 class="main-header">🤖 ANALISADOR DE SENTIMENTOS</h1>', unsafe_allow_html=True)
@@ -181,15 +250,34 @@ def main():
         
         quantidade = st.slider("Número de tweets:", 5, 20, 10)
         
+        opcoes_backend = [AUTOMATICO] + backends.disponiveis()
+        backend = st.selectbox("Motor de análise:", opcoes_backend,
+                               index=opcoes_backend.index(analisador.nome_backend))
+        if backend == AUTOMATICO:
+            # O mais rápido entre os seguros para várias sessões (threads do Streamlit)
+            backend = backends.mais_rapido(quantidade, thread_safe=True,
+                                           acuracia_minima=backends.ACURACIA_MINIMA_APPS)
+            st.caption(f"⚡ usando {backend}")
+        if backend != analisador.nome_backend:
+            analisador = obter_analisador(backend)
+        
         analisar_btn = st.button("🎯 Analisar Sentimentos", type="primary")
+        
+        mostrar_estatisticas()
     
     # Layout principal
     col1, col2 = st.columns([2, 1])
     
     if analisar_btn:
+        # Tópico personalizado usa o corpus de todos os tópicos
+        corpus = corpus_pontuado(topico if topico in analisador.topicos_populares else None,
+                                 analisador.nome_backend)
+        # Amostra guardada na sessão: filtros e páginas rodam o script de novo
+        st.session_state.analise = (topico, analisador.buscar_tweets_simulados(topico, quantidade, corpus))
+    
+    if st.session_state.get('analise'):
+        topico, tweets = st.session_state.analise
         with st.spinner("🔍 Analisando tweets..."):
-            tweets = analisador.buscar_tweets_simulados(topico, quantidade)
-            
             if not tweets:
                 st.error("❌ Nenhum tweet encontrado para análise.")
                 return
@@ -199,9 +287,11 @@ def main():
             
             col1, col2, col3, col4 = st.columns(4)
             
-            total_positivo = sum(1 for t in tweets if "POSITIVO" in t['sentimento'])
-            total_negativo = sum(1 for t in tweets if "NEGATIVO" in t['sentimento'])
-            total_neutro = sum(1 for t in tweets if "NEUTRO" in t['sentimento'])
+            # Uma única passada conta todas as categorias
+            agregado = tweets.agregado()
+            total_positivo = agregado.positivos
+            total_negativo = agregado.negativos
+            total_neutro = agregado.neutros
             
             with col1:
                 st.metric("😊 Positivos", total_positivo)
@@ -210,75 +300,32 @@ def main():
             with col3:
                 st.metric("😐 Neutros", total_neutro)
             with col4:
-                sentimento_geral = "😊 Positivo" if total_positivo > total_negativo else "😠 Negativo" if total_negativo > total_positivo else "😐 Neutro"
+                sentimento_geral = {POSITIVO: "😊 Positivo", NEGATIVO: "😠 Negativo"}.get(
+                    agregado.sentimento_geral(), "😐 Neutro")
                 st.metric("🎭 Sentimento Geral", sentimento_geral)
             
-            # Gráfico de pizza
+            # Gráficos em cache pelas contagens: iguais em todo rerun
+            fig_pizza, fig_barras = graficos_distribuicao(tuple(agregado.detalhado()), total_positivo,
+                                                          total_negativo, total_neutro)
             st.markdown("---")
             col1, col2 = st.columns(2)
             
             with col1:
                 st.subheader("📈 Distribuição de Sentimentos")
                 
-                # DataFrame para gráfico
-                df = pd.DataFrame({
-                    'Sentimento': ['Positivos', 'Negativos', 'Neutros'],
-                    'Quantidade': [total_positivo, total_negativo, total_neutro],
-                    'Cor': ['#2ecc71', '#e74c3c', '#f39c12']
-                })
-                
-                fig = px.pie(df, values='Quantidade', names='Sentimento', 
-                            color='Sentimento', color_discrete_map={
-                                'Positivos': '#2ecc71',
-                                'Negativos': '#e74c3c', 
-                                'Neutros': '#f39c12'
-                            })
-                fig.update_traces(textposition='inside', textinfo='percent+label')
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(fig_pizza, use_container_width=True)
             
             with col2:
                 st.subheader("📊 Análise Detalhada")
                 
-                # Gráfico de barras
-                categorias = ['Muito Positivo', 'Positivo', 'Neutro', 'Negativo', 'Muito Negativo']
-                valores = [
-                    sum(1 for t in tweets if "MUITO POSITIVO" in t['sentimento']),
-                    sum(1 for t in tweets if t['sentimento'] == "😊 POSITIVO"),
-                    sum(1 for t in tweets if t['sentimento'] == "😐 NEUTRO"),
-                    sum(1 for t in tweets if t['sentimento'] == "😠 NEGATIVO"),
-                    sum(1 for t in tweets if "MUITO NEGATIVO" in t['sentimento'])
-                ]
-                
-                fig = go.Figure(data=[
-                    go.Bar(x=categorias, y=valores, 
-                          marker_color=['#27ae60', '#2ecc71', '#f39c12', '#e67e22', '#c0392b'])
-                ])
-                fig.update_layout(xaxis_title="Categorias", yaxis_title="Quantidade")
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(fig_barras, use_container_width=True)
             
             # Tweets individuais
             st.markdown("---")
             st.subheader("🐦 Tweets Analisados")
             
-            for i, tweet in enumerate(tweets, 1):
-                with st.container():
-                    col1, col2 = st.columns([3, 1])
-                    
-                    with col1:
-                        st.write(f"**{i}. {tweet['texto']}**")
-                        if tweet['palavras_chave']:
-                            st.caption(f"🔍 Palavras-chave: {', '.join(tweet['palavras_chave'])}")
-                    
-                    with col2:
-                        st.markdown(f"""
-                        <div style='background-color: {tweet['cor']}20; padding: 10px; border-radius: 5px; border-left: 4px solid {tweet['cor']}'>
-                            <strong>{tweet['sentimento']}</strong><br>
-                            Score: {tweet['score']}<br>
-                            ❤️ {tweet['likes']} | 🔄 {tweet['retweets']}
-                        </div>
-                        """, unsafe_allow_html=True)
-                
-                st.write("---")
+            # Só a página visível vai para o navegador, em um bloco HTML
+            mostrar_resultados(tweets, analisador.ROTULOS, cartao_tweet, chave="analise")
     
     else:
         # Tela inicial
@@ -314,4 +361,5 @@ def main():
             """)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    with medir_execucao():
+        main()
\ No newline at end of file
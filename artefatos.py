@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+💾 ARTEFATOS DE MODELO (TREINA UMA VEZ, CARREGA MUITAS)
+Grava um pipeline CountVectorizer + MultinomialNB já treinado numa pasta
+versionada (modelos/<nome>/<versao>/) e carrega de volta sem treinar.
+
+Os arrays grandes (vocabulário ordenado e feature_log_prob_) ficam em .npy
+e são abertos com mmap: vários processos (ex.: os workers de pontuar_lote)
+compartilham as mesmas páginas, somente leitura, pelo cache do sistema.
+Pipelines com HashingVectorizer (treino_streaming.py) não têm vocabulário:
+só os parâmetros do hash vão para o meta.json.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+import scipy.sparse as sp
+import sklearn
+from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer
+from sklearn.naive_bayes import MultinomialNB
+from sklearn.pipeline import Pipeline
+
+DIRETORIO_MODELOS = os.environ.get(
+    "ANALISADOR_MODELOS", os.path.join(os.path.dirname(os.path.abspath(__file__)), "modelos"))
+
+# Parâmetros do CountVectorizer que mudam a tokenização (vão para o meta.json)
+PARAMETROS_VETORIZADOR = ('lowercase', 'token_pattern', 'ngram_range', 'analyzer',
+                          'strip_accents', 'max_features', 'min_df', 'max_df', 'binary')
+PARAMETROS_HASHING = ('lowercase', 'token_pattern', 'ngram_range', 'analyzer', 'strip_accents',
+                      'n_features', 'alternate_sign', 'norm', 'binary')
+
+
+def versao_treino(textos, rotulos, parametros):
+    """Impressão digital dos dados e parâmetros: muda se qualquer um mudar"""
+    h = hashlib.sha1()
+    h.update(json.dumps([list(textos), list(rotulos), parametros], ensure_ascii=False,
+                        sort_keys=True, default=str).encode("utf-8"))
+    h.update(sklearn.__version__.encode("ascii"))
+    return h.hexdigest()[:12]
+
+
+class VetorizadorMapeado(CountVectorizer):
+    """CountVectorizer cujo vocabulário é um array ordenado (mmap) em vez de dict"""
+
+    def __init__(self, vocabulario_ordenado=None, indices=None, **parametros):
+        super().__init__(**parametros)
+        self.vocabulario_ordenado = vocabulario_ordenado
+        self.indices = indices
+
+    def get_params(self, deep=True):
+        return {nome: getattr(self, nome) for nome in PARAMETROS_VETORIZADOR}
+
+    def transform(self, raw_documents):
+        analisar = self.build_analyzer()
+        termos = []
+        indptr = [0]
+        for documento in raw_documents:
+            termos.extend(analisar(documento))
+            indptr.append(len(termos))
+
+        vocabulario = self.vocabulario_ordenado
+        colunas = np.empty(0, dtype=np.int32)
+        encontrados = np.zeros(len(termos), dtype=bool)
+        if termos:
+            # Busca binária no array ordenado para todos os termos do lote de uma vez
+            consulta = np.asarray(termos, dtype=vocabulario.dtype)
+            posicoes = np.searchsorted(vocabulario, consulta)
+            np.minimum(posicoes, len(vocabulario) - 1, out=posicoes)
+            # O dtype de largura fixa trunca os termos mais longos que a maior
+            # palavra do vocabulário: esses nunca estão nele
+            largura = vocabulario.dtype.itemsize // 4
+            cabem = np.fromiter(map(len, termos), dtype=np.int64, count=len(termos)) <= largura
+            encontrados = (vocabulario[posicoes] == consulta) & cabem
+            colunas = np.asarray(self.indices[posicoes[encontrados]], dtype=np.int32)
+
+        # Recalcula os ponteiros das linhas só com os termos do vocabulário
+        acumulado = np.concatenate(([0], np.cumsum(encontrados, dtype=np.int64)))
+        indptr = acumulado[np.asarray(indptr)]
+        matriz = sp.csr_matrix((np.ones(len(colunas), dtype=self.dtype), colunas, indptr),
+                               shape=(len(indptr) - 1, len(vocabulario)))
+        matriz.sum_duplicates()
+        return matriz
+
+    def get_feature_names_out(self, input_features=None):
+        nomes = np.empty(len(self.vocabulario_ordenado), dtype=object)
+        nomes[self.indices] = self.vocabulario_ordenado
+        return nomes
+
+
+def salvar_modelo(modelo, nome, versao, diretorio=DIRETORIO_MODELOS, atual=True, contagens=False, **extras):
+    """Grava o pipeline treinado em <diretorio>/<nome>/<versao>/ e marca como atual"""
+    vetorizador, classificador = modelo.steps[0][1], modelo.steps[-1][1]
+    destino = os.path.join(diretorio, nome, versao)
+    os.makedirs(destino, exist_ok=True)
+
+    if isinstance(vetorizador, HashingVectorizer):
+        tipo, parametros = 'hashing', PARAMETROS_HASHING
+    else:
+        tipo, parametros = 'vocabulario', PARAMETROS_VETORIZADOR
+        termos = sorted(vetorizador.vocabulary_)
+        np.save(os.path.join(destino, "vocabulario.npy"), np.array(termos, dtype=str))
+        np.save(os.path.join(destino, "indices.npy"),
+                np.array([vetorizador.vocabulary_[t] for t in termos], dtype=np.int32))
+    np.save(os.path.join(destino, "feature_log_prob.npy"), classificador.feature_log_prob_)
+    if contagens:
+        # Checkpoint: com as contagens dá para continuar o partial_fit
+        np.save(os.path.join(destino, "feature_count.npy"), classificador.feature_count_)
+        np.save(os.path.join(destino, "class_count.npy"), classificador.class_count_)
+
+    meta = {
+        'nome': nome,
+        'versao': versao,
+        'tipo': tipo,
+        'criado_em': datetime.now().isoformat(timespec='seconds'),
+        'sklearn': sklearn.__version__,
+        'vetorizador': {p: getattr(vetorizador, p) for p in parametros},
+        'classes': classificador.classes_.tolist(),
+        'class_log_prior': classificador.class_log_prior_.tolist(),
+        'alpha': classificador.alpha,
+        **extras
+    }
+    # meta.json por último e por troca atômica: um checkpoint interrompido
+    # no meio da gravação não deixa uma versão pela metade
+    caminho_meta = os.path.join(destino, "meta.json")
+    with open(caminho_meta + ".tmp", 'w', encoding='utf-8') as arquivo:
+        json.dump(meta, arquivo, ensure_ascii=False, indent=2)
+    os.replace(caminho_meta + ".tmp", caminho_meta)
+
+    if atual:
+        # Troca atômica do ponteiro para a versão atual
+        ponteiro = os.path.join(diretorio, nome, "ATUAL")
+        with open(ponteiro + ".tmp", 'w', encoding='ascii') as arquivo:
+            arquivo.write(versao)
+        os.replace(ponteiro + ".tmp", ponteiro)
+    return destino
+
+
+def ler_meta(nome, versao=None, diretorio=DIRETORIO_MODELOS):
+    """meta.json de uma versão (ou None se não existir)"""
+    versao = versao or versao_atual(nome, diretorio)
+    if not versao:
+        return None
+    try:
+        with open(os.path.join(diretorio, nome, versao, "meta.json"), encoding='utf-8') as arquivo:
+            return json.load(arquivo)
+    except FileNotFoundError:
+        return None
+
+
+def versao_atual(nome, diretorio=DIRETORIO_MODELOS):
+    """Versão marcada como atual (ou None se o modelo nunca foi treinado)"""
+    try:
+        with open(os.path.join(diretorio, nome, "ATUAL"), encoding='ascii') as arquivo:
+            return arquivo.read().strip()
+    except FileNotFoundError:
+        return None
+
+
+def carregar_modelo(nome, versao=None, diretorio=DIRETORIO_MODELOS, mmap=True, contagens=False):
+    """Pipeline pronto para predict/predict_proba, sem treinar; None se não houver artefato"""
+    meta = ler_meta(nome, versao, diretorio)
+    if meta is None:
+        return None
+    origem = os.path.join(diretorio, nome, meta['versao'])
+    modo = 'r' if mmap else None
+
+    parametros = dict(meta['vetorizador'])
+    parametros['ngram_range'] = tuple(parametros['ngram_range'])
+    if meta.get('tipo') == 'hashing':
+        passo, vetorizador = 'hashingvectorizer', HashingVectorizer(**parametros)
+    else:
+        passo, vetorizador = 'countvectorizer', VetorizadorMapeado(
+            np.load(os.path.join(origem, "vocabulario.npy"), mmap_mode=modo),
+            np.load(os.path.join(origem, "indices.npy"), mmap_mode=modo),
+            **parametros
+        )
+
+    classificador = MultinomialNB(alpha=meta['alpha'])
+    classificador.classes_ = np.array(meta['classes'])
+    classificador.class_log_prior_ = np.array(meta['class_log_prior'])
+    classificador.feature_log_prob_ = np.load(os.path.join(origem, "feature_log_prob.npy"), mmap_mode=modo)
+    classificador.n_features_in_ = classificador.feature_log_prob_.shape[1]
+    if contagens:
+        # Para continuar o partial_fit (arrays graváveis, fora do mmap)
+        classificador.feature_count_ = np.load(os.path.join(origem, "feature_count.npy"))
+        classificador.class_count_ = np.load(os.path.join(origem, "class_count.npy"))
+
+    # Mesmos nomes de etapa do make_pipeline original
+    modelo = Pipeline([(passo, vetorizador), ('multinomialnb', classificador)])
+    modelo.versao = meta['versao']
+    return modelo
+
+
+def carregar_ou_treinar(nome, versao, treinar, diretorio=DIRETORIO_MODELOS):
+    """Carrega a versão pedida; se não existir, treina uma vez e grava o artefato"""
+    modelo = carregar_modelo(nome, versao, diretorio)
+    if modelo is not None:
+        return modelo, False
+
+    modelo = treinar()
+    try:
+        salvar_modelo(modelo, nome, versao, diretorio)
+    except OSError:
+        pass    # diretório somente leitura: segue com o modelo em memória
+    modelo.versao = versao
+    return modelo, True
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🔌 REGISTRO DE BACKENDS DE SENTIMENTO
+Uma interface só, pensada para lote, para todos os pontuadores (léxico,
+Naive Bayes, TextBlob, cascata e os que vierem):
+
+    backend.analisar_lote(textos, com_palavras=False) → ResultadoLote
+    backend.analisar(texto) → (código, score, palavras)
+
+Códigos são os do lexico.py (-2..2) e o score tem sinal (> 0 positivo):
+pontos do léxico, polaridade do TextBlob ou 2·P(positivo) − 1 no Naive
+Bayes. Rótulo, cor e emoji ficam nos apps (ROTULOS de cada um).
+
+Cada backend declara suas capacidades (lote de verdade, thread safety,
+palavras-chave e custo esperado). Os apps escolhem pelo nome, vindo da
+configuração, ou pedem o mais rápido que atende à requisição. Criar um
+backend é barato: modelos e bibliotecas pesadas carregam na primeira análise.
+
+    ANALISADOR_BACKEND=nb_ptbr streamlit run app_sentimentos.py
+"""
+
+import contextlib
+import io
+import json
+import os
+import threading
+from array import array
+from collections import namedtuple
+from functools import cached_property
+
+from lexico import (MUITO_NEGATIVO, MUITO_POSITIVO, NEGATIVO, NEUTRO, POSITIVO, LexicoCompilado, ResultadoLote,
+                    classificar)
+
+# Backend padrão dos apps (cada app pode ter o seu)
+BACKEND_CONFIGURADO = os.environ.get("ANALISADOR_BACKEND")
+
+# Piso de acurácia medida quando os apps escolhem o backend sozinhos
+ACURACIA_MINIMA_APPS = 0.6
+
+# Medições reais (python benchmark_backends.py) têm prioridade sobre o custo declarado
+BENCHMARK_BACKENDS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_backends.json")
+
+Capacidades = namedtuple('Capacidades', [
+    'lote',           # um passo vetorizado para o lote todo (não um laço por texto)
+    'thread_safe',    # a mesma instância atende sessões em threads diferentes
+    'palavras',       # devolve palavras-chave com com_palavras=True
+    'custo_us',       # µs por texto num lote grande
+    'latencia_us',    # µs para um texto sozinho
+])
+
+
+class BackendSentimento:
+    nome = None
+    descricao = ""
+    capacidades = Capacidades(lote=False, thread_safe=False, palavras=False, custo_us=1000, latencia_us=1000)
+
+    def analisar_lote(self, textos, com_palavras=False):
+        """ResultadoLote com score e código de cada texto (palavras só se suportado e pedido)"""
+        raise NotImplementedError
+
+    def analisar(self, texto):
+        """(código, score, palavras) de um texto"""
+        lote = self.analisar_lote([texto], com_palavras=self.capacidades.palavras)
+        return lote.rotulos[0], lote.scores[0], lote.palavras[0] if lote.palavras is not None else []
+
+
+# ---------------------------------------------------------------- registro
+
+_registro = {}
+_instancias = {}
+_trava = threading.Lock()
+
+
+def registrar(classe):
+    """Decorador: torna o backend disponível pelo nome"""
+    _registro[classe.nome] = classe
+    return classe
+
+
+def disponiveis():
+    return list(_registro)
+
+
+def capacidades(nome):
+    return _classe(nome).capacidades
+
+
+def _classe(nome):
+    try:
+        return _registro[nome]
+    except KeyError:
+        raise ValueError(f"Backend desconhecido '{nome}' (disponíveis: {', '.join(_registro)})") from None
+
+
+def criar(nome, **opcoes):
+    """Nova instância do backend (ex.: léxico próprio, cache próprio)"""
+    return _classe(nome)(**opcoes)
+
+
+def obter(nome=None):
+    """Instância padrão compartilhada pelo processo (criada na primeira chamada)"""
+    nome = nome or BACKEND_CONFIGURADO or 'lexico'
+    with _trava:
+        if nome not in _instancias:
+            _instancias[nome] = criar(nome)
+        return _instancias[nome]
+
+
+def medicoes():
+    """Métricas por backend do último benchmark_backends.py ({} se nunca foi rodado)"""
+    try:
+        with open(BENCHMARK_BACKENDS, encoding='utf-8') as arquivo:
+            return json.load(arquivo)['backends']
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def custo_estimado(nome, quantidade=1, medidas=None):
+    """µs estimados para pontuar `quantidade` textos numa chamada"""
+    medida = (medicoes() if medidas is None else medidas).get(nome)
+    if medida:
+        latencia, custo = medida['latencia_p50_us'], 1e6 / medida['tweets_por_s']
+    else:
+        latencia, custo = capacidades(nome).latencia_us, capacidades(nome).custo_us
+    return latencia if quantidade <= 1 else custo * quantidade
+
+
+def mais_rapido(quantidade=1, thread_safe=False, palavras=False, acuracia_minima=None, candidatos=None):
+    """Nome do backend mais barato para a requisição entre os que atendem aos requisitos"""
+    medidas = medicoes()
+    aptos = []
+    for nome in candidatos or _registro:
+        recursos = capacidades(nome)
+        if (thread_safe and not recursos.thread_safe) or (palavras and not recursos.palavras):
+            continue
+        # Sem medição a acurácia é desconhecida: não exclui
+        acuracia = medidas.get(nome, {}).get('acuracia')
+        if acuracia_minima is not None and acuracia is not None and acuracia < acuracia_minima:
+            continue
+        aptos.append(nome)
+    if not aptos:
+        raise ValueError("Nenhum backend atende aos requisitos")
+    return min(aptos, key=lambda nome: custo_estimado(nome, quantidade, medidas))
+
+
+# ---------------------------------------------------------------- backends
+
+@registrar
+class BackendLexico(BackendSentimento):
+    nome = 'lexico'
+    descricao = "Léxico ponderado (padrão: dicionário do AnalisadorPortugues)"
+    capacidades = Capacidades(lote=True, thread_safe=True, palavras=True, custo_us=2, latencia_us=3)
+
+    def __init__(self, positivas=None, negativas=None, cache=None, lexico=None):
+        if lexico is None:
+            if positivas is None:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    from twitter_pronto import AnalisadorPortugues
+                analisador = AnalisadorPortugues()
+                positivas, negativas = analisador.positivas, analisador.negativas
+            lexico = LexicoCompilado(positivas, negativas, cache=cache)
+        self.lexico = lexico
+
+    def analisar_lote(self, textos, com_palavras=False):
+        return self.lexico.analisar_lote(textos, com_palavras=com_palavras)
+
+    def analisar(self, texto):
+        score, palavras = self.lexico.analisar(texto)
+        return classificar(score), score, palavras
+
+
+def analisar_textblob(texto):
+    """Polaridade do TextBlob sem cache: (código, polaridade)"""
+    from textblob import TextBlob
+    try:
+        polaridade = TextBlob(texto).sentiment.polarity
+    except Exception:
+        return NEUTRO, 0
+
+    if polaridade > 0.2:
+        codigo = MUITO_POSITIVO
+    elif polaridade > 0.05:
+        codigo = POSITIVO
+    elif polaridade < -0.2:
+        codigo = MUITO_NEGATIVO
+    elif polaridade < -0.05:
+        codigo = NEGATIVO
+    else:
+        codigo = NEUTRO
+    return codigo, polaridade
+
+
+@registrar
+class BackendTextBlob(BackendSentimento):
+    nome = 'textblob'
+    descricao = "Polaridade do TextBlob (um texto por vez)"
+    capacidades = Capacidades(lote=False, thread_safe=True, palavras=False, custo_us=200, latencia_us=200)
+
+    def __init__(self, cache=None):
+        self.cache = cache
+        if cache is not None:
+            from importlib.metadata import version
+            self.versao = f"textblob-{version('textblob')}"    # invalida se o TextBlob mudar
+
+    def analisar_lote(self, textos, com_palavras=False):
+        scores, rotulos = array('d'), array('b')
+        for texto in textos:
+            codigo, polaridade = self._analisar(texto)
+            scores.append(polaridade)
+            rotulos.append(codigo)
+        return ResultadoLote(scores, rotulos)
+
+    def analisar(self, texto):
+        codigo, polaridade = self._analisar(texto)
+        return codigo, polaridade, []
+
+    def _analisar(self, texto):
+        if self.cache is None:
+            return analisar_textblob(texto)
+        return self.cache.obter(texto, analisar_textblob, versao=self.versao)
+
+
+def _codigo_nb(positiva, confianca, confianca_minima):
+    """Código e score com sinal de P(positivo); sem evidência (prior de 50%) vira NEUTRO"""
+    score = float(2 * positiva - 1)
+    if confianca <= confianca_minima:
+        return NEUTRO, score
+    return (POSITIVO if positiva > 0.5 else NEGATIVO), score
+
+
+@registrar
+class BackendNBPTBR(BackendSentimento):
+    nome = 'nb_ptbr'
+    descricao = "Naive Bayes do analisador_ptbr (gírias e expressões brasileiras)"
+    capacidades = Capacidades(lote=True, thread_safe=True, palavras=True, custo_us=35, latencia_us=35)
+
+    def __init__(self):
+        from cascata import CONFIANCA_MINIMA
+        self.confianca_minima = CONFIANCA_MINIMA
+
+    @cached_property
+    def _analisador(self):
+        """Módulo analisador_ptbr, importado (com o sklearn) só na primeira análise"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            import analisador_ptbr
+        return analisador_ptbr
+
+    def _codigo(self, sentimento, confianca):
+        positiva = confianca / 100 if sentimento == "😊 POSITIVO" else 1 - confianca / 100
+        return _codigo_nb(positiva, confianca, self.confianca_minima)
+
+    def analisar_lote(self, textos, com_palavras=False):
+        scores, rotulos = array('d'), array('b')
+        palavras = [] if com_palavras else None
+        if not textos:
+            return ResultadoLote(scores, rotulos, palavras)
+        for sentimento, confianca, detectadas in self._analisador.analisar_lote_ptbr(textos):
+            codigo, score = self._codigo(sentimento, confianca)
+            scores.append(score)
+            rotulos.append(codigo)
+            if com_palavras:
+                palavras.append(detectadas)
+        return ResultadoLote(scores, rotulos, palavras)
+
+    def analisar(self, texto):
+        # Frase única: caminho rápido sem sklearn do analisador_ptbr
+        sentimento, confianca, detectadas = self._analisador.analisar_detalhado_ptbr(texto)
+        codigo, score = self._codigo(sentimento, confianca)
+        return codigo, score, detectadas
+
+
+@registrar
+class BackendNBML(BackendSentimento):
+    nome = 'nb_ml'
+    descricao = "Naive Bayes do ml_sentimentos (sem pré-processamento)"
+    capacidades = Capacidades(lote=True, thread_safe=True, palavras=False, custo_us=7, latencia_us=500)
+
+    def __init__(self):
+        from cascata import CONFIANCA_MINIMA
+        self.confianca_minima = CONFIANCA_MINIMA
+
+    @cached_property
+    def modelo(self):
+        """Pipeline do ml_sentimentos, carregado só na primeira análise"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            from ml_sentimentos import modelo
+        return modelo
+
+    def analisar_lote(self, textos, com_palavras=False):
+        textos = list(textos)
+        if not textos:
+            return ResultadoLote(array('d'), array('b'))
+        coluna = list(self.modelo.classes_).index(1)
+        probabilidades = self.modelo.predict_proba(textos)[:, coluna]
+        scores, rotulos = array('d'), array('b')
+        for positiva in probabilidades.tolist():
+            codigo, score = _codigo_nb(positiva, max(positiva, 1 - positiva) * 100, self.confianca_minima)
+            scores.append(score)
+            rotulos.append(codigo)
+        return ResultadoLote(scores, rotulos)
+
+
+@registrar
+class BackendCascata(BackendSentimento):
+    nome = 'cascata'
+    descricao = "Léxico nos textos claros, modelo_ptbr só nos ambíguos"
+    # Os contadores por camada não são protegidos por trava
+    capacidades = Capacidades(lote=True, thread_safe=False, palavras=False, custo_us=10, latencia_us=30)
+
+    def __init__(self, pesado='ptbr', limiar=3, tamanho_lote=1000):
+        self.opcoes = dict(pesado=pesado, limiar=limiar, tamanho_lote=tamanho_lote)
+
+    @cached_property
+    def cascata(self):
+        """PontuadorCascata montado (léxico + modelo pesado) só na primeira análise"""
+        from cascata import PontuadorCascata
+        return PontuadorCascata(**self.opcoes)
+
+    def analisar_lote(self, textos, com_palavras=False):
+        return self.cascata.pontuar(textos)
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+⚖️ BENCHMARK ENTRE BACKENDS: ACURÁCIA x VAZÃO
+Roda todos os backends de pontuação sobre o mesmo conjunto rotulado
+(avaliacao_ptbr.jsonl, ou outro JSONL/CSV com texto e rótulo) e mede:
+
+- acurácia e F1 macro (positivo/negativo; NEUTRO conta como erro)
+- vazão em lote (tweets/s) e latência de um texto por chamada (p50/p99)
+- pico de memória alocada durante o lote (tracemalloc)
+
+O resultado vai para um JSON (benchmark_backends.json), que o registro
+(backends.mais_rapido) usa para escolher o backend de cada requisição, e,
+com --base, é comparado com uma execução anterior: o processo sai com
+código 1 se acurácia ou F1 caírem.
+
+Uso:
+    python benchmark_backends.py
+    python benchmark_backends.py --dados corpus.csv --campo-rotulo label
+    python benchmark_backends.py --base benchmark_backends_anterior.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import sklearn
+from sklearn.metrics import accuracy_score, f1_score
+
+import backends
+import pipeline
+from benchmark_ptbr import percentil
+from treino_streaming import converter_rotulo
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+DADOS_PADRAO = os.path.join(DIRETORIO, "avaliacao_ptbr.jsonl")
+SAIDA_PADRAO = backends.BENCHMARK_BACKENDS
+
+# Predições: 1 positivo, 0 negativo, -1 neutro (nunca acerta, sempre conta como erro)
+NEUTRO = -1
+
+# Quedas que contam como regressão no --base
+TOLERANCIA_QUALIDADE = 0.005
+TOLERANCIA_VAZAO = 0.20
+
+
+def polaridade(codigo):
+    """Código de classe do léxico (-2..2) → 1, 0 ou NEUTRO"""
+    return 1 if codigo > 0 else 0 if codigo < 0 else NEUTRO
+
+
+# ---------------------------------------------------------------- backends
+# Todos os do registro (backends.py); cada um vira (lote, unitario):
+# lote(textos) → predições, unitario(texto) → predição
+
+BACKENDS = backends.disponiveis()
+
+
+def preparar(nome):
+    """Instância nova do backend (sem cache, para medir o custo real)"""
+    backend = backends.criar(nome)
+    return (lambda textos: [polaridade(codigo) for codigo in backend.analisar_lote(textos).rotulos],
+            lambda texto: polaridade(backend.analisar(texto)[0]))
+
+
+# ---------------------------------------------------------------- medições
+
+def carregar_avaliacao(caminho, campo_texto=None, campo_rotulo='rotulo'):
+    """Textos e rótulos (0/1) do conjunto de avaliação; ignora linhas sem rótulo"""
+    textos, rotulos = [], []
+    for registro in pipeline.de_arquivo(caminho, campo_texto):
+        rotulo = converter_rotulo(registro.get(campo_rotulo))
+        if rotulo is not None:
+            textos.append(registro['texto'])
+            rotulos.append(rotulo)
+    if not textos:
+        raise ValueError(f"Nenhum exemplo rotulado em '{caminho}' (campo '{campo_rotulo}')")
+    return textos, rotulos
+
+
+def medir_backend(nome, textos, rotulos, repeticoes):
+    with contextlib.redirect_stdout(io.StringIO()):
+        lote, unitario = preparar(nome)
+
+    predicoes = np.asarray(lote(textos))
+    resultado = {
+        'acuracia': accuracy_score(rotulos, predicoes),
+        'f1_macro': f1_score(rotulos, predicoes, labels=[0, 1], average='macro', zero_division=0),
+        'neutros': float(np.mean(predicoes == NEUTRO)),
+    }
+
+    # Vazão: o conjunto repetido num lote só
+    volume = textos * repeticoes
+    inicio = time.perf_counter()
+    lote(volume)
+    resultado['tweets_por_s'] = len(volume) / (time.perf_counter() - inicio)
+
+    # Latência: um texto por chamada
+    tempos = []
+    for texto in volume[:max(len(textos), 1000)]:
+        inicio = time.perf_counter()
+        unitario(texto)
+        tempos.append((time.perf_counter() - inicio) * 1e6)
+    resultado['latencia_p50_us'] = percentil(tempos, 0.50)
+    resultado['latencia_p99_us'] = percentil(tempos, 0.99)
+
+    # Memória à parte: o tracemalloc deixa tudo mais lento
+    tracemalloc.start()
+    lote(volume)
+    resultado['pico_memoria_mb'] = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return resultado
+
+
+def comparar(base, atual):
+    """Imprime as diferenças para a execução anterior; True se houver regressão"""
+    regressao = False
+    print(f"\n🔁 COMPARAÇÃO COM {base['gerado_em']}")
+    print("-" * 60)
+    for nome, metricas in atual['backends'].items():
+        anterior = base['backends'].get(nome)
+        if anterior is None:
+            print(f"   {nome:<10} | novo")
+            continue
+        avisos = []
+        for metrica in ('acuracia', 'f1_macro'):
+            if metricas[metrica] < anterior[metrica] - TOLERANCIA_QUALIDADE:
+                avisos.append(f"{metrica} {anterior[metrica]:.3f} → {metricas[metrica]:.3f}")
+                regressao = True
+        if metricas['tweets_por_s'] < anterior['tweets_por_s'] * (1 - TOLERANCIA_VAZAO):
+            # Vazão depende da máquina: só avisa
+            avisos.append(f"vazão {anterior['tweets_por_s']:,.0f} → {metricas['tweets_por_s']:,.0f}/s")
+        print(f"   {nome:<10} | " + ("⚠️  " + "; ".join(avisos) if avisos else "✅ sem regressão"))
+    return regressao
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Acurácia x vazão de todos os backends de sentimento")
+    parser.add_argument("--dados", default=DADOS_PADRAO, help="JSONL/CSV com texto e rótulo")
+    parser.add_argument("--campo-texto", help="coluna com o texto (padrão: texto/full_text/text)")
+    parser.add_argument("--campo-rotulo", default="rotulo", help="coluna com o rótulo (0/1 ou positivo/negativo)")
+    parser.add_argument("--backends", nargs="*", default=list(BACKENDS), help="subconjunto a medir")
+    parser.add_argument("--repeticoes", type=int, default=50, help="vezes que o conjunto se repete no lote de vazão")
+    parser.add_argument("--saida", default=SAIDA_PADRAO, help="arquivo JSON com os resultados")
+    parser.add_argument("--base", help="JSON de uma execução anterior para comparar")
+    args = parser.parse_args(argumentos)
+    desconhecidos = set(args.backends) - set(BACKENDS)
+    if desconhecidos:
+        parser.error(f"backends desconhecidos: {', '.join(sorted(desconhecidos))} "
+                     f"(disponíveis: {', '.join(BACKENDS)})")
+
+    textos, rotulos = carregar_avaliacao(args.dados, args.campo_texto, args.campo_rotulo)
+    print("⚖️ BENCHMARK - BACKENDS DE SENTIMENTO")
+    print("=" * 60)
+    print(f"📚 {os.path.basename(args.dados)}: {len(textos)} exemplos "
+          f"({sum(rotulos)} positivos, {len(rotulos) - sum(rotulos)} negativos)")
+
+    resultados = {}
+    print(f"\n   {'backend':<10} | {'acurácia':>8} | {'F1 macro':>8} | {'neutros':>7} | "
+          f"{'tweets/s':>9} | {'p50 µs':>7} | {'p99 µs':>7} | {'pico MB':>7}")
+    for nome in args.backends:
+        r = resultados[nome] = medir_backend(nome, textos, rotulos, args.repeticoes)
+        print(f"   {nome:<10} | {r['acuracia']:>8.1%} | {r['f1_macro']:>8.3f} | {r['neutros']:>7.1%} | "
+              f"{r['tweets_por_s']:>9,.0f} | {r['latencia_p50_us']:>7.1f} | {r['latencia_p99_us']:>7.1f} | "
+              f"{r['pico_memoria_mb']:>7.2f}")
+
+    relatorio = {
+        'gerado_em': datetime.now().isoformat(timespec='seconds'),
+        'dados': os.path.basename(args.dados),
+        'exemplos': len(textos),
+        'repeticoes': args.repeticoes,
+        'python': platform.python_version(),
+        'sklearn': sklearn.__version__,
+        'maquina': platform.machine(),
+        'backends': resultados,
+    }
+    with open(args.saida, 'w', encoding='utf-8') as arquivo:
+        json.dump(relatorio, arquivo, ensure_ascii=False, indent=2)
+    print(f"\n💾 Resultados em {args.saida}")
+
+    if args.base:
+        with open(args.base, encoding='utf-8') as arquivo:
+            if comparar(json.load(arquivo), relatorio):
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
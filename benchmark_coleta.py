@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+📥 BENCHMARK DA COLETA EM MASSA
+Contra a APILocal (coleta.py) com latência simulada por chamada:
+
+- uma chamada só (o antigo search_tweets com count ≤ 100) contra a coleta
+  seguindo max_id até a meta, sem ids repetidos
+- tempo até o primeiro tweet pontuado: páginas pontuadas assim que chegam
+  (pontuar_paginas) contra coletar tudo e pontuar no fim
+- retomada: uma segunda execução com since_id só busca os tweets novos
+
+Uso:
+    python benchmark_coleta.py
+    python benchmark_coleta.py --meta 20000 --latencia 0.05
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+import coleta
+
+
+def primeiro_e_total(tweets):
+    """(segundos até o primeiro item, segundos até o último, quantidade)"""
+    inicio = time.perf_counter()
+    primeiro = None
+    total = 0
+    for _ in tweets:
+        if primeiro is None:
+            primeiro = time.perf_counter() - inicio
+        total += 1
+    return primeiro or 0.0, time.perf_counter() - inicio, total
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Coleta paginada contra a APILocal")
+    parser.add_argument("--meta", type=int, default=5000, help="tweets por coleta")
+    parser.add_argument("--latencia", type=float, default=0.02, help="segundos por chamada à busca")
+    args = parser.parse_args(argumentos)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        import backends
+    backend = backends.obter('lexico')
+    backend.analisar_lote(["aquecer o léxico"])
+
+    print("📥 BENCHMARK - COLETA EM MASSA")
+    print("=" * 60)
+    api = coleta.APILocal(quantidade=args.meta * 2, atraso_s=args.latencia)
+
+    unica = api.search_tweets(q="marca", count=args.meta)
+    estatisticas = {}
+    ids = [tweet['id'] for pagina in coleta.coletar_paginas(api, "marca", args.meta, estatisticas=estatisticas)
+           for tweet in pagina]
+    print(f"\n📊 Volume por busca (meta {args.meta:,})")
+    print("-" * 60)
+    print(f"   uma chamada:       {len(unica):>7,} tweets")
+    print(f"   seguindo max_id:   {len(ids):>7,} tweets em {estatisticas['paginas']} páginas, "
+          f"{len(set(ids)):,} ids únicos ({estatisticas['duplicados']} repetidos descartados)")
+
+    def tudo_no_fim():
+        paginas = list(coleta.coletar_paginas(api, "marca", args.meta))
+        yield from coleta.pontuar_paginas(paginas, backend)
+
+    print(f"\n⏱️ Pontuação ({args.latencia * 1000:.0f} ms por chamada)")
+    print("-" * 60)
+    for nome, tweets in (("coletar tudo e pontuar", tudo_no_fim()),
+                         ("página a página", coleta.pontuar_paginas(coleta.coletar_paginas(api, "marca", args.meta),
+                                                                     backend))):
+        primeiro, total, quantidade = primeiro_e_total(tweets)
+        print(f"   {nome:<24} primeiro em {primeiro * 1000:>6.0f} ms | {quantidade:,} em {total:.2f}s")
+
+    with tempfile.TemporaryDirectory() as temporario:
+        caminho = os.path.join(temporario, "estado.json")
+        for _ in coleta.coletar(api, "marca", estado=coleta.EstadoColeta(caminho)):
+            pass
+        api.publicar(250)
+        chamadas = api.chamadas
+        novos = sum(len(pagina) for pagina in coleta.coletar(api, "marca", estado=coleta.EstadoColeta(caminho)))
+    print(f"\n↪️ Retomada: {novos} tweets novos em {api.chamadas - chamadas} chamadas "
+          f"(coleção com {len(api.tweets):,})")
+
+
+if __name__ == "__main__":
+    main()
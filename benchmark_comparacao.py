@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🧭 BENCHMARK DA COMPARAÇÃO ENTRE TÓPICOS
+Oito categorias, cada uma buscando numa APILocal (coleta.py) com latência
+própria por chamada e pontuando com o backend: uma depois da outra contra
+todas ao mesmo tempo (comparacao.analisar_topicos). O tempo em paralelo
+deve ficar perto da categoria mais lenta, não da soma.
+
+Uso:
+    python benchmark_comparacao.py
+    python benchmark_comparacao.py --tweets 2000 --backend nb_ptbr
+"""
+
+import argparse
+import contextlib
+import io
+import time
+
+import coleta
+import comparacao
+from resultados import ResultadosTweets
+
+CATEGORIAS = ["Tecnologia", "Entretenimento", "Negócios", "Esportes",
+              "Sustentabilidade", "Política", "Música", "Consumo"]
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Categorias em sequência × em paralelo")
+    parser.add_argument("--tweets", type=int, default=1000, help="tweets por categoria")
+    parser.add_argument("--backend", default="lexico", help="backend de sentimento (backends.py)")
+    args = parser.parse_args(argumentos)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        import backends
+    backend = backends.obter(args.backend)
+    backend.analisar_lote(["aquecer o backend"])
+
+    # Latência por chamada diferente em cada categoria: 20 a 55 ms
+    apis = {categoria: coleta.APILocal(quantidade=args.tweets, atraso_s=0.02 + 0.005 * i, semente=i)
+            for i, categoria in enumerate(CATEGORIAS)}
+
+    def buscar(categoria):
+        return [tweet['texto'] for pagina in coleta.coletar_paginas(apis[categoria], categoria, args.tweets)
+                for tweet in pagina]
+
+    def pontuar(textos):
+        lote = backend.analisar_lote(textos)
+        return ResultadosTweets.de_colunas(textos, lote.rotulos, lote.scores)
+
+    def medir(funcao):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        return time.perf_counter() - inicio, resultado
+
+    print("🧭 BENCHMARK - TODAS AS CATEGORIAS")
+    print("=" * 60)
+    por_categoria = {categoria: medir(lambda: pontuar(buscar(categoria)))[0] for categoria in CATEGORIAS}
+    t_sequencial, sequencial = medir(lambda: {categoria: pontuar(buscar(categoria)) for categoria in CATEGORIAS})
+    t_paralelo, paralelo = medir(lambda: comparacao.analisar_topicos(
+        buscar, pontuar, CATEGORIAS, thread_safe=backends.capacidades(args.backend).thread_safe))
+
+    assert all(list(sequencial[c].scores) == list(paralelo[c].scores) for c in CATEGORIAS)
+    print(f"\n📊 {len(CATEGORIAS)} categorias × {args.tweets:,} tweets ({args.backend})")
+    print("-" * 60)
+    print(f"   categoria mais lenta sozinha: {max(por_categoria.values()):>6.2f}s")
+    print(f"   uma depois da outra:          {t_sequencial:>6.2f}s")
+    print(f"   todas ao mesmo tempo:         {t_paralelo:>6.2f}s ({t_sequencial / t_paralelo:.1f}x)")
+    print("   ✅ scores idênticos")
+
+
+if __name__ == "__main__":
+    main()
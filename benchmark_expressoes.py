@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+⏱️ BENCHMARK DO MATCHER DE EXPRESSÕES
+Escala a lista de expressões de 10 a 10.000 e compara o scan antigo
+(`expressao in texto` / `str.replace` por expressão) com o Aho-Corasick.
+"""
+
+import random
+import time
+
+from expressoes import MatcherExpressoes
+
+SILABAS = ['ba', 'de', 'la', 'mo', 'ru', 'to', 'ca', 'ne', 'vi', 'so', 'pa', 'gue']
+
+
+def gerar_expressoes(quantidade, rng):
+    """Expressões sintéticas de 2 a 3 palavras, sem repetição"""
+    expressoes = set()
+    while len(expressoes) < quantidade:
+        palavras = [
+            "".join(rng.choice(SILABAS) for _ in range(rng.randint(2, 3)))
+            for _ in range(rng.randint(2, 3))
+        ]
+        expressoes.add(" ".join(palavras))
+    return sorted(expressoes)
+
+
+def gerar_textos(expressoes, quantidade, rng):
+    """Tweets sintéticos com algumas expressões da lista no meio"""
+    textos = []
+    for _ in range(quantidade):
+        partes = ["".join(rng.choice(SILABAS) for _ in range(3)) for _ in range(15)]
+        for _ in range(2):
+            partes.insert(rng.randint(0, len(partes)), rng.choice(expressoes))
+        textos.append(" ".join(partes))
+    return textos
+
+
+def medir(funcao):
+    inicio = time.perf_counter()
+    resultado = funcao()
+    return time.perf_counter() - inicio, resultado
+
+
+def main():
+    print("⏱️ BENCHMARK - EXPRESSÕES (scan por expressão x Aho-Corasick)")
+    print("=" * 70)
+    rng = random.Random(42)
+    total_textos = 500
+
+    print(f"\n📊 {total_textos} tweets por rodada")
+    print(f"   {'expressões':>10} | {'montagem':>9} | {'scan in':>9} | {'matcher':>9} | "
+          f"{'replace':>9} | {'substituir':>10}")
+
+    for quantidade in (10, 100, 1_000, 10_000):
+        expressoes = gerar_expressoes(quantidade, rng)
+        substituicoes = {e: e.replace(" ", "") for e in expressoes}
+        textos = gerar_textos(expressoes, total_textos, rng)
+
+        t_montagem, matcher = medir(lambda: MatcherExpressoes(substituicoes))
+
+        t_scan, antigos = medir(lambda: [
+            [i for i, e in enumerate(expressoes) if e in texto] for texto in textos
+        ])
+        t_matcher, novos = medir(lambda: [matcher.presentes(texto) for texto in textos])
+        assert antigos == novos
+
+        def replace_antigo():
+            resultado = []
+            for texto in textos:
+                for exp, troca in substituicoes.items():
+                    texto = texto.replace(exp, troca)
+                resultado.append(texto)
+            return resultado
+
+        t_replace, _ = medir(replace_antigo)
+        t_substituir, _ = medir(lambda: [matcher.substituir(texto) for texto in textos])
+
+        print(f"   {quantidade:>10,} | {t_montagem:8.3f}s | {t_scan:8.3f}s | {t_matcher:8.3f}s | "
+              f"{t_replace:8.3f}s | {t_substituir:9.3f}s")
+
+    print("\n✅ Mesmas expressões encontradas pelos dois métodos!")
+    print("💡 O custo do matcher depende só do tamanho do texto, não da lista.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+📊 BENCHMARK DOS GRÁFICOS DE SCORE × ENGAJAMENTO
+Para cada volume de tweets, monta o gráfico de engajamento em cada modo
+(graficos.py: SVG, WebGL, histograma 2D) e mede o tempo no servidor e o
+tamanho do JSON que vai para o navegador. O modo automático é marcado
+com ✅.
+
+Uso:
+    python benchmark_graficos.py
+    python benchmark_graficos.py --tweets 1000 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import plotly.io
+
+import graficos
+from resultados import ResultadosTweets
+
+# Dispersão SVG com mais pontos que isto leva minutos e não serve de comparação
+MAXIMO_SVG = 100_000
+
+ROTULOS = {2: ("MUITO POSITIVO", "#00b894"), 1: ("POSITIVO", "#00cec9"), 0: ("NEUTRO", "#fdcb6e"),
+           -1: ("NEGATIVO", "#e17055"), -2: ("MUITO NEGATIVO", "#d63031")}
+CORES = [cor for _, cor in ROTULOS.values()]
+
+
+def gerar(quantidade, semente=42):
+    """Coleção sintética: score inteiro do léxico e engajamento como nos apps"""
+    rng = np.random.default_rng(semente)
+    scores = rng.integers(-6, 7, quantidade)
+    return ResultadosTweets.de_colunas(["tweet"] * quantidade, np.clip(scores // 2, -2, 2), scores,
+                                       likes=rng.integers(40, 801, quantidade),
+                                       retweets=rng.integers(10, 201, quantidade))
+
+
+def medir(resultados, modo):
+    """(segundos para montar, bytes do JSON) do gráfico no modo pedido"""
+    limites = {'svg': (len(resultados), len(resultados)), 'webgl': (0, len(resultados)), 'histograma': (0, 0)}[modo]
+    inicio = time.perf_counter()
+    figura = graficos.grafico_engajamento(resultados, ROTULOS, CORES, *limites)
+    segundos = time.perf_counter() - inicio
+    return segundos, len(plotly.io.to_json(figura, validate=False))
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Tempo e tamanho do gráfico de engajamento por modo")
+    parser.add_argument("--tweets", type=int, nargs="*", default=[1_000, 10_000, 100_000, 1_000_000])
+    args = parser.parse_args(argumentos)
+
+    print("📊 BENCHMARK - GRÁFICO DE ENGAJAMENTO")
+    print("=" * 60)
+    print(f"   limites: SVG até {graficos.LIMITE_SVG:,}, WebGL até {graficos.LIMITE_PONTOS:,}")
+    print(f"   {'tweets':>10} | {'modo':<10} | {'montar':>9} | {'JSON':>10}")
+    # Aquece imports e caches do plotly fora da medição
+    for modo in ('svg', 'webgl', 'histograma'):
+        medir(gerar(100), modo)
+    for quantidade in args.tweets:
+        resultados = gerar(quantidade)
+        automatico = graficos.modo(quantidade)
+        for modo in ('svg', 'webgl', 'histograma'):
+            if modo == 'svg' and quantidade > MAXIMO_SVG:
+                continue
+            segundos, tamanho = medir(resultados, modo)
+            marca = "✅" if modo == automatico else "  "
+            print(f"   {quantidade:>10,} | {modo:<10} | {segundos * 1000:>6.0f} ms | "
+                  f"{tamanho / 1024:>7,.0f} KB {marca}")
+
+
+if __name__ == "__main__":
+    main()
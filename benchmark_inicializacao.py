@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+⏱️ BENCHMARK DE INICIALIZAÇÃO (COLD START)
+Cada ponto de entrada roda num processo novo, sem nada importado:
+
+- apps Streamlit: tempo até a primeira renderização (AppTest.run, com o
+  próprio Streamlit já carregado, como num servidor em execução)
+- CLIs interativos: tempo até o primeiro prompt aparecer na tela
+
+Com --perfil, mostra também os imports mais caros de cada um
+(python -X importtime, tempo acumulado por pacote de topo importado pelo
+ponto de entrada).
+
+Uso:
+    python benchmark_inicializacao.py
+    python benchmark_inicializacao.py --perfil --repeticoes 5
+    python benchmark_inicializacao.py app_sentimentos.py ml_sentimentos.py
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+
+# Apps Streamlit: medidos até o fim da primeira execução do script
+APPS = ['app_sentimentos.py', 'analisador_simples.py']
+
+# CLIs: medidos até o trecho do prompt aparecer no stdout
+PROMPTS = {
+    'analisador_ptbr.py': "Digite uma frase",
+    'ml_sentimentos.py': "Digite uma frase",
+    'dashboard_sentimentos.py': "Escolha uma opção",
+    'analisador.py': None,      # sem prompt: até o fim da execução
+}
+
+# Marca no stderr a partir da qual o -X importtime conta (depois do harness)
+MARCA = "--- inicio do ponto de entrada ---"
+
+EXECUTAR_APP = f"""
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file(sys.argv[1], default_timeout=300)
+app.secrets["TWITTER_API_KEY"] = "benchmark"     # analisador_simples lê st.secrets
+sys.stderr.write({MARCA!r} + "\\n")
+sys.stderr.flush()
+inicio = time.perf_counter()
+app.run()
+print(json.dumps({{"segundos": time.perf_counter() - inicio, "erro": bool(app.exception)}}))
+"""
+
+
+def medir_app(arquivo, importtime=False):
+    """(segundos até a primeira renderização, stderr do -X importtime)"""
+    with tempfile.TemporaryFile(mode='w+', encoding='utf-8') as erros:
+        comando = [sys.executable] + (['-X', 'importtime'] if importtime else []) + \
+                  ['-c', EXECUTAR_APP, arquivo]
+        saida = subprocess.run(comando, cwd=DIRETORIO, stdout=subprocess.PIPE, stderr=erros,
+                               text=True, check=True).stdout
+        erros.seek(0)
+        resultado = json.loads(saida.strip().splitlines()[-1])
+        if resultado['erro']:
+            raise RuntimeError(f"{arquivo} falhou na primeira renderização")
+        return resultado['segundos'], erros.read()
+
+
+def medir_cli(arquivo, importtime=False):
+    """(segundos até o prompt, stderr do -X importtime); o processo é encerrado no prompt"""
+    prompt = PROMPTS[arquivo].encode('utf-8') if PROMPTS[arquivo] else None
+    # stderr num arquivo: a saída do importtime encheria o pipe e travaria o processo
+    with tempfile.TemporaryFile(mode='w+', encoding='utf-8') as erros:
+        erros.write(MARCA + "\n")
+        erros.flush()
+        comando = [sys.executable, '-u'] + (['-X', 'importtime'] if importtime else []) + [arquivo]
+        inicio = time.perf_counter()
+        processo = subprocess.Popen(comando, cwd=DIRETORIO, stdin=subprocess.PIPE,
+                                    stdout=subprocess.PIPE, stderr=erros)
+        lido = b""
+        while True:
+            bloco = processo.stdout.read1(4096)
+            if not bloco:
+                break
+            lido += bloco
+            if prompt and prompt in lido:
+                break
+        segundos = time.perf_counter() - inicio
+        processo.kill()
+        processo.wait()
+        processo.stdout.close()
+        processo.stdin.close()
+        if prompt and prompt not in lido:
+            raise RuntimeError(f"{arquivo} terminou sem mostrar o prompt")
+        erros.seek(0)
+        return segundos, erros.read()
+
+
+def _pacotes(importtime):
+    """{pacote: ms acumulados} dos imports de topo (os aninhados já entram no acumulado do pai)"""
+    pacotes = {}
+    for linha in importtime.splitlines():
+        if not linha.startswith("import time:") or linha.startswith("import time: self"):
+            continue
+        _, acumulado, nome = linha[len("import time:"):].split("|")
+        if not nome.startswith("  "):
+            pacote = nome.strip().split(".")[0]
+            pacotes[pacote] = pacotes.get(pacote, 0) + int(acumulado) / 1000
+    return pacotes
+
+
+def imports_mais_caros(importtime, quantidade=6):
+    """[(pacote, ms acumulados)] importados pelo ponto de entrada (depois da MARCA)"""
+    # O que o próprio interpretador carrega ao iniciar (site, encodings...) não conta
+    do_interpretador = _pacotes(subprocess.run([sys.executable, '-X', 'importtime', '-c', 'pass'],
+                                               stderr=subprocess.PIPE, text=True).stderr)
+    pacotes = _pacotes(importtime.split(MARCA, 1)[-1])
+    caros = [(pacote, ms) for pacote, ms in pacotes.items() if pacote not in do_interpretador and ms >= 1]
+    return sorted(caros, key=lambda item: -item[1])[:quantidade]
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Tempo até a primeira renderização / primeiro prompt")
+    parser.add_argument("entradas", nargs="*", default=APPS + list(PROMPTS), help="pontos de entrada a medir")
+    parser.add_argument("--repeticoes", type=int, default=3, help="execuções por ponto de entrada (vale a menor)")
+    parser.add_argument("--perfil", action="store_true", help="mostra os imports mais caros (-X importtime)")
+    args = parser.parse_args(argumentos)
+    desconhecidas = set(args.entradas) - set(APPS) - set(PROMPTS)
+    if desconhecidas:
+        parser.error(f"pontos de entrada desconhecidos: {', '.join(sorted(desconhecidas))} "
+                     f"(disponíveis: {', '.join(APPS + list(PROMPTS))})")
+
+    print("⏱️ BENCHMARK - INICIALIZAÇÃO")
+    print("=" * 60)
+    print(f"   {'ponto de entrada':<26} | {'até':<14} | {'segundos':>8}")
+    for arquivo in args.entradas:
+        medir = medir_app if arquivo in APPS else medir_cli
+        alvo = "renderizar" if arquivo in APPS else "prompt" if PROMPTS[arquivo] else "terminar"
+        segundos = min(medir(arquivo)[0] for _ in range(args.repeticoes))
+        print(f"   {arquivo:<26} | {alvo:<14} | {segundos:>8.2f}")
+
+        if args.perfil:
+            _, importtime = medir(arquivo, importtime=True)
+            for pacote, ms in imports_mais_caros(importtime):
+                print(f"      {pacote:<23} {ms:>8.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+⏱️ BENCHMARK DO MOTOR LÉXICO
+Compara o laço antigo (um texto por vez, f-string por palavra) com o
+LexicoCompilado e com a API em lote analisar_lote.
+"""
+
+import random
+import time
+
+from lexico import LexicoCompilado, classificar
+
+# Léxico de referência (mesmo formato dos analisadores)
+POSITIVAS = {
+    'amo': 3, 'adoro': 3, 'incrível': 2, 'fantástico': 2, 'sensacional': 2,
+    'maravilhoso': 2, 'perfeito': 2, 'excelente': 2, 'ótimo': 1, 'bom': 1,
+    'top': 2, 'show': 2, 'maneiro': 1, 'curti': 1, 'gostei': 1, 'amei': 2
+}
+
+NEGATIVAS = {
+    'odeio': 3, 'detesto': 3, 'horrível': 2, 'terrível': 2, 'péssimo': 2,
+    'ruim': 1, 'lixo': 3, 'porcaria': 2, 'horroroso': 2, 'decepcionante': 2
+}
+
+NEUTRAS = ['hoje', 'o', 'produto', 'chegou', 'time', 'jogo', 'filme', 'que',
+           'muito', 'de', 'novo', 'ontem', 'série', 'governo', 'celular']
+
+
+def gerar_textos(quantidade, seed=42):
+    """Gera tweets sintéticos misturando palavras do léxico e neutras"""
+    rng = random.Random(seed)
+    vocabulario = list(POSITIVAS) + list(NEGATIVAS) + NEUTRAS * 3
+    return [
+        " ".join(rng.choice(vocabulario) for _ in range(rng.randint(5, 20))).capitalize()
+        for _ in range(quantidade)
+    ]
+
+
+def analisar_antigo(texto):
+    """Laço original copiado dos analisadores (referência)"""
+    texto = texto.lower()
+    score = 0
+    palavras_detectadas = []
+
+    for palavra in texto.split():
+        if palavra in POSITIVAS:
+            score += POSITIVAS[palavra]
+            palavras_detectadas.append(f"➕{palavra}")
+        elif palavra in NEGATIVAS:
+            score -= NEGATIVAS[palavra]
+            palavras_detectadas.append(f"➖{palavra}")
+
+    return classificar(score), score, palavras_detectadas
+
+
+def medir(nome, funcao, total):
+    inicio = time.perf_counter()
+    funcao()
+    duracao = time.perf_counter() - inicio
+    print(f"   {nome:<32} {duracao:8.3f}s  {total / duracao:12,.0f} tweets/s")
+    return duracao
+
+
+def main():
+    print("⏱️ BENCHMARK - MOTOR LÉXICO")
+    print("=" * 60)
+
+    lexico = LexicoCompilado(POSITIVAS, NEGATIVAS)
+
+    for total in (10_000, 100_000):
+        textos = gerar_textos(total)
+        print(f"\n📊 {total:,} tweets sintéticos:")
+
+        base = medir("laço antigo (por texto)", lambda: [analisar_antigo(t) for t in textos], total)
+        medir("LexicoCompilado.analisar", lambda: [lexico.analisar(t) for t in textos], total)
+        lote = medir("analisar_lote (com palavras)", lambda: lexico.analisar_lote(textos, com_palavras=True), total)
+        rapido = medir("analisar_lote (só scores)", lambda: lexico.analisar_lote(textos), total)
+
+        print(f"   🚀 Ganho: {base / lote:.1f}x com palavras | {base / rapido:.1f}x só scores")
+
+        # Conferir que os resultados batem com o laço antigo
+        resultado = lexico.analisar_lote(textos)
+        antigos = [analisar_antigo(t) for t in textos]
+        assert list(resultado.scores) == [a[1] for a in antigos]
+        assert list(resultado.rotulos) == [a[0] for a in antigos]
+
+    print("\n✅ Scores idênticos ao laço antigo!")
+
+
+if __name__ == "__main__":
+    main()
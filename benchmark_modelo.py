@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+⏱️ BENCHMARK DE INICIALIZAÇÃO: TREINAR x CARREGAR
+1. Tempo de `import analisador_ptbr` num processo novo, sem artefato
+   (treina e grava) e com artefato (só carrega com mmap).
+2. Com um corpus sintético grande, tempo de fit do pipeline contra o de
+   carregar o artefato gravado, conferindo que as probabilidades batem.
+"""
+
+import contextlib
+import io
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.naive_bayes import MultinomialNB
+from sklearn.pipeline import make_pipeline
+
+from artefatos import carregar_modelo, salvar_modelo
+
+REPETICOES = 3
+
+
+def tempo_import(modulo, diretorio_modelos):
+    """Tempo (s) de um processo novo importando o módulo"""
+    ambiente = dict(os.environ, ANALISADOR_MODELOS=diretorio_modelos)
+    codigo = f"import time; t = time.perf_counter(); import {modulo}; print(time.perf_counter() - t)"
+    saida = subprocess.run([sys.executable, "-c", codigo], env=ambiente, capture_output=True,
+                           text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    return float(saida.stdout.strip().splitlines()[-1])
+
+
+def medir_import():
+    print("\n🚀 IMPORT EM PROCESSO NOVO (menor de 3)")
+    print("-" * 60)
+    for modulo in ("analisador_ptbr", "ml_sentimentos"):
+        tempos = []
+        for _ in range(REPETICOES):
+            # Pasta vazia a cada vez: o import precisa treinar
+            with tempfile.TemporaryDirectory() as vazio:
+                tempos.append(tempo_import(modulo, vazio))
+        treinando = min(tempos)
+        with tempfile.TemporaryDirectory() as pasta:
+            tempo_import(modulo, pasta)     # grava o artefato
+            carregando = min(tempo_import(modulo, pasta) for _ in range(REPETICOES))
+        print(f"   {modulo:<16} | treinando: {treinando:.3f}s | carregando: {carregando:.3f}s")
+    print("   (corpus de brinquedo: o tempo é quase todo import do sklearn)")
+
+
+def gerar_corpus(quantidade, seed=42):
+    """Frases sintéticas com o vocabulário de treino do analisador_ptbr"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        import analisador_ptbr
+    rng = random.Random(seed)
+    palavras = {1: [], 0: []}
+    for texto, rotulo in zip(analisador_ptbr.textos_processados, analisador_ptbr.rotulos_treinamento):
+        palavras[rotulo].extend(texto.split())
+    # Vocabulário maior: variações numeradas, como num corpus real
+    textos, rotulos = [], []
+    for _ in range(quantidade):
+        rotulo = rng.randint(0, 1)
+        textos.append(" ".join(f"{rng.choice(palavras[rotulo])}{rng.randint(0, 300)}"
+                               for _ in range(rng.randint(4, 15))))
+        rotulos.append(rotulo)
+    return textos, rotulos
+
+
+def medir_corpus_grande(quantidade=200_000):
+    print(f"\n📚 CORPUS SINTÉTICO ({quantidade:,} frases, uni+bigramas)")
+    print("-" * 60)
+    textos, rotulos = gerar_corpus(quantidade)
+
+    inicio = time.perf_counter()
+    modelo = make_pipeline(CountVectorizer(ngram_range=(1, 2)), MultinomialNB())
+    modelo.fit(textos, rotulos)
+    t_fit = time.perf_counter() - inicio
+
+    with tempfile.TemporaryDirectory() as pasta:
+        salvar_modelo(modelo, "sintetico", "v1", pasta)
+        inicio = time.perf_counter()
+        carregado = carregar_modelo("sintetico", diretorio=pasta)
+        t_carregar = time.perf_counter() - inicio
+
+        amostra = textos[:2000]
+        assert np.allclose(modelo.predict_proba(amostra), carregado.predict_proba(amostra))
+        vocabulario = len(modelo[0].vocabulary_)
+        print(f"   vocabulário: {vocabulario:,} termos")
+        print(f"   treinar: {t_fit:.2f}s | carregar (mmap): {t_carregar * 1000:.1f} ms | "
+              f"{t_fit / t_carregar:,.0f}x mais rápido")
+        print("   ✅ predict_proba idêntico em 2.000 frases")
+
+
+def main():
+    print("⏱️ BENCHMARK - TREINAR x CARREGAR MODELO")
+    print("=" * 60)
+    medir_import()
+    medir_corpus_grande()
+
+
+if __name__ == "__main__":
+    main()
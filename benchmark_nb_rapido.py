@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+⚡ BENCHMARK DO NAIVE BAYES RÁPIDO
+Latência de uma frase (p50/p99) do modelo_ptbr.predict_proba contra o
+ClassificadorNBRapido (nb_rapido.py), para o modelo PT-BR e o de
+ml_sentimentos, conferindo que as probabilidades são idênticas.
+"""
+
+import contextlib
+import io
+import statistics
+import time
+
+import numpy as np
+
+from benchmark_ptbr import gerar_frases, percentil
+from nb_rapido import ClassificadorNBRapido
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import ml_sentimentos
+    from analisador_ptbr import modelo_ptbr, preprocessar_ptbr
+
+
+def latencias(funcao, textos):
+    """Tempo (µs) de cada chamada"""
+    tempos = []
+    for texto in textos:
+        inicio = time.perf_counter()
+        funcao(texto)
+        tempos.append((time.perf_counter() - inicio) * 1e6)
+    return tempos
+
+
+def medir(nome, modelo, textos):
+    rapido = ClassificadorNBRapido.de_pipeline(modelo)
+    esperado = modelo.predict_proba(textos)
+    obtido = np.array([rapido.predict_proba(texto) for texto in textos])
+    assert np.array_equal(esperado, obtido), f"{nome}: probabilidades diferentes"
+
+    print(f"\n🧠 {nome} ({len(textos):,} frases, uma por chamada)")
+    print("-" * 60)
+    print(f"   {'caminho':<26} | {'p50 µs':>8} | {'p99 µs':>8}")
+    medianas = {}
+    for caminho, funcao in (("pipeline.predict_proba", lambda texto: modelo.predict_proba([texto])),
+                            ("ClassificadorNBRapido", rapido.predict_proba)):
+        funcao(textos[0])       # aquecimento
+        tempos = latencias(funcao, textos)
+        medianas[caminho] = statistics.median(tempos)
+        print(f"   {caminho:<26} | {medianas[caminho]:>8.1f} | {percentil(tempos, 0.99):>8.1f}")
+    print(f"   ✅ probabilidades idênticas | "
+          f"{medianas['pipeline.predict_proba'] / medianas['ClassificadorNBRapido']:.0f}x mais rápido (p50)")
+
+
+def main():
+    print("⚡ BENCHMARK - NAIVE BAYES SEM SKLEARN")
+    print("=" * 60)
+    frases = [preprocessar_ptbr(frase) for frase in gerar_frases(3000, seed=7)]
+    medir("modelo_ptbr", modelo_ptbr, frases)
+    medir("ml_sentimentos", ml_sentimentos.modelo, frases[:1000] + ml_sentimentos.frases_teste)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+📄 BENCHMARK DA VISÃO PAGINADA DE RESULTADOS
+100 mil tweets pontuados numa página Streamlit (AppTest, sem servidor):
+tempo do script em cada interação (trocar de página, filtrar por
+sentimento e score, ordenar) e bytes enviados ao navegador, contra o que um
+st.markdown por cartão mandaria para a coleção inteira.
+
+Uso:
+    python benchmark_paginacao.py
+    python benchmark_paginacao.py --tweets 1000000
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from paginacao import POR_PAGINA
+from resultados import ResultadosTweets
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+
+# A coleção fica em cache no processo; o script só mostra a visão paginada com o
+# cartão do sistema_completo
+PAGINA = """
+import importlib.machinery, sys, time
+import numpy as np
+import streamlit as st
+sys.path.insert(0, {diretorio!r})
+from paginacao import mostrar_resultados
+from resultados import ResultadosTweets
+
+@st.cache_resource
+def sistema_completo():
+    return importlib.machinery.SourceFileLoader("sistema_completo", {sistema!r}).load_module()
+
+@st.cache_resource
+def colecao(n):
+    rng = np.random.default_rng(42)
+    scores = rng.integers(-6, 7, n)
+    return ResultadosTweets.de_colunas([f"tweet de teste número {{i}} 🚀" for i in range(n)],
+                                       np.clip(scores // 2, -2, 2), scores,
+                                       usuarios=rng.integers(1000, 10000, n), likes=rng.integers(0, 501, n),
+                                       retweets=rng.integers(0, 101, n), instantes=np.full(n, 1.7e9))
+
+app = sistema_completo()
+resultados = colecao({tweets})
+inicio = time.perf_counter()
+mostrar_resultados(resultados, app.SistemaAnaliseCompleto.ROTULOS, app.cartao_tweet, chave="analise")
+st.session_state.setdefault("_benchmark_ms", []).append((time.perf_counter() - inicio) * 1000)
+"""
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Visão paginada com muitos tweets")
+    parser.add_argument("--tweets", type=int, default=100_000, help="tweets na coleção")
+    parser.add_argument("--repeticoes", type=int, default=10, help="trocas de página medidas")
+    args = parser.parse_args(argumentos)
+
+    import streamlit.logger
+    from streamlit.testing.v1 import AppTest
+    streamlit.logger.set_log_level("error")
+
+    app = AppTest.from_string(PAGINA.format(diretorio=DIRETORIO, tweets=args.tweets,
+                                            sistema=os.path.join(DIRETORIO, 'sistema_completo.p')),
+                              default_timeout=300)
+    print("📄 BENCHMARK - VISÃO PAGINADA")
+    print("=" * 60)
+    app.run()
+    # O bloco com os cartões da página é o último markdown
+    pagina = len(app.markdown[-1].value.encode('utf-8'))
+
+    for numero in range(2, args.repeticoes + 2):
+        app.number_input(key="analise_pagina").set_value(numero).run()
+    trocas = app.session_state["_benchmark_ms"][1:]
+
+    interacoes = {}
+    app.multiselect(key="analise_sentimentos").set_value([2, -2]).run()
+    interacoes["filtrar sentimento"] = app.session_state["_benchmark_ms"][-1]
+    app.slider(key="analise_score").set_value((4, 6)).run()
+    interacoes["filtrar score"] = app.session_state["_benchmark_ms"][-1]
+    app.selectbox(key="analise_ordem").set_value("Mais engajamento").run()
+    interacoes["ordenar"] = app.session_state["_benchmark_ms"][-1]
+    if app.exception:
+        raise RuntimeError(app.exception[0].message)
+
+    # O que a renderização antiga mandaria: um st.markdown por tweet
+    sistema_completo = sys.modules['sistema_completo']     # carregado pelo script da página
+    amostra = ResultadosTweets.de_colunas(["tweet de teste número 0 🚀"] * 1000, np.zeros(1000), np.zeros(1000))
+    inicio = time.perf_counter()
+    por_cartao = sum(len(sistema_completo.cartao_tweet(tweet, 1).encode('utf-8')) for tweet in amostra) / 1000
+    ms_cartao = (time.perf_counter() - inicio) * 1000 / 1000
+
+    print(f"\n📊 {args.tweets:,} tweets, {POR_PAGINA} por página")
+    print("-" * 60)
+    print(f"   trocar de página:     {statistics.median(trocas):>8.1f} ms (mediana de {len(trocas)})")
+    for nome, ms in interacoes.items():
+        print(f"   {nome + ':':<21} {ms:>8.1f} ms")
+    print(f"   página enviada:       {pagina / 1024:>8.1f} KB")
+    print(f"   um cartão por tweet:  {por_cartao * args.tweets / 1024 ** 2:>8.1f} MB em {args.tweets:,} elementos "
+          f"(~{ms_cartao * args.tweets / 1000:.1f} s só montando o HTML)")
+
+
+if __name__ == "__main__":
+    main()
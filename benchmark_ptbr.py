@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+⏱️ BENCHMARK DA INFERÊNCIA DO ANALISADOR PT-BR
+Caminho antigo (predict + predict_proba por frase, listas de palavras) contra
+analisar_lote_ptbr (um predict_proba por lote, palavras por consulta em dict):
+latência de uma frase (p50/p99) e vazão em lote.
+"""
+
+import contextlib
+import io
+import random
+import statistics
+import time
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from analisador_ptbr import (analisar_detalhado_ptbr, analisar_lote_ptbr, modelo_ptbr,
+                                 preprocessar_ptbr, textos_treinamento)
+
+
+def analisar_antigo(frase):
+    """Implementação anterior, mantida só para comparação"""
+    frase_processada = preprocessar_ptbr(frase)
+    predicao = modelo_ptbr.predict([frase_processada])[0]
+    probabilidades = modelo_ptbr.predict_proba([frase_processada])[0]
+
+    sentimento = "😊 POSITIVO" if predicao == 1 else "😠 NEGATIVO"
+    confianca = probabilidades[predicao] * 100
+
+    palavras_positivas_br = ['top', 'show', 'maneiro', 'curti', 'gostei', 'amei', 'adorei', 'incrível']
+    palavras_negativas_br = ['porcaria', 'péssimo', 'horroroso', 'furada', 'arrependimento', 'golpe']
+
+    palavras_detectadas = []
+    for palavra in frase.lower().split():
+        if palavra in palavras_positivas_br:
+            palavras_detectadas.append(f"➕'{palavra}'")
+        elif palavra in palavras_negativas_br:
+            palavras_detectadas.append(f"➖'{palavra}'")
+
+    return sentimento, confianca, palavras_detectadas
+
+
+def gerar_frases(quantidade, seed=42):
+    rng = random.Random(seed)
+    palavras = " ".join(textos_treinamento).split() + ['hoje', 'o', 'produto', 'que', 'de']
+    return [" ".join(rng.choice(palavras) for _ in range(rng.randint(3, 12))) for _ in range(quantidade)]
+
+
+def percentil(valores, p):
+    valores = sorted(valores)
+    return valores[min(len(valores) - 1, int(len(valores) * p))]
+
+
+def medir_latencia(frases):
+    print("\n⏱️ LATÊNCIA DE UMA FRASE (µs)")
+    print("-" * 60)
+    print(f"   {'caminho':<24} | {'p50':>8} | {'p99':>8}")
+    for nome, funcao in (("antigo (2 chamadas)", analisar_antigo),
+                         ("analisar_detalhado_ptbr", analisar_detalhado_ptbr)):
+        tempos = []
+        for frase in frases:
+            inicio = time.perf_counter()
+            funcao(frase)
+            tempos.append((time.perf_counter() - inicio) * 1e6)
+        print(f"   {nome:<24} | {statistics.median(tempos):>8.0f} | {percentil(tempos, 0.99):>8.0f}")
+
+
+def medir_vazao(frases):
+    print(f"\n🚀 VAZÃO EM LOTE ({len(frases):,} frases)")
+    print("-" * 60)
+    inicio = time.perf_counter()
+    antigos = [analisar_antigo(frase) for frase in frases]
+    t_antigo = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    novos = analisar_lote_ptbr(frases)
+    t_lote = time.perf_counter() - inicio
+
+    for antigo, novo in zip(antigos, novos):
+        assert antigo[0] == novo[0] and antigo[2] == novo[2] and abs(antigo[1] - novo[1]) < 1e-9
+    print(f"   antigo:             {len(frases) / t_antigo:>10,.0f} frases/s")
+    print(f"   analisar_lote_ptbr: {len(frases) / t_lote:>10,.0f} frases/s ({t_antigo / t_lote:.0f}x)")
+    print("   ✅ mesmos sentimentos, confianças e palavras")
+
+
+def main():
+    print("⏱️ BENCHMARK - INFERÊNCIA PT-BR")
+    print("=" * 60)
+    medir_latencia(gerar_frases(2000, seed=1))
+    medir_vazao(gerar_frases(20_000))
+
+
+if __name__ == "__main__":
+    main()
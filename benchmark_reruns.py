@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🔁 BENCHMARK DE RERUNS DO STREAMLIT
+O Streamlit roda o script inteiro a cada interação com um widget. Para cada
+app, mede o tempo de execução do script (AppTest, sem servidor):
+
+- a primeira execução da sessão
+- a execução do clique em analisar
+- os reruns seguintes, já com a análise na tela (mediana e p95)
+
+Roda num diretório temporário: o sistema_completo grava o SQLite no
+diretório atual.
+
+Uso:
+    python benchmark_reruns.py
+    python benchmark_reruns.py --reruns 50 app_sentimentos.py
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import tempfile
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+APPS = ['app_sentimentos.py', 'analisador_simples.py', 'sistema_completo.p']
+
+
+# O app roda dentro deste script: mede só a execução dele, sem a espera do AppTest
+EXECUTAR_APP = """
+import runpy, sys, time
+import streamlit as st
+sys.path.insert(0, {diretorio!r})
+inicio = time.perf_counter()
+runpy.run_path({caminho!r}, run_name="__main__")
+st.session_state.setdefault("_benchmark_ms", []).append((time.perf_counter() - inicio) * 1000)
+"""
+
+
+def medir_app(arquivo, reruns):
+    """(ms da primeira execução, ms do clique, [ms de cada rerun])"""
+    from streamlit.testing.v1 import AppTest
+    app = AppTest.from_string(EXECUTAR_APP.format(diretorio=DIRETORIO, caminho=os.path.join(DIRETORIO, arquivo)),
+                              default_timeout=300)
+    app.secrets["TWITTER_API_KEY"] = "benchmark"     # analisador_simples lê st.secrets
+
+    app.run()
+    app.sidebar.button[0].click()
+    for _ in range(reruns + 1):
+        app.run()
+    if app.exception:
+        raise RuntimeError(app.exception[0].message)
+    primeira, clique, *tempos = app.session_state["_benchmark_ms"]
+    return primeira, clique, tempos
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Latência dos reruns dos apps Streamlit")
+    parser.add_argument("apps", nargs="*", default=APPS, help="apps a medir")
+    parser.add_argument("--reruns", type=int, default=20, help="reruns medidos depois da análise")
+    args = parser.parse_args(argumentos)
+
+    import streamlit.logger
+    streamlit.logger.set_log_level("error")
+
+    print("🔁 BENCHMARK - RERUNS DO STREAMLIT")
+    print("=" * 60)
+    print(f"   {'app':<22} | {'1ª execução':>11} | {'clique':>8} | {'rerun p50':>9} | {'rerun p95':>9}")
+    with tempfile.TemporaryDirectory() as temporario:
+        atual = os.getcwd()
+        os.chdir(temporario)
+        try:
+            for arquivo in args.apps:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    primeira, clique, tempos = medir_app(arquivo, args.reruns)
+                tempos.sort()
+                p95 = tempos[min(len(tempos) - 1, int(len(tempos) * 0.95))]
+                print(f"   {arquivo:<22} | {primeira:>8.0f} ms | {clique:>5.0f} ms | "
+                      f"{statistics.median(tempos):>6.1f} ms | {p95:>6.1f} ms")
+        finally:
+            os.chdir(atual)
+
+
+if __name__ == "__main__":
+    main()
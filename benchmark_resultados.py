@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🗜️ BENCHMARK DE MEMÓRIA DOS RESULTADOS
+Compara, com 100 mil tweets pontuados, a lista de dicionários antiga
+(rótulo, cor, emoji e data formatada em cada linha) com ResultadosTweets
+(código inteiro + colunas em arrays). Mede a memória retida com tracemalloc,
+o tamanho do que vai para o SQLite e o custo de montar o DataFrame e os
+totais dos gráficos em cada formato.
+"""
+
+import contextlib
+import gc
+import importlib.machinery
+import io
+import json
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from agregador import AgregadorSentimentos
+from benchmark_vetorizado import gerar_textos
+from lexico import LexicoCompilado
+from resultados import ResultadosTweets
+
+QUANTIDADE = 100_000
+
+
+def medir(construir):
+    """Memória retida (bytes) pelo objeto que construir() retorna"""
+    gc.collect()
+    tracemalloc.start()
+    objeto = construir()
+    retida = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return objeto, retida
+
+
+def main():
+    print("🗜️ BENCHMARK - MEMÓRIA DOS RESULTADOS")
+    print("=" * 60)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        import twitter_pronto
+        carregador = importlib.machinery.SourceFileLoader("sistema_completo", "sistema_completo.p")
+        sistema_completo = carregador.load_module()
+    ROTULOS = sistema_completo.SistemaAnaliseCompleto.ROTULOS
+
+    analisador = twitter_pronto.AnalisadorPortugues()
+    lexico = LexicoCompilado(analisador.positivas, analisador.negativas)
+    # Textos distintos: cada linha tem a sua string, como tweets reais
+    textos = [f"{texto} #{i}" for i, texto in enumerate(gerar_textos(lexico, QUANTIDADE))]
+    lote = lexico.analisar_lote(textos, com_palavras=True)
+
+    rng = random.Random(42)
+    metadados = [(rng.randint(1000, 9999), rng.randint(0, 500), rng.randint(0, 100), rng.randint(1, 24))
+                 for _ in range(QUANTIDADE)]
+    agora = datetime.now()
+
+    def como_dicts():
+        tweets = []
+        for texto, score, rotulo, palavras, (usuario, likes, retweets, horas) in zip(
+                textos, lote.scores, lote.rotulos, lote.palavras, metadados):
+            sentimento, cor, emoji = ROTULOS[rotulo]
+            tweets.append({
+                'texto': texto,
+                'sentimento': sentimento,
+                'score': score,
+                'palavras_chave': palavras[:3],
+                'cor': cor,
+                'emoji': emoji,
+                'usuario': f'user_{usuario}',
+                'likes': likes,
+                'retweets': retweets,
+                'data': (agora - timedelta(hours=horas)).strftime("%d/%m %H:%M")
+            })
+        return tweets
+
+    def como_colunas():
+        resultados = ResultadosTweets()
+        for texto, score, rotulo, palavras, (usuario, likes, retweets, horas) in zip(
+                textos, lote.scores, lote.rotulos, lote.palavras, metadados):
+            resultados.adicionar(texto, rotulo, score, palavras[:3], usuario, likes, retweets,
+                                 (agora - timedelta(hours=horas)).timestamp())
+        return resultados
+
+    # Os textos já existem nas duas versões: medimos só o que cada formato acrescenta
+    dicts, memoria_dicts = medir(como_dicts)
+    json_dicts = len(json.dumps(dicts).encode("utf-8"))
+
+    # Gráficos no formato antigo: lista de dicionários → colunas a cada desenho
+    inicio = time.perf_counter()
+    pd.DataFrame({
+        'Sentimento': [t['score'] for t in dicts],
+        'Engajamento': [t['likes'] + t['retweets'] for t in dicts],
+        'Categoria': [t['sentimento'] for t in dicts]
+    })
+    AgregadorSentimentos(codigo for codigo in lote.rotulos)
+    t_dicts = time.perf_counter() - inicio
+    del dicts
+
+    colunas, memoria_colunas = medir(como_colunas)
+    json_colunas = len(colunas.para_json().encode("utf-8"))
+
+    inicio = time.perf_counter()
+    colunas.como_dataframe(ROTULOS)
+    colunas.agregado()
+    t_colunas = time.perf_counter() - inicio
+
+    print(f"\n📦 {QUANTIDADE:,} tweets pontuados (sem contar os textos)")
+    print(f"   {'formato':<22} | {'memória':>10} | {'bytes/tweet':>11} | {'JSON':>10}")
+    for nome, memoria, tamanho_json in (("lista de dicionários", memoria_dicts, json_dicts),
+                                        ("ResultadosTweets", memoria_colunas, json_colunas)):
+        print(f"   {nome:<22} | {memoria / 2**20:>7.1f} MB | {memoria / QUANTIDADE:>11.0f} | "
+              f"{tamanho_json / 2**20:>7.1f} MB")
+    print(f"\n📊 DataFrame + totais dos gráficos: {t_dicts * 1000:.1f} ms → {t_colunas * 1000:.1f} ms")
+    print(f"\n✅ {memoria_dicts / memoria_colunas:.1f}x menos memória, "
+          f"JSON {json_dicts / json_colunas:.1f}x menor, "
+          f"gráficos {t_dicts / t_colunas:.0f}x mais rápidos")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+✂️ BENCHMARK DA TOKENIZAÇÃO COMPARTILHADA
+Ensemble léxico + modelo_ptbr nos mesmos tweets: cada backend tokenizando
+do seu jeito (lower/split do léxico, regex + expressões do preprocessar_ptbr
+e a regex de tokens do CountVectorizer) contra uma tokenização só
+(tokenizacao.py), com textos novos e, com o cache opcional ligado, numa
+segunda passada (textos já vistos, como num rerun). Mede também o
+modelo_ptbr sozinho, que não pode ficar mais lento que antes. Confere que
+scores e probabilidades são idênticos.
+"""
+
+import contextlib
+import io
+import re
+import time
+
+import numpy as np
+
+from benchmark_ptbr import gerar_frases
+from lexico import LexicoCompilado
+from tokenizacao import limpar_cache, tokenizar_lote
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import analisador_ptbr
+    from twitter_pronto import AnalisadorPortugues
+
+QUANTIDADE = 10_000      # cabe no cache de tokens
+REPETICOES = 7
+
+
+def preprocessar_antigo(texto):
+    """preprocessar_ptbr anterior (regex própria), mantido só para comparação"""
+    texto = re.sub(r'[^\w\sáàâãéèêíïóôõöúçñ]', '', texto.lower())
+    return analisador_ptbr.matcher_expressoes.substituir(texto)
+
+
+def main():
+    print("✂️ BENCHMARK - TOKENIZAÇÃO COMPARTILHADA")
+    print("=" * 60)
+    analisador = AnalisadorPortugues()
+    lexico = LexicoCompilado(analisador.positivas, analisador.negativas)
+    # Textos distintos, com pontuação e caixa variadas
+    textos = [f"{frase.capitalize()}! #{i}" for i, frase in enumerate(gerar_frases(QUANTIDADE))]
+
+    def separado():
+        lote = lexico.analisar_lote(textos)
+        return lote.scores, analisador_ptbr.modelo_ptbr.predict_proba([preprocessar_antigo(t) for t in textos])
+
+    def compartilhado(cache=False):
+        tokenizados = tokenizar_lote(textos, cache=cache)
+        lote = lexico.analisar_lote_tokens([tokenizado.tokens for tokenizado in tokenizados])
+        return lote.scores, analisador_ptbr.modelo_tokens.predict_proba(tokenizados)
+
+    def modelo_antes():
+        return analisador_ptbr.modelo_ptbr.predict_proba([preprocessar_antigo(t) for t in textos])
+
+    def modelo_tokens():
+        return analisador_ptbr.modelo_tokens.predict_proba(tokenizar_lote(textos))
+
+    def medir(funcao, antes=None):
+        """Menor tempo de REPETICOES execuções (antes: chamado fora do tempo a cada uma)"""
+        tempos = []
+        for _ in range(REPETICOES):
+            if antes:
+                antes()
+            inicio = time.perf_counter()
+            resultado = funcao()
+            tempos.append(time.perf_counter() - inicio)
+        return min(tempos), resultado
+
+    t_separado, (scores_antes, probabilidades_antes) = medir(separado)
+    t_frio, (scores, probabilidades) = medir(compartilhado)
+    # Cache cheio: textos já vistos, como num rerun do Streamlit
+    limpar_cache()
+    compartilhado(cache=True)
+    t_quente, _ = medir(lambda: compartilhado(cache=True))
+    t_modelo_antes, _ = medir(modelo_antes)
+    t_modelo, probabilidades_modelo = medir(modelo_tokens)
+
+    assert scores == scores_antes and np.array_equal(probabilidades, probabilidades_antes)
+    assert np.array_equal(probabilidades_modelo, probabilidades_antes)
+    print(f"\n📊 léxico + modelo_ptbr em {QUANTIDADE:,} tweets")
+    print("-" * 60)
+    print(f"   cada backend tokeniza:     {QUANTIDADE / t_separado:>9,.0f} tweets/s")
+    print(f"   tokenização única:         {QUANTIDADE / t_frio:>9,.0f} tweets/s ({t_separado / t_frio:.1f}x)")
+    print(f"   segunda passada (cache):   {QUANTIDADE / t_quente:>9,.0f} tweets/s ({t_separado / t_quente:.1f}x)")
+    print(f"\n📊 só o modelo_ptbr em {QUANTIDADE:,} tweets")
+    print("-" * 60)
+    print(f"   preprocessar_ptbr antigo:  {QUANTIDADE / t_modelo_antes:>9,.0f} tweets/s")
+    print(f"   tokens compartilhados:     {QUANTIDADE / t_modelo:>9,.0f} tweets/s "
+          f"({t_modelo_antes / t_modelo:.2f}x)")
+    print("   ✅ scores e probabilidades idênticos")
+
+
+if __name__ == "__main__":
+    main()
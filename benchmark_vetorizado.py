@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+⏱️ BENCHMARK DA PONTUAÇÃO VETORIZADA
+1. Confere que o modo esparso dá exatamente os mesmos scores dos métodos
+   analisar/analisar_sentimento/analisar_tweet nas listas de tweets do projeto.
+2. Mede tweets/segundo com 10 mil, 100 mil e 1 milhão de textos sintéticos.
+"""
+
+import contextlib
+import importlib.machinery
+import io
+import os
+import random
+import tempfile
+import time
+
+from lexico import LexicoCompilado
+from lexico_vetorizado import LexicoVetorizado
+
+
+def carregar_analisadores():
+    """Importa os analisadores existentes e as listas de tweets embutidas"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        import app_sentimentos
+        import twitter_pronto
+        import twitter_sentimentos
+        import twitter_v2
+
+        carregador = importlib.machinery.SourceFileLoader("sistema_completo", "sistema_completo.p")
+        sistema_completo = carregador.load_module()
+
+    web = app_sentimentos.AnalisadorWeb()
+    simulador = twitter_v2.TwitterSimulacaoRealista()
+    brasileiro = twitter_sentimentos.AnalisadorPortugues()
+
+    # DatabaseManager cria o .db no diretório atual
+    diretorio = os.getcwd()
+    with tempfile.TemporaryDirectory() as temporario:
+        os.chdir(temporario)
+        try:
+            sistema = sistema_completo.SistemaAnaliseCompleto()
+        finally:
+            os.chdir(diretorio)
+
+    tweets = list(simulador.tweets_tecnologia) + list(simulador.tweets_ciencia)
+    tweets += twitter_sentimentos.SimuladorTweets().tweets_exemplo
+    for lista in web.topicos_populares.values():
+        tweets += lista
+    for lista in sistema.topicos_populares.values():
+        tweets += lista
+
+    analisadores = {
+        "app_sentimentos.AnalisadorWeb": (
+            web.lexico, lambda t: web.analisar_sentimento(t)[1], None),
+        "sistema_completo.SistemaAnaliseCompleto": (
+            sistema.lexico, lambda t: sistema.analisar_sentimento(t)[1], None),
+        "twitter_pronto.AnalisadorPortugues": (
+            twitter_pronto.AnalisadorPortugues().lexico,
+            twitter_pronto.AnalisadorPortugues().analisar, 1),
+        "twitter_v2.AnalisadorPortugues": (
+            twitter_v2.AnalisadorPortugues().lexico,
+            twitter_v2.AnalisadorPortugues().analisar, 1),
+        "twitter_sentimentos.AnalisadorPortugues": (
+            brasileiro.lexico, lambda t: brasileiro.analisar_tweet(t)[1], None),
+    }
+    return tweets, analisadores, brasileiro.limpar_texto
+
+
+def conferir_scores():
+    print("\n🔍 CONFERINDO SCORES NAS LISTAS DE TWEETS DO PROJETO")
+    print("-" * 60)
+    tweets, analisadores, limpar_texto = carregar_analisadores()
+
+    for nome, (lexico, metodo, indice) in analisadores.items():
+        vetorizado = LexicoVetorizado(lexico)
+        textos = tweets
+        if nome.startswith("twitter_sentimentos"):
+            # analisar_tweet limpa o texto antes de pontuar
+            textos = [limpar_texto(t) for t in tweets]
+
+        esperados = [metodo(t) if indice is None else metodo(t)[indice] for t in tweets]
+        obtidos = vetorizado.analisar_lote(textos).scores.tolist()
+        assert obtidos == esperados, nome
+        print(f"   ✅ {nome}: {len(tweets)} tweets idênticos")
+
+
+def gerar_textos(lexico, quantidade, seed=42):
+    """Textos sintéticos com palavras do léxico e palavras neutras"""
+    rng = random.Random(seed)
+    vocabulario = list(lexico.pesos) + ['hoje', 'o', 'jogo', 'filme', 'que', 'muito', 'de', 'novo'] * 6
+    base = [
+        " ".join(rng.choice(vocabulario) for _ in range(rng.randint(5, 20))).capitalize()
+        for _ in range(10_000)
+    ]
+    return [base[i % len(base)] for i in range(quantidade)]
+
+
+def medir_vazao():
+    print("\n⏱️ VAZÃO (tweets/segundo)")
+    print("-" * 60)
+    with contextlib.redirect_stdout(io.StringIO()):
+        import twitter_pronto
+    analisador = twitter_pronto.AnalisadorPortugues()
+    # Sem cache: textos sintéticos se repetem e mascarariam o custo do laço
+    lexico = LexicoCompilado(analisador.positivas, analisador.negativas)
+    vetorizado = LexicoVetorizado(lexico)
+
+    print(f"   {'textos':>10} | {'laço Python':>14} | {'esparso':>14} | ganho")
+    for quantidade in (10_000, 100_000, 1_000_000):
+        textos = gerar_textos(lexico, quantidade)
+
+        inicio = time.perf_counter()
+        for texto in textos:
+            lexico.analisar(texto)
+        t_laco = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        resultado = vetorizado.analisar_lote(textos)
+        t_esparso = time.perf_counter() - inicio
+        assert len(resultado) == quantidade
+
+        print(f"   {quantidade:>10,} | {quantidade / t_laco:>14,.0f} | "
+              f"{quantidade / t_esparso:>14,.0f} | {t_laco / t_esparso:.1f}x")
+
+
+def main():
+    print("⏱️ BENCHMARK - PONTUAÇÃO LÉXICA VETORIZADA")
+    print("=" * 60)
+    conferir_scores()
+    medir_vazao()
+
+
+if __name__ == "__main__":
+    main()
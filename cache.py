@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🗃️ CACHE LRU DE RESULTADOS POR TEXTO
+Tweets repetidos (copia-e-cola, bots, retweets que escapam do filtro) não
+pagam de novo o custo da análise. A chave é o hash do texto normalizado e o
+cache se esvazia sozinho quando muda a versão do léxico ou do modelo.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+def normalizar(texto):
+    """Minúsculas e espaços colapsados: textos que pontuam igual viram a mesma chave"""
+    return " ".join(texto.lower().split())
+
+
+def chave_texto(texto):
+    """Hash compacto (16 bytes) do texto normalizado"""
+    return hashlib.blake2b(normalizar(texto).encode("utf-8"), digest_size=16).digest()
+
+
+class CacheLRU:
+    def __init__(self, capacidade=10_000, versao=None, chave=chave_texto):
+        self.capacidade = capacidade
+        self.versao = versao
+        self.chave = chave          # texto → chave (padrão: hash do texto normalizado)
+        self._itens = OrderedDict()
+        self._trava = threading.Lock()
+
+        self.acertos = 0
+        self.falhas = 0
+        self.remocoes = 0
+        self.invalidacoes = 0
+
+    def __len__(self):
+        return len(self._itens)
+
+    def invalidar(self, versao=None):
+        """Esvazia o cache e passa a valer para a nova versão"""
+        with self._trava:
+            self._invalidar(versao)
+
+    def _invalidar(self, versao):
+        # Chamado com a trava já adquirida
+        if self._itens or self.versao is not None:
+            self.invalidacoes += 1
+        self._itens.clear()
+        self.versao = versao
+
+    def obter(self, texto, calcular, versao=None):
+        """Retorna o resultado em cache ou chama calcular(texto) e guarda"""
+        chave = self.chave(texto)
+        with self._trava:
+            if versao != self.versao:
+                self._invalidar(versao)
+            if chave in self._itens:
+                self._itens.move_to_end(chave)
+                self.acertos += 1
+                return self._itens[chave]
+            self.falhas += 1
+
+        # Calcula fora da trava para não serializar as análises
+        resultado = calcular(texto)
+
+        with self._trava:
+            # Invalidado durante o cálculo: o resultado é de outra versão, não guarda
+            if self.versao != versao:
+                return resultado
+            self._itens[chave] = resultado
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.capacidade:
+                self._itens.popitem(last=False)
+                self.remocoes += 1
+
+        return resultado
+
+    def estatisticas(self):
+        """Contadores de acertos, falhas, remoções e invalidações"""
+        consultas = self.acertos + self.falhas
+        return {
+            'tamanho': len(self._itens),
+            'capacidade': self.capacidade,
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'remocoes': self.remocoes,
+            'invalidacoes': self.invalidacoes,
+            'taxa_acerto': self.acertos / consultas if consultas else 0.0,
+            'versao': self.versao
+        }
+
+
+# Caches do processo inteiro, um por analisador
+_caches = {}
+_trava_caches = threading.Lock()
+
+
+def cache_nomeado(nome, capacidade=10_000, chave=chave_texto):
+    """Cache compartilhado pelo processo (sobrevive a novas instâncias do analisador)"""
+    with _trava_caches:
+        if nome not in _caches:
+            _caches[nome] = CacheLRU(capacidade, chave=chave)
+        return _caches[nome]
+
+
+def estatisticas_caches():
+    """Estatísticas de todos os caches nomeados"""
+    with _trava_caches:
+        return {nome: cache.estatisticas() for nome, cache in _caches.items()}
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🪜 PONTUAÇÃO EM CASCATA: LÉXICO PRIMEIRO, MODELO SÓ NOS AMBÍGUOS
+O léxico do AnalisadorPortugues decide sozinho os textos claros (|score| ≥
+limiar, por padrão 3: os MUITO POSITIVO / MUITO NEGATIVO do classificar).
+Os que caem na faixa de incerteza (score zero ou de margem baixa) vão, em
+lote, para um modelo mais caro: o modelo_ptbr ou o TextBlob. Cada texto é
+tokenizado uma vez (tokenizacao.py) e os mesmos tokens servem ao léxico e
+ao modelo_ptbr.
+
+O score de cada texto vem da camada que decidiu o código, sempre com o
+mesmo sinal dele: pontos do léxico nos claros, 2·P(positivo) − 1 do
+modelo_ptbr ou a polaridade do TextBlob nos ambíguos.
+
+Uso:
+    python cascata.py                          # tweets sintéticos
+    python cascata.py tweets.jsonl --pesado textblob --limiar 2
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from array import array
+
+from lexico import NEGATIVO, NEUTRO, POSITIVO, LexicoCompilado, ResultadoLote
+from pontuar_lote import blocos
+from tokenizacao import tokenizar_lote
+
+# Sem nenhum termo conhecido o modelo_ptbr devolve o prior (50%): vira NEUTRO
+CONFIANCA_MINIMA = 50
+
+
+# Cada modelo pesado recebe os textos e os mesmos textos já tokenizados e
+# devolve (código, score com sinal) de cada um
+
+def pesado_ptbr():
+    """Naive Bayes do analisador_ptbr (um predict_proba por lote, sobre os tokens)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        from analisador_ptbr import analisar_detalhado_ptbr, analisar_lote_ptbr
+
+    def pontuar(textos, tokenizados):
+        # Um texto só: caminho rápido de frase única do analisador_ptbr
+        if len(tokenizados) == 1:
+            resultados = [analisar_detalhado_ptbr(tokenizados[0])]
+        else:
+            resultados = analisar_lote_ptbr(tokenizados)
+        codigos = []
+        for sentimento, confianca, _ in resultados:
+            positivo = sentimento == "😊 POSITIVO"
+            positiva = confianca / 100 if positivo else 1 - confianca / 100
+            codigo = NEUTRO if confianca <= CONFIANCA_MINIMA else POSITIVO if positivo else NEGATIVO
+            codigos.append((codigo, 2 * positiva - 1))
+        return codigos
+    return pontuar
+
+
+def pesado_textblob():
+    """Polaridade do TextBlob (backends.py; tokeniza por conta própria)"""
+    from backends import analisar_textblob as analisar
+
+    def pontuar(textos, tokenizados):
+        return [analisar(texto) for texto in textos]
+    return pontuar
+
+
+PESADOS = {'ptbr': pesado_ptbr, 'textblob': pesado_textblob}
+
+
+class PontuadorCascata:
+    def __init__(self, lexico=None, pesado='ptbr', limiar=3, tamanho_lote=1000):
+        if lexico is None:
+            with contextlib.redirect_stdout(sys.stderr):
+                from twitter_pronto import AnalisadorPortugues
+            analisador = AnalisadorPortugues()
+            lexico = LexicoCompilado(analisador.positivas, analisador.negativas)
+        self.lexico = lexico
+        self.nome_pesado = pesado
+        self.pesado = PESADOS[pesado]()
+        self.limiar = limiar                # |score| abaixo disso é ambíguo
+        self.tamanho_lote = tamanho_lote
+        self.por_camada = {'lexico': 0, pesado: 0}
+
+    def pontuar(self, textos):
+        """ResultadoLote com o código e o score da camada que decidiu cada texto (léxico ou modelo)"""
+        scores, rotulos = array('d'), array('b')
+        for bloco in blocos(textos, self.tamanho_lote):
+            tokenizados = tokenizar_lote(bloco)
+            lote = self.lexico.analisar_lote_tokens([tokenizado.tokens for tokenizado in tokenizados])
+            ambiguos = [i for i, score in enumerate(lote.scores) if abs(score) < self.limiar]
+            pontos = array('d', lote.scores)
+            if ambiguos:
+                decisoes = self.pesado([bloco[i] for i in ambiguos], [tokenizados[i] for i in ambiguos])
+                for i, (codigo, score) in zip(ambiguos, decisoes):
+                    lote.rotulos[i] = codigo
+                    pontos[i] = score
+            scores.extend(pontos)
+            rotulos.extend(lote.rotulos)
+            self.por_camada['lexico'] += len(bloco) - len(ambiguos)
+            self.por_camada[self.nome_pesado] += len(ambiguos)
+        return ResultadoLote(scores, rotulos)
+
+    def fracoes(self):
+        """Fração do tráfego decidida por cada camada"""
+        total = sum(self.por_camada.values()) or 1
+        return {camada: quantidade / total for camada, quantidade in self.por_camada.items()}
+
+
+def comparar(textos, pesado='ptbr', limiar=3, tamanho_lote=1000):
+    """Cascata contra o modelo pesado em todos os textos: frações, vazão e concordância"""
+    if not textos:
+        raise ValueError("Nenhum texto para comparar (entrada vazia)")
+    cascata = PontuadorCascata(pesado=pesado, limiar=limiar, tamanho_lote=tamanho_lote)
+    cascata.pesado(textos[:10], tokenizar_lote(textos[:10]))     # aquecimento: fora das medições
+
+    inicio = time.perf_counter()
+    resultado = cascata.pontuar(textos)
+    t_cascata = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    so_pesado = [codigo for bloco in blocos(textos, tamanho_lote)
+                 for codigo, _ in cascata.pesado(bloco, tokenizar_lote(bloco))]
+    t_pesado = time.perf_counter() - inicio
+
+    # Concordância de polaridade (o léxico tem 5 classes, os modelos 3)
+    sinal = lambda codigo: (codigo > 0) - (codigo < 0)
+    concordancia = sum(sinal(a) == sinal(b) for a, b in zip(resultado.rotulos, so_pesado)) / len(textos)
+
+    print(f"\n🪜 CASCATA léxico → {pesado} (|score| < {limiar} é ambíguo), {len(textos):,} textos")
+    print("-" * 60)
+    for camada, fracao in cascata.fracoes().items():
+        print(f"   {camada:<10} decidiu {fracao:>6.1%} do tráfego")
+    print(f"   só {pesado:<8} {len(textos) / t_pesado:>10,.0f} textos/s")
+    print(f"   cascata     {len(textos) / t_cascata:>10,.0f} textos/s ({t_pesado / t_cascata:.1f}x)")
+    print(f"   mesma polaridade que só {pesado}: {concordancia:.1%}")
+    return cascata
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Léxico primeiro, modelo só nos textos ambíguos")
+    parser.add_argument("entrada", nargs="?", help="JSONL/CSV com os textos (padrão: tweets sintéticos)")
+    parser.add_argument("--campo-texto", help="coluna com o texto (padrão: texto/full_text/text)")
+    parser.add_argument("--pesado", choices=list(PESADOS), default='ptbr', help="modelo para os ambíguos")
+    parser.add_argument("--limiar", type=int, default=3, help="|score| abaixo disso vai para o modelo")
+    parser.add_argument("--lote", type=int, default=1000, help="textos por chamada ao modelo")
+    parser.add_argument("--quantidade", type=int, default=50_000, help="tweets sintéticos (sem entrada)")
+    args = parser.parse_args(argumentos)
+
+    if args.entrada:
+        import pipeline
+        textos = [registro['texto'] for registro in pipeline.de_arquivo(args.entrada, args.campo_texto)]
+        if not textos:
+            raise ValueError(f"Nenhum texto em '{args.entrada}'")
+    else:
+        from benchmark_vetorizado import gerar_textos
+        with contextlib.redirect_stdout(sys.stderr):
+            from twitter_pronto import AnalisadorPortugues
+        analisador = AnalisadorPortugues()
+        textos = gerar_textos(LexicoCompilado(analisador.positivas, analisador.negativas), args.quantidade)
+    comparar(textos, args.pesado, args.limiar, args.lote)
+
+
+if __name__ == "__main__":
+    main()
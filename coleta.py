@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+📥 COLETA EM MASSA COM PAGINAÇÃO POR CURSOR
+Uma chamada a search_tweets devolve no máximo 100 tweets. A coleta segue
+os cursores da busca (API v1.1, do mais novo para o mais antigo):
+
+- cada página seguinte pede max_id = menor id já recebido − 1
+- para na meta de volume, no início da janela de tempo ou quando a busca
+  acaba
+- since_id = maior id da última coleta completa da mesma query: a
+  retomada só traz o que é novo (EstadoColeta, gravado num JSON)
+- uma coleta cortada na meta antes de chegar ao since_id deixa uma lacuna
+  (os tweets entre o checkpoint e o menor id coletado); a próxima execução
+  termina a lacuna com max_id antes de buscar os tweets novos
+- ids repetidos entre páginas são descartados
+
+As páginas saem como listas de dicts no formato do pipeline.py e podem ser
+pontuadas em lote assim que chegam (pontuar_paginas). Qualquer objeto com
+search_tweets(q=..., count=..., max_id=..., since_id=...) serve de API:
+tweepy.API ou APILocal, um dublê sem rede para testes e benchmarks.
+
+Uso:
+    python coleta.py "nubank" --meta 5000 --horas 24 --saida nubank.jsonl
+    python coleta.py "nubank" --local --meta 20000 --estado coleta_local.json
+"""
+
+import argparse
+import bisect
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pipeline
+from agregador import AgregadorSentimentos
+
+# Máximo por chamada da busca padrão
+POR_PAGINA = 100
+
+# Maior id visto por query, para a próxima execução retomar dali
+ESTADO_PADRAO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "coleta_estado.json")
+
+
+class EstadoColeta:
+    """Ponto de retomada de cada query (maior id e lacuna pendente), persistido num JSON"""
+
+    def __init__(self, caminho=ESTADO_PADRAO):
+        self.caminho = caminho
+        try:
+            with open(caminho, encoding='utf-8') as arquivo:
+                self.queries = json.load(arquivo)
+        except (OSError, ValueError):
+            self.queries = {}
+
+    def ultimo_id(self, query):
+        return self.queries.get(query, {}).get('ultimo_id')
+
+    def lacuna(self, query):
+        """{'max_id', 'topo'} da faixa que uma coleta cortada na meta não terminou (ou None)"""
+        return self.queries.get(query, {}).get('lacuna')
+
+    def registrar(self, query, ultimo_id, lacuna=None):
+        anterior = self.ultimo_id(query)
+        if anterior is not None and (ultimo_id is None or ultimo_id < anterior):
+            ultimo_id = anterior
+        self.queries[query] = {'ultimo_id': ultimo_id, 'atualizado': datetime.now().isoformat(timespec='seconds')}
+        if lacuna is not None:
+            self.queries[query]['lacuna'] = lacuna
+
+    def salvar(self):
+        # Arquivo temporário + replace: uma coleta interrompida não corrompe o estado
+        temporario = f"{self.caminho}.tmp"
+        with open(temporario, 'w', encoding='utf-8') as arquivo:
+            json.dump(self.queries, arquivo, ensure_ascii=False, indent=2)
+        os.replace(temporario, self.caminho)
+
+
+def registro(tweet):
+    """Tweet da busca (tweepy.Status ou da APILocal) no formato do pipeline"""
+    usuario = tweet.user
+    return {
+        'id': tweet.id,
+        'texto': getattr(tweet, 'full_text', None) or tweet.text,
+        'usuario': usuario.screen_name,
+        'nome': usuario.name,
+        'seguidores': usuario.followers_count,
+        'data': tweet.created_at,
+        'likes': tweet.favorite_count,
+        'retweets': tweet.retweet_count,
+        'localizacao': usuario.location or "Não informada"
+    }
+
+
+def coletar_paginas(api, query, meta=None, desde=None, since_id=None, por_pagina=POR_PAGINA, estatisticas=None,
+                    max_id=None):
+    """Gera páginas (listas de registros) seguindo max_id até `meta` tweets, até
+    `desde` (datetime com fuso) ou até a busca acabar; ids já vistos são descartados.
+    estatisticas['completa'] fica False só quando a meta cortou a coleta"""
+    estatisticas = {} if estatisticas is None else estatisticas
+    estatisticas.update(paginas=0, duplicados=0, completa=False)
+    vistos = set()
+    total = 0
+    while meta is None or total < meta:
+        # Só os cursores definidos: a busca real não aceita parâmetros vazios
+        cursores = {nome: valor for nome, valor in (('max_id', max_id), ('since_id', since_id)) if valor is not None}
+        pagina = api.search_tweets(q=query, count=por_pagina, tweet_mode='extended', **cursores)
+        if not pagina:
+            estatisticas['completa'] = True
+            return
+        estatisticas['paginas'] += 1
+        menor_id = min(tweet.id for tweet in pagina)
+        if max_id is not None and menor_id > max_id:
+            estatisticas['completa'] = True
+            return      # página só com tweets repetidos: o cursor não anda mais
+        limite, max_id = max_id, menor_id - 1
+
+        novos = []
+        fim_da_janela = False
+        for tweet in pagina:
+            if tweet.id in vistos or (limite is not None and tweet.id > limite):
+                estatisticas['duplicados'] += 1
+                continue
+            if desde is not None and tweet.created_at < desde:
+                fim_da_janela = True      # em ordem decrescente: o resto é ainda mais antigo
+                break
+            vistos.add(tweet.id)
+            novos.append(registro(tweet))
+        if meta is not None:
+            novos = novos[:meta - total]
+        total += len(novos)
+        if novos:
+            yield novos
+        if fim_da_janela:
+            estatisticas['completa'] = True
+            return
+
+
+def coletar(api, query, meta=None, desde=None, estado=None, por_pagina=POR_PAGINA, estatisticas=None):
+    """Páginas de `query` novas desde a última coleta registrada em `estado`
+    (EstadoColeta), começando pela lacuna que uma coleta anterior deixou.
+
+    O ponto de retomada só avança até o maior id quando a faixa chega ao since_id,
+    ao início da janela ou ao fim da busca. Cortada na meta antes disso, a faixa
+    entre o checkpoint e o menor id coletado fica gravada como lacuna e a próxima
+    execução continua dali com max_id. Interrompida (exceção, gerador abandonado),
+    nada é gravado: a próxima execução refaz a mesma faixa, e os ids nos registros
+    permitem deduplicar a saída"""
+    estatisticas = {} if estatisticas is None else estatisticas
+    estatisticas.update(paginas=0, duplicados=0, completa=True)
+    ultimo_id = estado.ultimo_id(query) if estado else None
+    lacuna = estado.lacuna(query) if estado else None
+    # (max_id, since_id, topo): primeiro a lacuna pendente, depois o que é novo
+    faixas = [(lacuna['max_id'], ultimo_id, lacuna['topo']), (None, lacuna['topo'], None)] if lacuna else \
+        [(None, ultimo_id, None)]
+    total = 0
+    for max_id, since_id, topo in faixas:
+        if meta is not None and total >= meta:
+            break
+        parcial = {}
+        menor_id = None
+        for pagina in coletar_paginas(api, query, None if meta is None else meta - total, desde, since_id,
+                                      por_pagina, parcial, max_id=max_id):
+            ids = [tweet['id'] for tweet in pagina]
+            menor_id = min(ids) if menor_id is None else min(menor_id, min(ids))
+            topo = max(ids) if topo is None else max(topo, max(ids))
+            total += len(pagina)
+            yield pagina
+        estatisticas['paginas'] += parcial['paginas']
+        estatisticas['duplicados'] += parcial['duplicados']
+        estatisticas['completa'] = parcial['completa']
+
+        if estado is not None:
+            if parcial['completa']:
+                estado.registrar(query, topo if topo is not None else since_id)
+            else:
+                estado.registrar(query, since_id, {'max_id': menor_id - 1, 'topo': topo})
+            estado.salvar()
+        if not parcial['completa']:
+            break
+
+
+def pontuar_paginas(paginas, backend, tamanho_minimo=10):
+    """Limpa e pontua cada página num lote só do backend (backends.py) e gera os tweets"""
+    for pagina in paginas:
+        tweets = list(pipeline.limpar(pagina, tamanho_minimo))
+        if not tweets:
+            continue
+        lote = backend.analisar_lote([tweet['texto'] for tweet in tweets])
+        for tweet, codigo, score in zip(tweets, lote.rotulos, lote.scores):
+            tweet['codigo'] = codigo
+            tweet['score'] = score
+            yield tweet
+
+
+# ---------------------------------------------------------------- API local
+
+_TRECHOS = [
+    "adorei o atendimento", "produto excelente", "entrega atrasada de novo", "péssimo suporte",
+    "app travando toda hora", "melhor compra do ano", "não recomendo", "chegou certinho",
+    "preço justo", "que decepção", "superou as expectativas", "vou cancelar", "hoje", "sinceramente",
+]
+
+
+class APILocal:
+    """Dublê da busca do Twitter, sem rede: tweets sintéticos em ordem decrescente de
+    id, com max_id/since_id, no máximo 100 por chamada e páginas que se sobrepõem
+    (como a busca real às vezes faz)"""
+
+    def __init__(self, quantidade=10_000, intervalo_s=30, sobreposicao=2, atraso_s=0.0, semente=42):
+        self._rng = random.Random(semente)
+        self.intervalo_s = intervalo_s
+        self.sobreposicao = sobreposicao
+        self.atraso_s = atraso_s
+        self.chamadas = 0
+        self.tweets = []             # do mais antigo para o mais novo
+        self._ids = []
+        self._agora = datetime.now(timezone.utc) - timedelta(seconds=intervalo_s * quantidade)
+        self.publicar(quantidade)
+
+    def publicar(self, quantidade):
+        """Acrescenta `quantidade` tweets mais novos que todos os anteriores"""
+        proximo_id = self.tweets[-1].id + self._rng.randint(1, 1000) if self.tweets else 10 ** 18
+        for _ in range(quantidade):
+            self._agora += timedelta(seconds=self.intervalo_s)
+            texto = " ".join(self._rng.sample(_TRECHOS, self._rng.randint(2, 4)))
+            usuario = self._rng.randint(1000, 99999)
+            self._ids.append(proximo_id)
+            self.tweets.append(SimpleNamespace(
+                id=proximo_id, full_text=f"{texto} #{proximo_id % 10000}", created_at=self._agora,
+                favorite_count=self._rng.randint(0, 500), retweet_count=self._rng.randint(0, 100),
+                user=SimpleNamespace(screen_name=f"user_{usuario}", name=f"Usuário {usuario}",
+                                     followers_count=self._rng.randint(0, 10000), location=None)))
+            proximo_id += self._rng.randint(1, 1000)
+
+    def search_tweets(self, q, count=15, max_id=None, since_id=None, **_):
+        self.chamadas += 1
+        if self.atraso_s:
+            time.sleep(self.atraso_s)
+        fim = len(self._ids)
+        if max_id is not None:
+            # A busca real às vezes repete os últimos tweets da página anterior
+            fim = min(fim, bisect.bisect_right(self._ids, max_id) + self.sobreposicao)
+        inicio = max(0, fim - min(count, POR_PAGINA))
+        if since_id is not None:
+            inicio = max(inicio, bisect.bisect_right(self._ids, since_id))
+        return self.tweets[inicio:fim][::-1]
+
+
+# ---------------------------------------------------------------- CLI
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Coleta em massa com paginação por cursor")
+    parser.add_argument("query", help="busca (ex.: 'nubank lang:pt -filter:retweets')")
+    parser.add_argument("--meta", type=int, default=1000, help="tweets a coletar (0: sem limite)")
+    parser.add_argument("--horas", type=float, help="só tweets das últimas N horas")
+    parser.add_argument("--estado", default=ESTADO_PADRAO, help="JSON com o último id por query")
+    parser.add_argument("--sem-estado", action="store_true", help="não retoma nem grava o último id")
+    parser.add_argument("--backend", help="backend de sentimento (backends.py)")
+    parser.add_argument("--saida", help="JSONL com os tweets pontuados (padrão: só o resumo)")
+    parser.add_argument("--local", action="store_true", help="usa a APILocal em vez do Twitter")
+    args = parser.parse_args(argumentos)
+
+    import backends
+
+    if args.local:
+        api = APILocal(quantidade=max(args.meta * 2, 10_000))
+    else:
+        from twitter_pronto import TwitterManager
+        api = TwitterManager().api
+        if api is None:
+            sys.exit(1)
+    estado = None if args.sem_estado else EstadoColeta(args.estado)
+    desde = datetime.now(timezone.utc) - timedelta(hours=args.horas) if args.horas else None
+
+    print("📥 COLETA EM MASSA")
+    print("=" * 60)
+    if estado and estado.lacuna(args.query):
+        print(f"↪️ Completando a coleta anterior a partir do id {estado.lacuna(args.query)['max_id']}")
+    elif estado and estado.ultimo_id(args.query):
+        print(f"↪️ Retomando depois do id {estado.ultimo_id(args.query)}")
+    estatisticas = {}
+    agregado = AgregadorSentimentos()
+    inicio = time.perf_counter()
+    paginas = coletar(api, args.query, args.meta or None, desde, estado, estatisticas=estatisticas)
+    tweets = pipeline.agregar(pontuar_paginas(paginas, backends.obter(args.backend)), agregado)
+    total = pipeline.gravar_jsonl(tweets, args.saida) if args.saida else pipeline.consumir(tweets)
+    segundos = time.perf_counter() - inicio
+
+    print(f"✅ {total:,} tweets pontuados em {estatisticas['paginas']} páginas "
+          f"({estatisticas['duplicados']} duplicados descartados) em {segundos:.2f}s")
+    print(f"📊 😊 {agregado.positivos:,} | 😠 {agregado.negativos:,} | 😐 {agregado.neutros:,}")
+
+
+if __name__ == "__main__":
+    main()
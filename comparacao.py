@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🧭 COMPARAÇÃO ENTRE TÓPICOS
+Busca e pontuação de todas as categorias ao mesmo tempo: cada tópico roda
+numa thread de um pool limitado (a espera é de rede, então o GIL não
+atrapalha) e o tempo total fica perto do tópico mais lento, não da soma.
+
+Backends que não são thread safe (backends.Capacidades) pontuam na thread
+principal depois das buscas paralelas. O resultado é um dict
+{tópico: ResultadosTweets} na ordem pedida, mostrado lado a lado por
+mostrar_comparacao (tabela, barras empilhadas e um cartão por tópico).
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from lexico import NEGATIVO, POSITIVO
+
+# Buscas simultâneas (a API tem limite de requisições por janela)
+MAX_TOPICOS_SIMULTANEOS = 8
+
+
+def em_paralelo(funcao, topicos, max_workers=MAX_TOPICOS_SIMULTANEOS):
+    """{tópico: funcao(tópico)} com as chamadas em threads, na ordem de `topicos`"""
+    topicos = list(topicos)
+    if not topicos:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(topicos)), thread_name_prefix="topico") as executor:
+        return dict(zip(topicos, executor.map(funcao, topicos)))
+
+
+def analisar_topicos(buscar, pontuar, topicos, thread_safe=True, max_workers=MAX_TOPICOS_SIMULTANEOS):
+    """{tópico: pontuar(buscar(tópico))}: buscas sempre em paralelo, pontuação
+    também quando o backend é thread safe"""
+    if thread_safe:
+        return em_paralelo(lambda topico: pontuar(buscar(topico)), topicos, max_workers)
+    buscas = em_paralelo(buscar, topicos, max_workers)
+    return {topico: pontuar(tweets) for topico, tweets in buscas.items()}
+
+
+def tabela_comparativa(resultados):
+    """DataFrame com uma linha por tópico: volume, percentuais, score e engajamento médios"""
+    import pandas as pd
+
+    linhas = []
+    for topico, tweets in resultados.items():
+        agregado = tweets.agregado()
+        linhas.append({
+            'Tópico': topico,
+            'Tweets': agregado.total,
+            'Positivos %': round(agregado.percentual(agregado.positivos), 1),
+            'Neutros %': round(agregado.percentual(agregado.neutros), 1),
+            'Negativos %': round(agregado.percentual(agregado.negativos), 1),
+            'Score médio': round(agregado.score_medio(), 3),
+            'Engajamento médio': agregado.engajamento_medio(),
+        })
+    return pd.DataFrame(linhas)
+
+
+def grafico_comparativo(tabela):
+    """Barras horizontais empilhadas (dict do plotly) com a distribuição de cada tópico"""
+    import plotly.graph_objects as go
+
+    figura = go.Figure()
+    for coluna, cor in (('Positivos %', '#00b894'), ('Neutros %', '#fdcb6e'), ('Negativos %', '#e17055')):
+        figura.add_trace(go.Bar(y=tabela['Tópico'], x=tabela[coluna], name=coluna.replace(' %', ''),
+                                orientation='h', marker_color=cor))
+    figura.update_layout(barmode='stack', xaxis_title="% dos tweets", yaxis=dict(autorange='reversed'),
+                         height=max(300, 45 * len(tabela)), legend_orientation='h')
+    return figura.to_dict()
+
+
+def mostrar_comparacao(resultados, segundos=None, colunas=4):
+    """Tópicos lado a lado: cartões com o sentimento geral, barras empilhadas e a tabela"""
+    import streamlit as st
+
+    tabela = tabela_comparativa(resultados)
+    st.subheader(f"🧭 Comparação entre {len(resultados)} tópicos")
+    if segundos is not None:
+        st.caption(f"⚡ buscados e pontuados ao mesmo tempo em {segundos:.2f}s")
+
+    topicos = list(resultados.items())
+    for inicio in range(0, len(topicos), colunas):
+        for coluna, (topico, tweets) in zip(st.columns(colunas), topicos[inicio:inicio + colunas]):
+            agregado = tweets.agregado()
+            geral = {POSITIVO: "😊 Positivo", NEGATIVO: "😠 Negativo"}.get(agregado.sentimento_geral(), "😐 Neutro")
+            with coluna:
+                st.metric(topico, geral, f"{agregado.score_medio():+.2f} score médio")
+                st.caption(f"{agregado.total} tweets | 😊 {agregado.percentual(agregado.positivos):.0f}% "
+                           f"| 😠 {agregado.percentual(agregado.negativos):.0f}%")
+
+    st.plotly_chart(grafico_comparativo(tabela), use_container_width=True)
+    st.dataframe(tabela, hide_index=True, use_container_width=True)
@@ -6,13 +6,17 @@ print("=" * 50)
 print("🎯 Visualização profissional dos resultados")
 print()
 
-import matplotlib.pyplot as plt
-import pandas as pd
 from datetime import datetime
 import random
 
-# Configurar matplotlib para português
-plt.rcParams['font.family'] = 'DejaVu Sans'
+from agregador import AgregadorSentimentos, CATEGORIAS, codigo_de_rotulo
+
+def pyplot():
+    """matplotlib.pyplot carregado só no primeiro gráfico (o menu aparece antes)"""
+    import matplotlib.pyplot as plt
+    # Configurar matplotlib para português
+    plt.rcParams['font.family'] = 'DejaVu Sans'
+    return plt
 
 class DashboardSentimentos:
     def __init__(self):
@@ -20,13 +24,17 @@ class DashboardSentimentos:
     
     def adicionar_analise(self, topico, resultados):
         """Adiciona análise ao histórico"""
+        # Uma passada só; aceita rótulos ("😊 POSITIVO") ou códigos inteiros
+        agregado = AgregadorSentimentos(
+            codigo_de_rotulo(r) if isinstance(r, str) else r for r in resultados)
         analise = {
             'topico': topico,
             'data': datetime.now(),
-            'total_tweets': len(resultados),
-            'positivos': sum(1 for r in resultados if "POSITIVO" in r),
-            'negativos': sum(1 for r in resultados if "NEGATIVO" in r),
-            'neutros': sum(1 for r in resultados if "NEUTRO" in r)
+            'total_tweets': agregado.total,
+            'positivos': agregado.positivos,
+            'negativos': agregado.negativos,
+            'neutros': agregado.neutros,
+            'agregado': agregado
         }
         self.historico.append(analise)
         return analise
@@ -37,6 +45,7 @@ class DashboardSentimentos:
         sizes = [analise['positivos'], analise['negativos'], analise['neutros']]
         colors = ['#2ecc71', '#e74c3c', '#f39c12']
         
+        plt = pyplot()
         plt.figure(figsize=(10, 6))
         plt.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90)
         plt.title(f'📊 Sentimentos sobre: {analise["topico"].upper()}\n'
@@ -48,16 +57,11 @@ class DashboardSentimentos:
     
     def criar_grafico_barras(self, analise):
         """Cria gráfico de barras"""
-        categorias = ['Muito Positivo', 'Positivo', 'Neutro', 'Negativo', 'Muito Negativo']
-        valores = [
-            sum(1 for r in resultados if "MUITO POSITIVO" in r),
-            sum(1 for r in resultados if "POSITIVO" in r and "MUITO" not in r),
-            sum(1 for r in resultados if "NEUTRO" in r),
-            sum(1 for r in resultados if "NEGATIVO" in r and "MUITO" not in r),
-            sum(1 for r in resultados if "MUITO NEGATIVO" in r)
-        ]
+        categorias = CATEGORIAS
+        valores = analise['agregado'].detalhado()
         cores = ['#27ae60', '#2ecc71', '#f39c12', '#e67e22', '#c0392b']
         
+        plt = pyplot()
         plt.figure(figsize=(12, 6))
         bars = plt.bar(categorias, valores, color=cores, edgecolor='black', alpha=0.8)
         
@@ -85,6 +89,7 @@ class DashboardSentimentos:
         positivos = [a['positivos'] for a in self.historico]
         negativos = [a['negativos'] for a in self.historico]
         
+        plt = pyplot()
         plt.figure(figsize=(12, 6))
         plt.plot(datas, positivos, marker='o', linewidth=2, label='Positivos 😊', color='#2ecc71')
         plt.plot(datas, negativos, marker='s', linewidth=2, label='Negativos 😠', color='#e74c3c')
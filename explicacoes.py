@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🔍 EXPLICAÇÕES POR ENTRADA (NAIVE BAYES)
+Quais palavras do texto puxaram a predição, e quanto. O log-odds de cada
+termo por classe é calculado uma vez ao montar o explicador; depois, cada
+texto só olha as colunas não nulas da sua linha na matriz esparsa, então
+explicar custa O(tokens do texto), não O(vocabulário).
+
+Contribuição de um termo para a classe c:
+    contagem × (log P(termo | c) − média de log P(termo | outras classes))
+(no caso binário, a diferença direta entre as duas classes).
+"""
+
+import numpy as np
+
+
+class ExplicadorNB:
+    def __init__(self, modelo):
+        """Pré-calcula nomes dos termos e log-odds de um pipeline vetorizador + MultinomialNB"""
+        self.modelo = modelo
+        self.vetorizador, self.classificador = modelo.steps[0][1], modelo.steps[-1][1]
+        self.termos = self.vetorizador.get_feature_names_out()
+
+        log_prob = np.asarray(self.classificador.feature_log_prob_)
+        n_classes = log_prob.shape[0]
+        outras = (log_prob.sum(axis=0) - log_prob) / max(n_classes - 1, 1)
+        self.log_odds = log_prob - outras       # (classes, termos)
+
+    def explicar_matriz(self, matriz, indices_classes, k=3):
+        """Top-k termos (termo, contribuição) de cada linha para a classe de cada linha"""
+        matriz = matriz.tocsr()
+        explicacoes = []
+        for linha, classe in enumerate(indices_classes):
+            inicio, fim = matriz.indptr[linha], matriz.indptr[linha + 1]
+            colunas = matriz.indices[inicio:fim]
+            contribuicoes = matriz.data[inicio:fim] * self.log_odds[classe, colunas]
+
+            # Só os termos a favor da classe, do maior para o menor
+            ordem = np.argsort(-contribuicoes)[:k]
+            explicacoes.append([(self.termos[colunas[i]], float(contribuicoes[i]))
+                                for i in ordem if contribuicoes[i] > 0])
+        return explicacoes
+
+    def explicar_lote(self, textos, k=3):
+        """[(classe, probabilidade, [(termo, contribuição), ...]), ...] com uma vetorização só"""
+        matriz = self.vetorizador.transform(textos)
+        probabilidades = self.classificador.predict_proba(matriz)
+        indices = probabilidades.argmax(axis=1)
+        explicacoes = self.explicar_matriz(matriz, indices, k)
+        classes = self.classificador.classes_
+        return [(classes[indice], probabilidades[linha, indice], explicacao)
+                for linha, (indice, explicacao) in enumerate(zip(indices, explicacoes))]
+
+    def explicar(self, texto, k=3):
+        """(classe, probabilidade, top-k termos) de um texto"""
+        return self.explicar_lote([texto], k)[0]
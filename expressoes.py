@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🔎 MATCHER DE EXPRESSÕES (AHO-CORASICK)
+Encontra todas as expressões de uma lista numa única passada pelo texto,
+em vez de um `expressao in texto` (ou `str.replace`) por expressão.
+"""
+
+from collections import deque
+
+
+class MatcherExpressoes:
+    def __init__(self, expressoes):
+        """Monta o autômato a partir de uma lista ou dict {expressao: valor}"""
+        if isinstance(expressoes, dict):
+            self.expressoes = list(expressoes)
+            self.valores = list(expressoes.values())
+        else:
+            self.expressoes = list(expressoes)
+            self.valores = [None] * len(self.expressoes)
+
+        self._transicoes = [{}]
+        self._falha = [0]
+        self._saidas = [()]
+
+        # Trie com todas as expressões
+        for indice, expressao in enumerate(self.expressoes):
+            if not expressao:
+                continue
+            estado = 0
+            for caractere in expressao:
+                proximo = self._transicoes[estado].get(caractere)
+                if proximo is None:
+                    proximo = len(self._transicoes)
+                    self._transicoes.append({})
+                    self._falha.append(0)
+                    self._saidas.append(())
+                    self._transicoes[estado][caractere] = proximo
+                estado = proximo
+            self._saidas[estado] += (indice,)
+
+        # Links de falha em largura (BFS), herdando as saídas do sufixo
+        fila = deque(self._transicoes[0].values())
+        while fila:
+            estado = fila.popleft()
+            for caractere, proximo in self._transicoes[estado].items():
+                fila.append(proximo)
+                falha = self._falha[estado]
+                while falha and caractere not in self._transicoes[falha]:
+                    falha = self._falha[falha]
+                falha = self._transicoes[falha].get(caractere, 0)
+                self._falha[proximo] = falha
+                self._saidas[proximo] += self._saidas[falha]
+
+    def __len__(self):
+        return len(self.expressoes)
+
+    def encontrar(self, texto):
+        """Gera (inicio, fim, indice) de cada ocorrência no texto"""
+        transicoes = self._transicoes
+        falha = self._falha
+        saidas = self._saidas
+        expressoes = self.expressoes
+        estado = 0
+
+        for posicao, caractere in enumerate(texto):
+            while estado and caractere not in transicoes[estado]:
+                estado = falha[estado]
+            estado = transicoes[estado].get(caractere, 0)
+            for indice in saidas[estado]:
+                yield posicao - len(expressoes[indice]) + 1, posicao + 1, indice
+
+    def presentes(self, texto):
+        """Retorna os índices (ordenados) das expressões que aparecem no texto"""
+        transicoes = self._transicoes
+        falha = self._falha
+        saidas = self._saidas
+        achados = set()
+        estado = 0
+
+        for caractere in texto:
+            while estado and caractere not in transicoes[estado]:
+                estado = falha[estado]
+            estado = transicoes[estado].get(caractere, 0)
+            if saidas[estado]:
+                achados.update(saidas[estado])
+
+        return sorted(achados)
+
+    def substituir(self, texto):
+        """Troca cada expressão pelo seu valor (mais à esquerda, mais longa primeiro)"""
+        ocorrencias = sorted(self.encontrar(texto), key=lambda o: (o[0], o[0] - o[1]))
+        if not ocorrencias:
+            return texto
+
+        partes = []
+        cursor = 0
+        for inicio, fim, indice in ocorrencias:
+            if inicio < cursor:
+                continue
+            partes.append(texto[cursor:inicio])
+            partes.append(self.valores[indice])
+            cursor = fim
+        partes.append(texto[cursor:])
+        return "".join(partes)
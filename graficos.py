@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+📊 GRÁFICOS DE SCORE × ENGAJAMENTO PARA QUALQUER VOLUME
+Um marcador SVG por tweet (px.scatter) trava o navegador com alguns
+milhares de pontos, e o JSON da figura cresce com a coleção. O modo muda
+pelo número de tweets:
+
+- até LIMITE_SVG: dispersão SVG, um marcador por tweet (como antes)
+- até LIMITE_PONTOS: dispersão WebGL (Scattergl), um traço por classe
+- acima: histograma 2D calculado no servidor com NumPy; só a grade de
+  contagens vai para o navegador, qualquer que seja o número de tweets
+
+Os limites vêm do ambiente:
+
+    GRAFICOS_LIMITE_SVG=500 GRAFICOS_LIMITE_PONTOS=20000 streamlit run analisador_simples.py
+"""
+
+import os
+
+import numpy as np
+
+# Até quantos tweets cada modo é usado
+LIMITE_SVG = int(os.environ.get("GRAFICOS_LIMITE_SVG", 2_000))
+LIMITE_PONTOS = int(os.environ.get("GRAFICOS_LIMITE_PONTOS", 50_000))
+
+# Caixas por eixo no histograma 2D (scores inteiros usam uma caixa por valor, se couber)
+CAIXAS = 60
+
+ROTULOS_EIXOS = {'score': 'Sentimento', 'engajamento': 'Engajamento', 'sentimento': 'Categoria'}
+
+
+def modo(quantidade, limite_svg=None, limite_pontos=None):
+    """'svg', 'webgl' ou 'histograma' para `quantidade` tweets"""
+    if quantidade <= (LIMITE_SVG if limite_svg is None else limite_svg):
+        return 'svg'
+    if quantidade <= (LIMITE_PONTOS if limite_pontos is None else limite_pontos):
+        return 'webgl'
+    return 'histograma'
+
+
+def _caixas(valores, caixas):
+    """(índice da caixa de cada valor, centros das caixas) de um eixo: uma caixa por
+    inteiro quando os valores são inteiros e cabem, senão `caixas` caixas iguais"""
+    menor, maior = valores.min().item(), valores.max().item()
+    if valores.dtype.kind in 'iu' and maior - menor < caixas:
+        return (valores - menor).astype(np.intp), np.arange(menor, maior + 1, dtype=np.float64)
+    if menor == maior:
+        return np.zeros(len(valores), dtype=np.intp), np.array([float(menor)])
+    largura = (maior - menor) / caixas
+    indices = np.minimum(((valores - menor) / largura).astype(np.intp), caixas - 1)
+    return indices, menor + largura * (np.arange(caixas) + 0.5)
+
+
+def histograma_2d(scores, engajamentos, caixas=CAIXAS):
+    """(contagens[engajamento, score], centros dos scores, centros dos engajamentos)"""
+    indices_x, centros_x = _caixas(scores, caixas)
+    indices_y, centros_y = _caixas(engajamentos, caixas)
+    # Um bincount só sobre o índice linear da célula (mais rápido que np.histogram2d)
+    contagens = np.bincount(indices_y * len(centros_x) + indices_x, minlength=len(centros_x) * len(centros_y))
+    return contagens.reshape(len(centros_y), len(centros_x)), centros_x, centros_y
+
+
+def grafico_engajamento(resultados, rotulos, cores, limite_svg=None, limite_pontos=None, caixas=CAIXAS):
+    """Figura de score × engajamento (dict do plotly) no modo que cabe no volume de `resultados`"""
+    import plotly.graph_objects as go
+
+    escolhido = modo(len(resultados), limite_svg, limite_pontos)
+    if escolhido == 'svg':
+        import plotly.express as px
+        figura = px.scatter(resultados.como_dataframe(rotulos), x='score', y='engajamento',
+                            color='sentimento', size='engajamento', labels=ROTULOS_EIXOS,
+                            color_discrete_sequence=cores)
+        return figura.to_dict()
+
+    scores, engajamentos = resultados.coluna('scores'), resultados.engajamentos()
+    if escolhido == 'webgl':
+        codigos = resultados.coluna('codigos')
+        figura = go.Figure()
+        for codigo in sorted(rotulos, reverse=True):
+            mascara = codigos == codigo
+            if mascara.any():
+                nome, cor = rotulos[codigo][:2]
+                figura.add_trace(go.Scattergl(x=scores[mascara], y=engajamentos[mascara], mode='markers', name=nome,
+                                              marker=dict(color=cor, size=4, opacity=0.6)))
+        titulo = f"{len(resultados):,} tweets (WebGL)"
+    else:
+        contagens, centros_x, centros_y = histograma_2d(scores, engajamentos, caixas)
+        figura = go.Figure(go.Heatmap(
+            z=np.where(contagens > 0, contagens, np.nan), x=centros_x, y=centros_y,
+            colorscale='Viridis', colorbar=dict(title='Tweets'),
+            hovertemplate="score %{x:.3g}<br>engajamento %{y:.0f}<br>%{z:,.0f} tweets<extra></extra>"))
+        titulo = f"{len(resultados):,} tweets (densidade)"
+    figura.update_layout(title=titulo, xaxis_title=ROTULOS_EIXOS['score'], yaxis_title=ROTULOS_EIXOS['engajamento'],
+                         legend_title=ROTULOS_EIXOS['sentimento'])
+    return figura.to_dict()
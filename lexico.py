@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🧠 MOTOR LÉXICO COMPARTILHADO
+Compila os dicionários de palavras positivas e negativas numa única tabela
+de pesos e pontua textos um a um ou em lote.
+"""
+
+import hashlib
+from array import array
+
+from expressoes import MatcherExpressoes
+
+# Códigos inteiros das classes de sentimento
+MUITO_NEGATIVO = -2
+NEGATIVO = -1
+NEUTRO = 0
+POSITIVO = 1
+MUITO_POSITIVO = 2
+
+
+def classificar(score):
+    """Converte um score no código da classe de sentimento"""
+    if score >= 3:
+        return MUITO_POSITIVO
+    elif score >= 1:
+        return POSITIVO
+    elif score <= -3:
+        return MUITO_NEGATIVO
+    elif score <= -1:
+        return NEGATIVO
+    else:
+        return NEUTRO
+
+
+class ResultadoLote:
+    """Scores e rótulos de um lote em arrays compactos"""
+
+    __slots__ = ('scores', 'rotulos', 'palavras')
+
+    def __init__(self, scores, rotulos, palavras=None):
+        self.scores = scores        # array('i') com o score de cada texto
+        self.rotulos = rotulos      # array('b') com o código da classe
+        self.palavras = palavras    # lista de palavras-chave (só se pedida)
+
+    def __len__(self):
+        return len(self.scores)
+
+
+class LexicoCompilado:
+    def __init__(self, positivas, negativas, formato="{sinal}{palavra}", expressoes=None, cache=None):
+        # Tabela única: negativas com peso negativo, positivas têm prioridade
+        # (mesma ordem do if/elif dos analisadores antigos)
+        self.pesos = {palavra: -abs(peso) for palavra, peso in negativas.items()}
+        self.pesos.update(positivas)
+        self.formato = formato
+
+        # Entradas com espaço nunca casam com split(): viram expressões
+        compostas = {p: self.pesos.pop(p) for p in list(self.pesos) if " " in p}
+        compostas.update(expressoes or {})
+        self.matcher = MatcherExpressoes(compostas) if compostas else None
+
+        # Palavras-chave já formatadas, montadas uma vez por entrada do léxico
+        self.marcadores = {
+            palavra: self._marcador(palavra, peso) for palavra, peso in self.pesos.items()
+        }
+        self.marcadores_expressoes = [
+            self._marcador(expressao, peso) for expressao, peso in compostas.items()
+        ]
+
+        # Versão = impressão digital do conteúdo; muda se o léxico mudar
+        conteudo = repr((sorted(self.pesos.items()), sorted(compostas.items()), formato))
+        self.versao = hashlib.sha1(conteudo.encode("utf-8")).hexdigest()[:12]
+        self.cache = cache
+
+    def _marcador(self, palavra, peso):
+        return self.formato.format(sinal="➕" if peso > 0 else "➖", palavra=palavra)
+
+    def _expressoes(self, tokens):
+        """Índices das expressões presentes nos tokens (já em minúsculas)"""
+        if self.matcher is None:
+            return ()
+        return self.matcher.presentes(" ".join(tokens))
+
+    def pontuar(self, texto):
+        """Calcula só o score do texto"""
+        return self.pontuar_tokens(texto.lower().split())
+
+    def pontuar_tokens(self, tokens):
+        """Score a partir de tokens já em minúsculas (ex.: TextoTokenizado.tokens)"""
+        score = sum(filter(None, map(self.pesos.get, tokens)))
+        for indice in self._expressoes(tokens):
+            score += self.matcher.valores[indice]
+        return score
+
+    def palavras_chave(self, texto):
+        """Monta as palavras-chave detectadas no texto (➕/➖)"""
+        return self.analisar(texto)[1]
+
+    def analisar(self, texto):
+        """Retorna (score, palavras_detectadas) de um texto"""
+        if self.cache is None:
+            return self._analisar(texto)
+        score, palavras = self.cache.obter(texto, self._analisar, versao=self.versao)
+        return score, list(palavras)
+
+    def _analisar(self, texto):
+        return self.analisar_tokens(texto.lower().split())
+
+    def analisar_tokens(self, tokens):
+        """(score, palavras_detectadas) a partir de tokens já em minúsculas, sem cache"""
+        score = 0
+        palavras = []
+
+        # Expressões compostas primeiro
+        for indice in self._expressoes(tokens):
+            score += self.matcher.valores[indice]
+            palavras.append(self.marcadores_expressoes[indice])
+
+        pesos = self.pesos
+        marcadores = self.marcadores
+        detectadas = [p for p in tokens if p in pesos]
+        score += sum([pesos[p] for p in detectadas])
+        palavras.extend([marcadores[p] for p in detectadas])
+        return score, palavras
+
+    def analisar_lote(self, textos, com_palavras=False):
+        """Pontua uma lista ou iterador de textos numa única passada"""
+        scores = array('i')
+        rotulos = array('b')
+
+        if com_palavras or self.matcher is not None:
+            palavras = [] if com_palavras else None
+            for texto in textos:
+                score, detectadas = self.analisar(texto)
+                scores.append(score)
+                rotulos.append(classificar(score))
+                if com_palavras:
+                    palavras.append(detectadas)
+            return ResultadoLote(scores, rotulos, palavras)
+
+        buscar = self.pesos.get
+        for texto in textos:
+            score = sum(filter(None, map(buscar, texto.lower().split())))
+            scores.append(score)
+            rotulos.append(classificar(score))
+        return ResultadoLote(scores, rotulos)
+
+    def analisar_lote_tokens(self, lista_tokens, com_palavras=False):
+        """Como analisar_lote, para textos já tokenizados (tokenizacao.py)"""
+        scores = array('i')
+        rotulos = array('b')
+        if not com_palavras and self.matcher is None:
+            buscar = self.pesos.get
+            for tokens in lista_tokens:
+                score = sum(filter(None, map(buscar, tokens)))
+                scores.append(score)
+                rotulos.append(classificar(score))
+            return ResultadoLote(scores, rotulos)
+
+        palavras = [] if com_palavras else None
+        for tokens in lista_tokens:
+            if com_palavras:
+                score, detectadas = self.analisar_tokens(tokens)
+                palavras.append(detectadas)
+            else:
+                score = self.pontuar_tokens(tokens)
+            scores.append(score)
+            rotulos.append(classificar(score))
+        return ResultadoLote(scores, rotulos, palavras)
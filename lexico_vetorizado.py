@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🧮 PONTUAÇÃO LÉXICA VETORIZADA (NumPy/SciPy)
+Para reprocessar históricos inteiros: o léxico vira um vocabulário + vetor
+de pesos, cada bloco de textos vira uma matriz CSR de termos e todos os
+scores saem de um único produto esparso.
+"""
+
+from itertools import repeat
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from lexico import LexicoCompilado, ResultadoLote
+
+# Token que separa os textos ao tokenizar o bloco inteiro de uma vez
+SEPARADOR = "\x00"
+_SEPARADOR_ID = -2
+_FORA_DO_VOCABULARIO = -1
+
+# Limites das classes: <=-3 | -2..-1 | 0 | 1..2 | >=3  →  códigos -2..2
+LIMIARES = np.array([-2, 0, 1, 3])
+
+
+def classificar_vetor(scores):
+    """Aplica os limiares de classe a um vetor de scores inteiro"""
+    return (np.digitize(scores, LIMIARES) - 2).astype(np.int8)
+
+
+class LexicoVetorizado:
+    def __init__(self, lexico):
+        """Monta vocabulário e vetor de pesos a partir de um LexicoCompilado"""
+        self.vocabulario = {palavra: i for i, palavra in enumerate(lexico.pesos)}
+        self.matcher = lexico.matcher
+
+        # Colunas das palavras primeiro, depois as das expressões compostas
+        pesos = list(lexico.pesos.values())
+        self.inicio_expressoes = len(pesos)
+        if self.matcher is not None:
+            pesos.extend(self.matcher.valores)
+        self.pesos = np.array(pesos, dtype=np.int32)
+
+        self._busca = dict(self.vocabulario)
+        self._busca[SEPARADOR] = _SEPARADOR_ID
+
+    @classmethod
+    def de_dicionarios(cls, positivas, negativas, expressoes=None):
+        """Atalho para montar direto dos dicionários (palavras_positivas/negativas...)"""
+        return cls(LexicoCompilado(positivas, negativas, expressoes=expressoes))
+
+    def matriz_termos(self, textos):
+        """Converte uma lista de textos numa matriz CSR (textos × termos do léxico)"""
+        textos = list(textos)
+        total = len(textos)
+
+        # Tokeniza o bloco inteiro numa chamada e mapeia tokens → colunas
+        tokens = f" {SEPARADOR} ".join(textos).lower().split()
+        ids = np.fromiter(
+            map(self._busca.get, tokens, repeat(_FORA_DO_VOCABULARIO)),
+            dtype=np.int64, count=len(tokens)
+        )
+        separadores = ids == _SEPARADOR_ID
+
+        if total and int(separadores.sum()) == total - 1:
+            linhas = np.cumsum(separadores)
+            validos = ids >= 0
+            linhas, colunas = linhas[validos], ids[validos]
+        else:
+            # Algum texto contém o separador: tokeniza texto a texto
+            linhas, colunas = self._ids_por_texto(textos)
+
+        if self.matcher is not None:
+            extras = [
+                (i, self.inicio_expressoes + indice)
+                for i, texto in enumerate(textos)
+                for indice in self.matcher.presentes(" ".join(texto.lower().split()))
+            ]
+            if extras:
+                extras = np.array(extras, dtype=np.int64)
+                linhas = np.concatenate([linhas, extras[:, 0]])
+                colunas = np.concatenate([colunas, extras[:, 1]])
+                ordem = np.argsort(linhas, kind='stable')
+                linhas, colunas = linhas[ordem], colunas[ordem]
+
+        # Linhas já ordenadas: monta o CSR direto, sem passar por COO
+        indptr = np.zeros(total + 1, dtype=np.int64)
+        np.cumsum(np.bincount(linhas, minlength=total), out=indptr[1:])
+        dados = np.ones(len(colunas), dtype=np.int32)
+        return csr_matrix((dados, colunas, indptr), shape=(total, len(self.pesos)))
+
+    def _ids_por_texto(self, textos):
+        vocabulario = self.vocabulario
+        linhas, colunas = [], []
+        for i, texto in enumerate(textos):
+            for token in texto.lower().split():
+                coluna = vocabulario.get(token)
+                if coluna is not None:
+                    linhas.append(i)
+                    colunas.append(coluna)
+        return np.array(linhas, dtype=np.int64), np.array(colunas, dtype=np.int64)
+
+    def pontuar(self, matriz):
+        """Todos os scores do bloco num único produto esparso"""
+        return matriz.dot(self.pesos).astype(np.int32)
+
+    def analisar_lote(self, textos, tamanho_bloco=100_000):
+        """Pontua uma lista ou iterador de textos em blocos, sem laço por token"""
+        blocos_scores = []
+        bloco = []
+        for texto in textos:
+            bloco.append(texto)
+            if len(bloco) >= tamanho_bloco:
+                blocos_scores.append(self.pontuar(self.matriz_termos(bloco)))
+                bloco = []
+        if bloco or not blocos_scores:
+            blocos_scores.append(self.pontuar(self.matriz_termos(bloco)))
+
+        scores = np.concatenate(blocos_scores)
+        return ResultadoLote(scores, classificar_vetor(scores))
@@ -10,6 +10,9 @@ from sklearn.naive_bayes import MultinomialNB
 from sklearn.pipeline import make_pipeline
 from sklearn.model_selection import train_test_split
 
+from artefatos import carregar_ou_treinar, versao_treino
+from explicacoes import ExplicadorNB
+
 print("✅ Bibliotecas de ML carregadas!")
 
 # Dados de treinamento (exemplos rotulados)
@@ -45,22 +48,26 @@ print(f"📊 Total de exemplos: {len(textos_treinamento)}")
 print(f"😊 Positivos: {rotulos_treinamento.count(1)}")
 print(f"😠 Negativos: {rotulos_treinamento.count(0)}")
 
-# Criar o modelo de Machine Learning
-print("\n🧠 CRIANDO MODELO DE MACHINE LEARNING...")
-
-modelo = make_pipeline(
-    CountVectorizer(),      # Converte texto em números
-    MultinomialNB()         # Algoritmo que aprende padrões
-)
-
-# Treinar o modelo
-print("📚 TREINANDO O MODELO...")
-modelo.fit(textos_treinamento, rotulos_treinamento)
-print("✅ Modelo treinado com sucesso!")
-
-# Testar o modelo
-print("\n🧪 TESTANDO O MODELO...")
-print("-" * 40)
+def treinar_modelo():
+    """Cria e treina o modelo de Machine Learning"""
+    modelo = make_pipeline(
+        CountVectorizer(),      # Converte texto em números
+        MultinomialNB()         # Algoritmo que aprende padrões
+    )
+    modelo.fit(textos_treinamento, rotulos_treinamento)
+    return modelo
+
+# Treina só se não houver artefato desta versão em modelos/ml/
+print("\n🧠 CARREGANDO MODELO DE MACHINE LEARNING...")
+VERSAO_MODELO = versao_treino(textos_treinamento, rotulos_treinamento, {})
+modelo, treinado = carregar_ou_treinar("ml", VERSAO_MODELO, treinar_modelo)
+if treinado:
+    print("✅ Modelo treinado com sucesso e salvo em modelos/ml/")
+else:
+    print(f"✅ Modelo carregado (versão {VERSAO_MODELO})")
+
+# Log-odds por termo calculados uma vez: explicar custa só os tokens da frase
+explicador = ExplicadorNB(modelo)
 
 frases_teste = [
     "gostei muito do produto excelente",
@@ -73,54 +80,52 @@ frases_teste = [
     "recomendo é muito bom"
 ]
 
-for frase in frases_teste:
-    # Fazer previsão
-    predicao = modelo.predict([frase])[0]
-    probabilidade = modelo.predict_proba([frase])[0]
+def main():
+    # Testar o modelo
+    print("\n🧪 TESTANDO O MODELO...")
+    print("-" * 40)
     
-    # Converter para resultado legível
-    sentimento = "😊 POSITIVO" if predicao == 1 else "😠 NEGATIVO"
-    confianca = probabilidade[predicao] * 100
+    # Previsões e explicações de todas as frases numa chamada só
+    for frase, (predicao, probabilidade, termos) in zip(frases_teste, explicador.explicar_lote(frases_teste)):
+        # Converter para resultado legível
+        sentimento = "😊 POSITIVO" if predicao == 1 else "😠 NEGATIVO"
+        confianca = probabilidade * 100
     
-    print(f"📝 '{frase}'")
-    print(f"   → {sentimento} (confiança: {confianca:.1f}%)")
-    print()
-
-# Mostrar estatísticas do modelo
-print("\n📈 ESTATÍSTICAS DO MODELO:")
-acuracia = modelo.score(textos_treinamento, rotulos_treinamento)
-print(f"✅ Acurácia no treinamento: {acuracia * 100:.1f}%")
-
-# Teste interativo
-print("\n🔍 TESTE INTERATIVO (digite 'sair' para encerrar)")
-print("-" * 50)
-
-while True:
-    user_input = input("\nDigite uma frase para analisar: ")
+        print(f"📝 '{frase}'")
+        print(f"   → {sentimento} (confiança: {confianca:.1f}%)")
+        if termos:
+            print(f"   🔍 Por causa de: {[termo for termo, _ in termos]}")
+        print()
+
+    # Mostrar estatísticas do modelo
+    print("\n📈 ESTATÍSTICAS DO MODELO:")
+    acuracia = modelo.score(textos_treinamento, rotulos_treinamento)
+    print(f"✅ Acurácia no treinamento: {acuracia * 100:.1f}%")
+
+    # Teste interativo
+    print("\n🔍 TESTE INTERATIVO (digite 'sair' para encerrar)")
+    print("-" * 50)
+
+    while True:
+        user_input = input("\nDigite uma frase para analisar: ")
     
-    if user_input.lower() == 'sair':
-        print("👋 Até a próxima!")
-        break
+        if user_input.lower() == 'sair':
+            print("👋 Até a próxima!")
+            break
     
-    if user_input.strip():
-        predicao = modelo.predict([user_input])[0]
-        probabilidade = modelo.predict_proba([user_input])[0]
-        confianca = probabilidade[predicao] * 100
+        if user_input.strip():
+            predicao, probabilidade, termos = explicador.explicar(user_input)
+            confianca = probabilidade * 100
         
-        sentimento = "😊 POSITIVO" if predicao == 1 else "😠 NEGATIVO"
+            sentimento = "😊 POSITIVO" if predicao == 1 else "😠 NEGATIVO"
         
-        print(f"   🎯 {sentimento} (confiança: {confianca:.1f}%)")
+            print(f"   🎯 {sentimento} (confiança: {confianca:.1f}%)")
         
-        # Mostrar palavras importantes
-        if hasattr(modelo, 'named_steps'):
-            vectorizer = modelo.named_steps['countvectorizer']
-            classifier = modelo.named_steps['multinomialnb']
-            
-            palavras = vectorizer.get_feature_names_out()
-            coefs = classifier.feature_log_prob_[predicao]
-            
-            # Encontrar palavras mais importantes
-            palavras_importantes = sorted(zip(palavras, coefs), 
-                                        key=lambda x: x[1], reverse=True)[:3]
-            
-            print(f"   🔍 Palavras-chave: {[p[0] for p in palavras_importantes]}")
\ No newline at end of file
+            # Palavras da própria frase que mais pesaram na decisão
+            if termos:
+                print(f"   🔍 Palavras-chave: {[f'{termo} (+{peso:.2f})' for termo, peso in termos]}")
+            else:
+                print("   🔍 Nenhuma palavra conhecida pelo modelo")
+
+if __name__ == "__main__":
+    main()
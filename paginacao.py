@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+📄 RESULTADOS PAGINADOS NO STREAMLIT
+Um elemento por tweet (st.markdown, st.columns, st.write) pesa no servidor
+e no navegador a partir de algumas centenas de tweets. Aqui filtro por
+sentimento e score e ordenação rodam no servidor, sobre as colunas NumPy de
+ResultadosTweets (selecionar), e só a página visível vira HTML: um único
+st.markdown com os cartões dela, qualquer que seja o tamanho da coleção.
+
+Cada app passa a própria função de cartão (tweet, número) → HTML.
+"""
+
+import html
+import math
+
+import streamlit as st
+
+# Cartões por página
+POR_PAGINA = 20
+
+# Opção de ordenação → (coluna, decrescente) de ResultadosTweets.selecionar
+ORDENS = {
+    "Original": (None, False),
+    "Maior score": ('scores', True),
+    "Menor score": ('scores', False),
+    "Mais engajamento": ('engajamento', True),
+}
+
+
+def escapar(texto):
+    """Texto do tweet seguro dentro do HTML do cartão"""
+    return html.escape(texto, quote=False)
+
+
+def _compactar(cartao):
+    """HTML numa linha por tag: sem linhas em branco nem recuo, o markdown não o
+    quebra em blocos de código"""
+    return "\n".join(linha.strip() for linha in cartao.splitlines() if linha.strip())
+
+
+def _voltar_primeira_pagina(chave):
+    # Sem o valor guardado o widget volta ao padrão (página 1)
+    st.session_state.pop(f"{chave}_pagina", None)
+
+
+def _descartar_fora(chave, minimo, maximo):
+    """Esquece o valor guardado na sessão se ele não cabe mais nos limites do widget
+    (nova análise, outros filtros): o widget volta ao padrão"""
+    valor = st.session_state.get(chave)
+    if valor is None:
+        return
+    if any(not minimo <= v <= maximo for v in (valor if isinstance(valor, tuple) else (valor,))):
+        del st.session_state[chave]
+
+
+def mostrar_resultados(resultados, rotulos, cartao, chave="resultados", por_pagina=POR_PAGINA):
+    """Filtros, ordenação e a página atual de `resultados` (ResultadosTweets)"""
+    nomes = {codigo: rotulo if isinstance(rotulo, str) else rotulo[0]
+             for codigo, rotulo in sorted(rotulos.items(), reverse=True)}
+    recomecar = dict(on_change=_voltar_primeira_pagina, args=(chave,))
+
+    col1, col2, col3 = st.columns([2, 2, 1])
+    with col1:
+        codigos = st.multiselect("Sentimentos:", list(nomes), default=list(nomes), format_func=nomes.get,
+                                 key=f"{chave}_sentimentos", **recomecar)
+    with col2:
+        score_min = score_max = None
+        scores = resultados.coluna('scores')
+        if len(scores) and scores.min() < scores.max():
+            # Score inteiro do léxico: faixa inteira; polaridades e probabilidades: contínua
+            tipo = int if scores.dtype.kind in 'iu' else float
+            menor, maior = tipo(scores.min()), tipo(scores.max())
+            _descartar_fora(f"{chave}_score", menor, maior)
+            score_min, score_max = st.slider("Score:", menor, maior, (menor, maior),
+                                             key=f"{chave}_score", **recomecar)
+    with col3:
+        ordem, decrescente = ORDENS[st.selectbox("Ordenar por:", list(ORDENS), key=f"{chave}_ordem", **recomecar)]
+
+    indices = resultados.selecionar(codigos, score_min, score_max, ordem, decrescente)
+    paginas = max(1, math.ceil(len(indices) / por_pagina))
+    pagina = 1
+    if paginas > 1:
+        _descartar_fora(f"{chave}_pagina", 1, paginas)
+        pagina = st.number_input("Página:", min_value=1, max_value=paginas, key=f"{chave}_pagina")
+
+    inicio = (pagina - 1) * por_pagina
+    visiveis = indices[inicio:inicio + por_pagina]
+    if not len(visiveis):
+        st.info("Nenhum tweet com esses filtros.")
+        return
+    st.caption(f"Página {pagina:,} de {paginas:,}: tweets {inicio + 1:,}–{inicio + len(visiveis):,} "
+               f"de {len(indices):,} ({len(resultados):,} analisados)")
+    st.markdown("\n".join(_compactar(cartao(resultados[i], i + 1)) for i in visiveis.tolist()),
+                unsafe_allow_html=True)
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🌊 PIPELINE EM STREAMING
+Etapas geradoras encadeáveis: fonte → limpeza → pontuação → agregação → saída.
+Cada tweet atravessa o pipeline inteiro assim que chega, então o primeiro
+resultado sai enquanto a busca continua e a memória não cresce com o volume.
+"""
+
+import csv
+import json
+import re
+import sys
+
+from agregador import codigo_de_rotulo
+
+# URLs, menções e hashtags removidas numa única expressão
+_RE_RUIDO = re.compile(r'http\S+|@\w+|#\w+')
+
+
+def montar(fonte, *etapas):
+    """Encadeia as etapas (cada uma recebe e devolve um iterável)"""
+    fluxo = fonte
+    for etapa in etapas:
+        fluxo = etapa(fluxo)
+    return fluxo
+
+
+# ---------------------------------------------------------------- fontes
+
+def de_textos(textos):
+    """Fonte a partir de textos soltos"""
+    for texto in textos:
+        yield {'texto': texto}
+
+
+def de_twitter(twitter, query, quantidade=10):
+    """Fonte ligada à busca real (TwitterManager.iterar_tweets_ptbr)"""
+    yield from twitter.iterar_tweets_ptbr(query, quantidade)
+
+
+def de_simulador(simulador, topico, quantidade=10):
+    """Fonte a partir dos simuladores (TwitterSimulacaoRealista ou SimuladorTweets)"""
+    if hasattr(simulador, 'buscar_tweets_simulados'):
+        yield from simulador.buscar_tweets_simulados(topico, quantidade)
+    else:
+        yield from de_textos(simulador.buscar_tweets_por_topico(topico, quantidade))
+
+
+def de_arquivo(caminho, campo_texto=None):
+    """Fonte a partir de um dump JSONL ou CSV, lido linha a linha"""
+    campos = (campo_texto,) if campo_texto else ('texto', 'full_text', 'text')
+
+    with open(caminho, encoding='utf-8', newline='') as arquivo:
+        if caminho.endswith('.csv'):
+            linhas = csv.DictReader(arquivo)
+        else:
+            linhas = (json.loads(linha) for linha in arquivo if linha.strip())
+
+        for registro in linhas:
+            for campo in campos:
+                if registro.get(campo):
+                    registro['texto'] = registro[campo]
+                    yield registro
+                    break
+
+
+# ---------------------------------------------------------------- etapas
+
+def limpar(tweets, tamanho_minimo=10):
+    """Remove URLs, menções e hashtags e descarta tweets sem conteúdo"""
+    for tweet in tweets:
+        texto = " ".join(_RE_RUIDO.sub('', tweet['texto']).split())
+        if len(texto) > tamanho_minimo:
+            tweet['texto'] = texto
+            yield tweet
+
+
+def pontuar(tweets, analisar):
+    """Aplica um analisador que retorna (sentimento, score, palavras, ...)"""
+    for tweet in tweets:
+        sentimento, score, palavras = analisar(tweet['texto'])[:3]
+        tweet['sentimento'] = sentimento
+        tweet['score'] = score
+        tweet['palavras_chave'] = palavras
+        yield tweet
+
+
+def agregar(tweets, agregado):
+    """Conta os sentimentos em `agregado` (AgregadorSentimentos) sem reter os tweets"""
+    for tweet in tweets:
+        codigo = tweet.get('codigo')
+        if codigo is None:
+            codigo = tweet['codigo'] = codigo_de_rotulo(tweet['sentimento'])
+        agregado.adicionar(codigo, tweet['score'])
+        yield tweet
+
+
+# ---------------------------------------------------------------- saídas
+
+def gravar_jsonl(tweets, destino=None):
+    """Escreve cada resultado assim que fica pronto; retorna quantos gravou"""
+    saida = open(destino, 'w', encoding='utf-8') if destino else sys.stdout
+    total = 0
+    try:
+        for tweet in tweets:
+            saida.write(json.dumps(tweet, ensure_ascii=False, default=str) + "\n")
+            saida.flush()
+            total += 1
+    finally:
+        if destino:
+            saida.close()
+    return total
+
+
+def consumir(tweets):
+    """Esgota o pipeline descartando os tweets (quando só a agregação importa)"""
+    total = 0
+    for _ in tweets:
+        total += 1
+    return total
+
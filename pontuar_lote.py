@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🏭 PONTUAÇÃO EM LOTE DE DUMPS DE TWEETS
+Lê um arquivo JSONL ou CSV grande, divide em blocos e pontua os blocos em
+paralelo em todos os núcleos, com o léxico (AnalisadorPortugues) ou com o
+modelo_ptbr. Os resultados são gravados à medida que ficam prontos, sempre
+na ordem do arquivo de entrada.
+
+Uso:
+    python pontuar_lote.py tweets.jsonl --saida resultados.jsonl
+    python pontuar_lote.py tweets.csv --backend ptbr --workers 4 --bloco 2000 --formato csv
+"""
+
+import argparse
+import contextlib
+import csv
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import pipeline
+
+BACKENDS = ('lexico', 'ptbr')
+
+# Backend carregado uma vez por processo worker
+_pontuar = None
+
+
+def carregar_backend(nome):
+    """Retorna uma função que pontua uma lista de textos"""
+    if nome == 'lexico':
+        from twitter_sentimentos import AnalisadorPortugues
+        analisador = AnalisadorPortugues()
+
+        def pontuar(textos):
+            resultados = []
+            for texto in textos:
+                sentimento, score, palavras = analisador.analisar_tweet(texto)
+                resultados.append({'sentimento': sentimento, 'score': score, 'palavras_chave': palavras})
+            return resultados
+
+        return pontuar
+
+    if nome == 'ptbr':
+        from analisador_ptbr import analisar_lote_ptbr
+
+        def pontuar(textos):
+            # Uma única chamada ao modelo por bloco
+            return [{'sentimento': sentimento, 'confianca': round(float(confianca), 1), 'palavras_chave': palavras}
+                    for sentimento, confianca, palavras in analisar_lote_ptbr(textos)]
+
+        return pontuar
+
+    raise ValueError(f"Backend desconhecido: {nome}")
+
+
+def _iniciar_worker(nome):
+    global _pontuar
+    # Os módulos dos analisadores imprimem ao carregar: manda para stderr
+    with contextlib.redirect_stdout(sys.stderr):
+        _pontuar = carregar_backend(nome)
+
+
+def _pontuar_bloco(textos):
+    return _pontuar(textos)
+
+
+def blocos(registros, tamanho):
+    """Agrupa um iterável em listas de até `tamanho` itens"""
+    registros = iter(registros)
+    while True:
+        bloco = list(islice(registros, tamanho))
+        if not bloco:
+            return
+        yield bloco
+
+
+def pontuar_em_paralelo(registros, backend='lexico', workers=None, tamanho_bloco=5000):
+    """Gera os registros pontuados, na ordem de entrada, usando um pool de processos"""
+    workers = workers or os.cpu_count() or 1
+    pendentes = deque()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_iniciar_worker,
+                             initargs=(backend,)) as executor:
+        for bloco in blocos(registros, tamanho_bloco):
+            textos = [registro['texto'] for registro in bloco]
+            pendentes.append((bloco, executor.submit(_pontuar_bloco, textos)))
+
+            # Grava o que já ficou pronto; janela de no máximo 2 blocos por worker
+            while pendentes and (len(pendentes) >= workers * 2 or pendentes[0][1].done()):
+                yield from _juntar(*pendentes.popleft())
+
+        while pendentes:
+            yield from _juntar(*pendentes.popleft())
+
+
+def _juntar(bloco, futuro):
+    for registro, resultado in zip(bloco, futuro.result()):
+        registro.update(resultado)
+        yield registro
+
+
+def gravar(registros, destino, formato):
+    """Grava em JSONL ou CSV conforme os registros chegam"""
+    saida = open(destino, 'w', encoding='utf-8', newline='') if destino else sys.stdout
+    escritor = None
+    try:
+        for registro in registros:
+            if formato == 'jsonl':
+                saida.write(json.dumps(registro, ensure_ascii=False, default=str) + "\n")
+            else:
+                if 'palavras_chave' in registro:
+                    registro['palavras_chave'] = "; ".join(registro['palavras_chave'])
+                if escritor is None:
+                    escritor = csv.DictWriter(saida, fieldnames=list(registro),
+                                              extrasaction='ignore', restval='')
+                    escritor.writeheader()
+                escritor.writerow(registro)
+            yield registro
+    finally:
+        if destino:
+            saida.close()
+
+
+def progresso(registros, intervalo=10_000):
+    """Mostra tweets processados e vazão no stderr"""
+    inicio = time.perf_counter()
+    total = 0
+    for registro in registros:
+        total += 1
+        if total % intervalo == 0:
+            vazao = total / (time.perf_counter() - inicio)
+            print(f"\r⏳ {total:,} tweets | {vazao:,.0f} tweets/s", end="", file=sys.stderr)
+        yield registro
+
+    duracao = time.perf_counter() - inicio
+    vazao = total / duracao if duracao else 0
+    print(f"\r✅ {total:,} tweets em {duracao:.1f}s | {vazao:,.0f} tweets/s", file=sys.stderr)
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Pontua um dump JSONL/CSV de tweets em paralelo")
+    parser.add_argument("entrada", help="arquivo .jsonl ou .csv com os tweets")
+    parser.add_argument("--saida", help="arquivo de saída (padrão: stdout)")
+    parser.add_argument("--backend", choices=BACKENDS, default='lexico')
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processos em paralelo")
+    parser.add_argument("--bloco", type=int, default=5000, help="tweets por bloco")
+    parser.add_argument("--formato", choices=('jsonl', 'csv'), help="padrão: extensão da saída ou jsonl")
+    parser.add_argument("--campo-texto", help="coluna com o texto (padrão: texto/full_text/text)")
+    args = parser.parse_args(argumentos)
+
+    formato = args.formato or ('csv' if args.saida and args.saida.endswith('.csv') else 'jsonl')
+    print(f"🏭 Pontuando '{args.entrada}' com '{args.backend}' "
+          f"({args.workers} workers, blocos de {args.bloco})", file=sys.stderr)
+
+    registros = pipeline.de_arquivo(args.entrada, args.campo_texto)
+    pontuados = pontuar_em_paralelo(registros, args.backend, args.workers, args.bloco)
+    pipeline.consumir(progresso(gravar(pontuados, args.saida, formato)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🗄️ RECURSOS COMPARTILHADOS ENTRE RERUNS DO STREAMLIT
+O Streamlit roda o script inteiro a cada interação com um widget. Objetos
+pesados (analisadores, clientes de API, gerenciadores de banco) são criados
+uma vez por processo (@recurso, st.cache_resource) e servem todas as
+sessões: não podem guardar estado de sessão. Resultados caros e
+determinísticos (buscas por tópico, corpora de fallback pontuados) ficam em
+cache por argumentos durante um TTL (@dados, st.cache_data).
+
+Os decoradores contam chamadas e execuções de cada função; a barra lateral
+(mostrar_estatisticas) exibe esses acertos, os caches LRU (cache.py) e a
+latência dos últimos reruns da sessão (medir_execucao).
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+import streamlit as st
+
+from cache import estatisticas_caches
+
+# Validade padrão dos resultados em cache (segundos)
+TTL_PADRAO = 300
+
+# Reruns da sessão guardados para a mediana
+HISTORICO_EXECUCOES = 50
+
+# nome da função → [chamadas, execuções]; o módulo vive o processo inteiro
+_contadores = {}
+_trava = threading.Lock()
+
+
+def _contar(nome, indice):
+    with _trava:
+        _contadores.setdefault(nome, [0, 0])[indice] += 1
+
+
+def _decorar(cache_streamlit, funcao):
+    nome = funcao.__qualname__
+
+    @wraps(funcao)
+    def executar(*args, **kwargs):
+        _contar(nome, 1)        # só roda quando o cache do Streamlit falha
+        return funcao(*args, **kwargs)
+
+    em_cache = cache_streamlit(executar)
+
+    @wraps(funcao)
+    def chamar(*args, **kwargs):
+        _contar(nome, 0)
+        return em_cache(*args, **kwargs)
+
+    chamar.clear = em_cache.clear
+    return chamar
+
+
+def recurso(funcao):
+    """Um objeto por processo e argumentos, compartilhado por todas as sessões"""
+    return _decorar(st.cache_resource(show_spinner=False), funcao)
+
+
+def dados(ttl=TTL_PADRAO, max_entradas=128):
+    """Resultado em cache por argumentos durante ttl segundos (cópia por chamada)"""
+    return lambda funcao: _decorar(st.cache_data(ttl=ttl, max_entries=max_entradas, show_spinner=False), funcao)
+
+
+def estatisticas():
+    """{função: (chamadas, execuções)} dos recursos e dados em cache"""
+    with _trava:
+        return {nome: tuple(contagem) for nome, contagem in _contadores.items()}
+
+
+@contextmanager
+def medir_execucao():
+    """Guarda na sessão quanto tempo o script levou neste rerun"""
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        tempos = st.session_state.setdefault('_tempos_execucao', [])
+        tempos.append((time.perf_counter() - inicio) * 1000)
+        del tempos[:-HISTORICO_EXECUCOES]
+
+
+def mostrar_estatisticas():
+    """Painel da barra lateral: reruns da sessão, caches do Streamlit e caches LRU"""
+    with st.sidebar.expander("🗄️ Cache e desempenho"):
+        tempos = st.session_state.get('_tempos_execucao')
+        if tempos:
+            ordenados = sorted(tempos)
+            st.metric("Último rerun", f"{tempos[-1]:.0f} ms",
+                      help=f"mediana de {len(tempos)} reruns: {ordenados[len(ordenados) // 2]:.0f} ms")
+
+        for nome, (chamadas, execucoes) in estatisticas().items():
+            acertos = chamadas - execucoes
+            st.caption(f"**{nome}**: {acertos}/{chamadas} acertos ({execucoes} execuções)")
+
+        for nome, lru in estatisticas_caches().items():
+            st.caption(f"**{nome}**: {lru['tamanho']:,} textos, {lru['taxa_acerto']:.0%} de acerto")
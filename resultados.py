@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🗜️ RESULTADOS COMPACTOS DE ANÁLISE
+Cada tweet analisado guarda só o código inteiro da classe (lexico.NEUTRO...)
+em vez de rótulo, cor e emoji: a apresentação vem da tabela ROTULOS de cada
+app na hora de renderizar. A coleção guarda as colunas em arrays e só monta
+um ResultadoTweet quando alguém acessa a linha.
+
+Gráficos, agregação e banco leem as colunas como arrays NumPy sem cópia
+(np.frombuffer sobre o buffer dos arrays), sem reconverter linha → coluna.
+"""
+
+import base64
+import json
+import sys
+from array import array
+from datetime import datetime
+
+import numpy as np
+
+from agregador import AgregadorSentimentos
+
+_SEM_PALAVRAS = ()
+
+# Colunas numéricas e seus typecodes (o de scores depende da coleção)
+COLUNAS_NUMERICAS = {
+    'codigos': 'b',
+    'scores': None,
+    'usuarios': 'I',
+    'likes': 'I',
+    'retweets': 'I',
+    'instantes': 'd',
+}
+
+
+class ResultadoTweet:
+    """Uma linha da coleção (montada sob demanda)"""
+
+    __slots__ = ('texto', 'codigo', 'score', 'palavras', 'usuario', 'likes', 'retweets', 'instante')
+
+    def __init__(self, texto, codigo, score, palavras=_SEM_PALAVRAS, usuario=0, likes=0, retweets=0, instante=0.0):
+        self.texto = texto
+        self.codigo = codigo
+        self.score = score
+        self.palavras = palavras
+        self.usuario = usuario
+        self.likes = likes
+        self.retweets = retweets
+        self.instante = instante
+
+    @property
+    def engajamento(self):
+        return self.likes + self.retweets
+
+    @property
+    def nome_usuario(self):
+        return f"user_{self.usuario}"
+
+    def data(self, formato="%d/%m %H:%M"):
+        return datetime.fromtimestamp(self.instante).strftime(formato)
+
+    def como_dict(self, rotulos=None):
+        """Dicionário no formato antigo; com `rotulos` inclui o texto da classe"""
+        dados = {
+            'texto': self.texto,
+            'codigo': self.codigo,
+            'score': self.score,
+            'palavras_chave': list(self.palavras),
+            'usuario': self.nome_usuario,
+            'likes': self.likes,
+            'retweets': self.retweets,
+            'data': self.data()
+        }
+        if rotulos is not None:
+            rotulo = rotulos[self.codigo]
+            dados['sentimento'] = rotulo if isinstance(rotulo, str) else rotulo[0]
+        return dados
+
+
+class ResultadosTweets:
+    """Coleção de resultados em colunas (arrays de tipo fixo)"""
+
+    __slots__ = ('textos', 'codigos', 'scores', 'palavras', 'usuarios', 'likes', 'retweets', 'instantes')
+
+    def __init__(self, tipo_score='i'):
+        # 'i' para o score inteiro do léxico, 'd' para polaridades (TextBlob)
+        self.textos = []
+        self.codigos = array('b')
+        self.scores = array(tipo_score)
+        self.palavras = []
+        self.usuarios = array('I')
+        self.likes = array('I')
+        self.retweets = array('I')
+        self.instantes = array('d')
+
+    def __len__(self):
+        return len(self.codigos)
+
+    def __getitem__(self, i):
+        return ResultadoTweet(self.textos[i], self.codigos[i], self.scores[i], self.palavras[i],
+                              self.usuarios[i], self.likes[i], self.retweets[i], self.instantes[i])
+
+    def __iter__(self):
+        for i in range(len(self.codigos)):
+            yield self[i]
+
+    @classmethod
+    def de_colunas(cls, textos, codigos, scores, palavras=None, usuarios=None, likes=None,
+                   retweets=None, instantes=None):
+        """Monta a coleção de uma vez a partir de colunas (arrays, NumPy ou listas)"""
+        tipo_score = scores.typecode if isinstance(scores, array) else (
+            'd' if np.asarray(scores).dtype.kind == 'f' else 'i')
+        resultados = cls(tipo_score)
+        quantidade = len(textos)
+        resultados.textos = list(textos)
+        resultados.palavras = ([tuple(p) if p else _SEM_PALAVRAS for p in palavras]
+                               if palavras is not None else [_SEM_PALAVRAS] * quantidade)
+        colunas = {'codigos': codigos, 'scores': scores, 'usuarios': usuarios,
+                   'likes': likes, 'retweets': retweets, 'instantes': instantes}
+        for nome, valores in colunas.items():
+            tipo = COLUNAS_NUMERICAS[nome] or tipo_score
+            if valores is None:
+                valores = np.zeros(quantidade, dtype=tipo)
+            if isinstance(valores, array) and valores.typecode == tipo:
+                setattr(resultados, nome, valores)       # reaproveita o buffer
+            else:
+                setattr(resultados, nome, array(tipo, np.asarray(valores, dtype=tipo).tobytes()))
+        return resultados
+
+    def adicionar(self, texto, codigo, score, palavras=_SEM_PALAVRAS, usuario=0, likes=0, retweets=0, instante=0.0):
+        self.textos.append(texto)
+        self.codigos.append(codigo)
+        self.scores.append(score)
+        self.palavras.append(tuple(palavras) if palavras else _SEM_PALAVRAS)
+        self.usuarios.append(usuario)
+        self.likes.append(likes)
+        self.retweets.append(retweets)
+        self.instantes.append(instante)
+
+    def coluna(self, nome):
+        """Visão NumPy (sem cópia) de uma coluna; enquanto ela existir a coleção não cresce"""
+        valores = getattr(self, nome)
+        return np.frombuffer(valores, dtype=valores.typecode)
+
+    def engajamentos(self):
+        return self.coluna('likes').astype(np.int64) + self.coluna('retweets')
+
+    def selecionar(self, codigos=None, score_min=None, score_max=None, ordem=None, decrescente=False):
+        """Índices (NumPy) das linhas que passam no filtro, ordenados por `ordem`
+        (uma coluna numérica ou 'engajamento'; None mantém a ordem original)"""
+        scores = self.coluna('scores')
+        mascara = np.ones(len(self), dtype=bool)
+        if codigos is not None:
+            mascara &= np.isin(self.coluna('codigos'), list(codigos))
+        if score_min is not None:
+            mascara &= scores >= score_min
+        if score_max is not None:
+            mascara &= scores <= score_max
+        indices = np.flatnonzero(mascara)
+
+        if ordem is not None:
+            valores = self.engajamentos() if ordem == 'engajamento' else self.coluna(ordem)
+            valores = valores[indices].astype(np.float64)
+            # Estável nos dois sentidos: empates ficam na ordem original
+            indices = indices[np.argsort(-valores if decrescente else valores, kind='stable')]
+        return indices
+
+    def agregado(self):
+        """AgregadorSentimentos com os códigos, scores e engajamento da coleção"""
+        agregado = AgregadorSentimentos()
+        agregado.contagens = np.bincount(self.coluna('codigos') + 2, minlength=5).tolist()
+        agregado.total = len(self)
+        agregado.soma_scores = self.coluna('scores').sum().item()
+        agregado.soma_engajamento = int(self.engajamentos().sum())
+        return agregado
+
+    def como_dataframe(self, rotulos=None):
+        """DataFrame com as colunas numéricas sem reconstruir linha a linha"""
+        import pandas as pd
+
+        df = pd.DataFrame({
+            'texto': self.textos,
+            'codigo': self.coluna('codigos'),
+            'score': self.coluna('scores'),
+            'usuario': self.coluna('usuarios'),
+            'likes': self.coluna('likes'),
+            'retweets': self.coluna('retweets'),
+            'instante': self.coluna('instantes'),
+            'engajamento': self.engajamentos()
+        }, copy=False)
+        if rotulos is not None:
+            # Categórico a partir dos códigos: uma string por classe, não por linha
+            nomes = [rotulos[c] if isinstance(rotulos[c], str) else rotulos[c][0] for c in sorted(rotulos)]
+            df['sentimento'] = pd.Categorical.from_codes(self.coluna('codigos') + 2, nomes)
+        return df
+
+    def como_dicts(self, rotulos=None):
+        """Lista de dicionários no formato antigo (para exportar)"""
+        return [resultado.como_dict(rotulos) for resultado in self]
+
+    def para_json(self):
+        """Serializa em colunas: as numéricas vão como o buffer bruto em base64"""
+        dados = {
+            'tipo_score': self.scores.typecode,
+            'ordem_bytes': sys.byteorder,
+            'textos': self.textos,
+            'palavras': self.palavras
+        }
+        for nome in COLUNAS_NUMERICAS:
+            dados[nome] = base64.b64encode(getattr(self, nome)).decode('ascii')
+        return json.dumps(dados, ensure_ascii=False)
+
+    @classmethod
+    def de_json(cls, dados):
+        colunas = json.loads(dados)
+        resultados = cls(colunas['tipo_score'])
+        resultados.textos = colunas['textos']
+        resultados.palavras = [tuple(p) if p else _SEM_PALAVRAS for p in colunas['palavras']]
+        trocar_ordem = colunas.get('ordem_bytes', sys.byteorder) != sys.byteorder
+        for nome in COLUNAS_NUMERICAS:
+            valores = getattr(resultados, nome)
+            if isinstance(colunas[nome], list):
+                valores.extend(colunas[nome])       # formato antigo, em listas JSON
+            else:
+                valores.frombytes(base64.b64decode(colunas[nome]))
+                if trocar_ordem:
+                    valores.byteswap()
+        return resultados
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🔬 SELEÇÃO DE MODELO COM VALIDAÇÃO CRUZADA
+Escolhe ngram_range, max_features e alpha do pipeline CountVectorizer +
+MultinomialNB do analisador_ptbr por k-fold estratificado, em vez de olhar
+o score no próprio treino.
+
+Cada tarefa do pool é (configuração do vetorizador, fold): a matriz de
+features do fold é montada uma única vez e reaproveitada por todos os
+alphas, então nenhuma combinação repete a vetorização. A melhor
+configuração (F1 macro médio) é treinada com todos os dados e gravada como
+artefato (artefatos.py):
+
+    ANALISADOR_MODELO_PTBR=ptbr_selecionado python analisador_ptbr.py
+
+Uso:
+    python selecionar_modelo.py                    # frases de treino do analisador_ptbr
+    python selecionar_modelo.py --dados corpus.jsonl --folds 5 --workers 8
+"""
+
+import argparse
+import contextlib
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+
+import numpy as np
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.model_selection import StratifiedKFold
+from sklearn.naive_bayes import MultinomialNB
+from sklearn.pipeline import make_pipeline
+
+from artefatos import DIRETORIO_MODELOS, salvar_modelo, versao_treino
+
+# Grade de busca: o vetorizador define a matriz, o alpha só o classificador
+GRADE_VETORIZADOR = {
+    'ngram_range': [(1, 1), (1, 2), (1, 3)],
+    'max_features': [None, 50, 100, 200],
+}
+GRADE_ALPHA = [0.1, 0.5, 1.0]
+
+
+def configuracoes_vetorizador(grade=GRADE_VETORIZADOR):
+    """Todas as combinações da grade como dicts de parâmetros"""
+    nomes = list(grade)
+    return [dict(zip(nomes, valores)) for valores in product(*grade.values())]
+
+
+def carregar_dados(caminho=None, campo_texto=None, campo_rotulo='rotulo'):
+    """Textos já pré-processados e rótulos: do arquivo ou do treino do analisador_ptbr"""
+    with contextlib.redirect_stdout(sys.stderr):
+        import analisador_ptbr
+    if caminho is None:
+        return list(analisador_ptbr.textos_processados), list(analisador_ptbr.rotulos_treinamento)
+
+    from treino_streaming import exemplos
+    rotulados = [(analisador_ptbr.preprocessar_ptbr(texto), rotulo)
+                 for texto, rotulo in exemplos(caminho, campo_texto, campo_rotulo) if rotulo is not None]
+    if not rotulados:
+        raise ValueError(f"Nenhum exemplo rotulado em '{caminho}' (campo '{campo_rotulo}')")
+    textos, rotulos = zip(*rotulados)
+    return list(textos), list(rotulos)
+
+
+# ---------------------------------------------------------------- workers
+
+def _iniciar_worker(textos, rotulos, alphas):
+    global _textos, _rotulos, _alphas
+    # Dados enviados uma vez por processo, não a cada tarefa
+    _textos, _rotulos, _alphas = np.array(textos, dtype=object), np.array(rotulos), alphas
+
+
+def _avaliar_fold(tarefa):
+    """Vetoriza o fold uma vez e avalia todos os alphas sobre a mesma matriz"""
+    indice, parametros, treino, teste = tarefa
+    vetorizador = CountVectorizer(**parametros)
+    x_treino = vetorizador.fit_transform(_textos[treino])
+    x_teste = vetorizador.transform(_textos[teste])
+    y_treino, y_teste = _rotulos[treino], _rotulos[teste]
+
+    resultados = []
+    for alpha in _alphas:
+        predicoes = MultinomialNB(alpha=alpha).fit(x_treino, y_treino).predict(x_teste)
+        resultados.append((indice, alpha, accuracy_score(y_teste, predicoes),
+                           f1_score(y_teste, predicoes, average='macro', zero_division=0)))
+    return resultados
+
+
+def validar(textos, rotulos, configuracoes, alphas=GRADE_ALPHA, folds=5, workers=None, seed=42):
+    """Validação cruzada em paralelo: {(índice da configuração, alpha): (acurácias, F1s)}"""
+    classes, contagens = np.unique(rotulos, return_counts=True)
+    if len(classes) < 2 or contagens.min() < 2:
+        raise ValueError(f"Validação cruzada precisa de 2 classes com pelo menos 2 exemplos cada "
+                         f"(contagens: {dict(zip(classes.tolist(), contagens.tolist()))})")
+    # Cada fold precisa de pelo menos um exemplo de cada classe
+    folds = max(2, min(folds, int(contagens.min())))
+    divisao = StratifiedKFold(n_splits=folds, shuffle=True, random_state=seed)
+    particoes = list(divisao.split(textos, rotulos))
+    tarefas = [(indice, parametros, treino, teste)
+               for indice, parametros in enumerate(configuracoes) for treino, teste in particoes]
+
+    metricas = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_iniciar_worker,
+                             initargs=(textos, rotulos, alphas)) as executor:
+        for resultados in executor.map(_avaliar_fold, tarefas):
+            for indice, alpha, acuracia, f1 in resultados:
+                acuracias, f1s = metricas.setdefault((indice, alpha), ([], []))
+                acuracias.append(acuracia)
+                f1s.append(f1)
+    return metricas, folds, len(tarefas)
+
+
+def selecionar(textos, rotulos, nome='ptbr_selecionado', folds=5, workers=None, seed=42,
+               diretorio=DIRETORIO_MODELOS):
+    configuracoes = configuracoes_vetorizador()
+    inicio = time.perf_counter()
+    metricas, folds, vetorizacoes = validar(textos, rotulos, configuracoes, GRADE_ALPHA, folds, workers, seed)
+    duracao = time.perf_counter() - inicio
+
+    # Melhor F1 médio; empate → maior acurácia → a configuração mais simples (primeira da grade)
+    ranking = sorted(metricas.items(),
+                     key=lambda item: (-np.mean(item[1][1]), -np.mean(item[1][0]), item[0]))
+    print(f"\n🔬 {len(configuracoes)} vetorizadores × {len(GRADE_ALPHA)} alphas × {folds} folds "
+          f"em {duracao:.2f}s | {vetorizacoes} vetorizações (sem cache seriam "
+          f"{vetorizacoes * len(GRADE_ALPHA)})")
+    print(f"   {'ngram':<7} | {'max_feat':>8} | {'alpha':>5} | {'F1 macro':>15} | {'acurácia':>8}")
+    for (indice, alpha), (acuracias, f1s) in ranking[:10]:
+        parametros = configuracoes[indice]
+        print(f"   {str(parametros['ngram_range']):<7} | {str(parametros['max_features']):>8} | {alpha:>5} | "
+              f"{np.mean(f1s):>7.3f} ± {np.std(f1s):.3f} | {np.mean(acuracias):>8.1%}")
+
+    (indice, alpha), (acuracias, f1s) = ranking[0]
+    parametros = configuracoes[indice]
+    modelo = make_pipeline(CountVectorizer(**parametros), MultinomialNB(alpha=alpha))
+    modelo.fit(textos, rotulos)
+
+    versao = versao_treino(textos, rotulos, dict(parametros, alpha=alpha))
+    destino = salvar_modelo(modelo, nome, versao, diretorio, parametros=dict(parametros, alpha=alpha),
+                            validacao={'folds': folds, 'f1_macro': float(np.mean(f1s)),
+                                       'acuracia': float(np.mean(acuracias)), 'exemplos': len(textos)})
+    print(f"\n🏆 Melhor: {parametros} alpha={alpha} → {destino}")
+    print(f"   use com ANALISADOR_MODELO_PTBR={nome}")
+    return modelo
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Validação cruzada em paralelo e seleção do modelo PT-BR")
+    parser.add_argument("--dados", help="JSONL/CSV rotulado (padrão: frases de treino do analisador_ptbr)")
+    parser.add_argument("--campo-texto", help="coluna com o texto (padrão: texto/full_text/text)")
+    parser.add_argument("--campo-rotulo", default="rotulo", help="coluna com o rótulo (0/1 ou positivo/negativo)")
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=None, help="processos (padrão: todos os núcleos)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--nome", default="ptbr_selecionado", help="nome do artefato em modelos/")
+    parser.add_argument("--diretorio", default=DIRETORIO_MODELOS)
+    args = parser.parse_args(argumentos)
+
+    textos, rotulos = carregar_dados(args.dados, args.campo_texto, args.campo_rotulo)
+    print(f"📚 {len(textos)} exemplos ({sum(rotulos)} positivos, {len(rotulos) - sum(rotulos)} negativos)")
+    selecionar(textos, rotulos, args.nome, args.folds, args.workers, args.seed, args.diretorio)
+
+
+if __name__ == "__main__":
+    main()
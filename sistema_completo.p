@@ -7,9 +7,19 @@ import plotly.express as px
 import plotly.graph_objects as go
 import json
 import sqlite3
-from datetime import datetime, timedelta
+from datetime import datetime
 import random
+import numpy as np
 import os
+import time
+
+from agregador import CATEGORIAS
+from cache import cache_nomeado
+from comparacao import em_paralelo, mostrar_comparacao
+from lexico import LexicoCompilado, classificar, MUITO_POSITIVO, POSITIVO, NEUTRO, NEGATIVO, MUITO_NEGATIVO
+from paginacao import escapar, mostrar_resultados
+from recursos_streamlit import dados, medir_execucao, mostrar_estatisticas, recurso
+from resultados import ResultadosTweets
 
 # Configuração da página
 st.set_page_config(
@@ -88,13 +98,9 @@ class DatabaseManager:
         conn.commit()
         conn.close()
     
-    def salvar_analise(self, topico, tweets, resultados):
+    def salvar_analise(self, topico, tweets, agregado):
         """Salva uma análise no banco de dados"""
-        total_positivo = sum(1 for t in tweets if "POSITIVO" in t['sentimento'])
-        total_negativo = sum(1 for t in tweets if "NEGATIVO" in t['sentimento'])
-        total_neutro = sum(1 for t in tweets if "NEUTRO" in t['sentimento'])
-        
-        sentimento_geral = "POSITIVO" if total_positivo > total_negativo else "NEGATIVO" if total_negativo > total_positivo else "NEUTRO"
+        resumo = agregado.resumo()
         
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
@@ -103,7 +109,8 @@ class DatabaseManager:
             INSERT INTO analises 
             (topico, total_tweets, positivos, negativos, neutros, sentimento_geral, dados_tweets)
             VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (topico, len(tweets), total_positivo, total_negativo, total_neutro, sentimento_geral, json.dumps(tweets)))
+        ''', (topico, resumo['total_tweets'], resumo['positivos'], resumo['negativos'], resumo['neutros'],
+              resumo['sentimento_geral'], tweets.para_json()))
         
         conn.commit()
         conn.close()
@@ -133,11 +140,19 @@ class DatabaseManager:
                 'negativos': row[5],
                 'neutros': row[6],
                 'sentimento_geral': row[7],
-                'tweets': json.loads(row[8]) if row[8] else []
+                'tweets': self._carregar_tweets(row[8])
             })
         
         return historico
     
+    def _carregar_tweets(self, dados):
+        """Lê as colunas compactas (ou a lista de dicionários de análises antigas)"""
+        if not dados:
+            return ResultadosTweets()
+        if dados.lstrip().startswith('['):
+            return json.loads(dados)
+        return ResultadosTweets.de_json(dados)
+    
     def obter_estatisticas(self):
         """Obtém estatísticas gerais"""
         conn = sqlite3.connect(self.db_path)
@@ -161,6 +176,15 @@ class DatabaseManager:
         }
 
 class SistemaAnaliseCompleto:
+    # Rótulo, cor e emoji de cada classe de sentimento
+    ROTULOS = {
+        MUITO_POSITIVO: ("😍 MUITO POSITIVO", "#00b894", "🟢"),
+        POSITIVO: ("😊 POSITIVO", "#00cec9", "🟢"),
+        NEUTRO: ("😐 NEUTRO", "#fdcb6e", "🟡"),
+        NEGATIVO: ("😠 NEGATIVO", "#e17055", "🔴"),
+        MUITO_NEGATIVO: ("🤬 MUITO NEGATIVO", "#d63031", "🔴"),
+    }
+
     def __init__(self):
         self.db = DatabaseManager()
         self.topicos_populares = {
@@ -192,6 +216,11 @@ class SistemaAnaliseCompleto:
             'catástrofe': 3, 'desastre': 2, 'pessimo': 2, 'horrivel': 2,
             'medíocre': 2, 'lamentável': 2, 'ridículo': 2, 'insuportável': 2
         }
+        
+        self.lexico = LexicoCompilado(
+            self.palavras_positivas, self.palavras_negativas,
+            cache=cache_nomeado("sistema_completo.SistemaAnaliseCompleto")
+        )
 
     def _gerar_tweets_tecnologia(self):
         return [
@@ -306,57 +335,134 @@ class SistemaAnaliseCompleto:
         ]
 
     def analisar_sentimento(self, texto):
-        texto = texto.lower()
-        score = 0
-        palavras_detectadas = []
-        
-        for palavra in texto.split():
-            if palavra in self.palavras_positivas:
-                score += self.palavras_positivas[palavra]
-                palavras_detectadas.append(f"➕{palavra}")
-            elif palavra in self.palavras_negativas:
-                score += self.palavras_negativas[palavra]
-                palavras_detectadas.append(f"➖{palavra}")
-        
-        if score >= 3:
-            return "😍 MUITO POSITIVO", score, palavras_detectadas, "#00b894", "🟢"
-        elif score >= 1:
-            return "😊 POSITIVO", score, palavras_detectadas, "#00cec9", "🟢"
-        elif score <= -3:
-            return "🤬 MUITO NEGATIVO", score, palavras_detectadas, "#d63031", "🔴"
-        elif score <= -1:
-            return "😠 NEGATIVO", score, palavras_detectadas, "#e17055", "🔴"
-        else:
-            return "😐 NEUTRO", score, palavras_detectadas, "#fdcb6e", "🟡"
+        score, palavras_detectadas = self.lexico.analisar(texto)
+        sentimento, cor, emoji = self.ROTULOS[classificar(score)]
+        return sentimento, score, palavras_detectadas, cor, emoji
 
-    def buscar_tweets_simulados(self, topico, quantidade=12):
+    def pontuar_corpus(self, topico):
+        """Todos os tweets do tópico e o lote pontuado pelo léxico"""
         if topico in self.topicos_populares:
             base = self.topicos_populares[topico]
         else:
             base = list(self.topicos_populares.values())[0]
-        
-        tweets = random.sample(base, min(quantidade, len(base)))
-        
-        tweets_com_dados = []
-        for texto in tweets:
-            sentimento, score, palavras, cor, emoji = self.analisar_sentimento(texto)
-            tweets_com_dados.append({
-                'texto': texto,
-                'sentimento': sentimento,
-                'score': score,
-                'palavras_chave': palavras[:3],
-                'cor': cor,
-                'emoji': emoji,
-                'usuario': f'user_{random.randint(1000, 9999)}',
-                'likes': random.randint(0, 500),
-                'retweets': random.randint(0, 100),
-                'data': (datetime.now() - timedelta(hours=random.randint(1, 24))).strftime("%d/%m %H:%M")
-            })
-        
-        return tweets_com_dados
+        return base, self.lexico.analisar_lote(base, com_palavras=True)
+
+    def analisar_todos(self, quantidade=12, corpora=None):
+        """Amostra de cada tópico: {tópico: ResultadosTweets} (corpora: {tópico: corpus pontuado})"""
+        if corpora is None:
+            corpora = em_paralelo(self.pontuar_corpus, self.topicos_populares)
+        return {topico: self.buscar_tweets_simulados(topico, quantidade, corpus) for topico, corpus in corpora.items()}
+
+    def buscar_tweets_simulados(self, topico, quantidade=12, corpus=None):
+        """Amostra do corpus pontuado (corpus: o de pontuar_corpus, ex.: vindo do cache)"""
+        base, lote = corpus or self.pontuar_corpus(topico)
+        indices = random.sample(range(len(base)), min(quantidade, len(base)))
+        
+        # Lote em colunas: scores e códigos do léxico entram sem cópia; rótulo,
+        # cor e emoji saem de ROTULOS só na hora de exibir
+        n = len(indices)
+        rng = np.random.default_rng()
+        horas = rng.integers(1, 25, n)
+        return ResultadosTweets.de_colunas(
+            [base[i] for i in indices], np.asarray(lote.rotulos)[indices], np.asarray(lote.scores)[indices],
+            palavras=[lote.palavras[i][:3] for i in indices],
+            usuarios=rng.integers(1000, 10000, n),
+            likes=rng.integers(0, 501, n),
+            retweets=rng.integers(0, 101, n),
+            instantes=datetime.now().timestamp() - horas * 3600.0
+        )
+
+# Corpus pontuado de cada tópico vale por 10 minutos; histórico e
+# estatísticas do banco por 1 minuto (e são limpos a cada análise salva)
+TTL_CORPUS = 600
+TTL_BANCO = 60
+
+# Opção do selectbox que compara todos os tópicos lado a lado
+TODOS = "🧭 Todos os tópicos (comparação)"
+
+@recurso
+def obter_sistema():
+    """Sistema (tópicos, léxico e DatabaseManager) criado uma vez por processo"""
+    return SistemaAnaliseCompleto()
+
+@dados(ttl=TTL_CORPUS)
+def corpus_pontuado(topico):
+    return obter_sistema().pontuar_corpus(topico)
+
+def cartao_tweet(tweet, numero):
+    """HTML do cartão de um tweet analisado"""
+    sentimento, cor, emoji = SistemaAnaliseCompleto.ROTULOS[tweet.codigo]
+    return f"""
+    <div class="tweet-card" style="border-left-color: {cor}">
+        <div style="display: flex; justify-content: space-between; align-items: start;">
+            <div style="flex: 1;">
+                <h4 style="margin: 0; color: #2d3436;">{escapar(tweet.texto)}</h4>
+                <div style="margin-top: 8px;">
+                    <small>👤 @{tweet.nome_usuario} | 📅 {tweet.data()}</small>
+                    <br>
+                    <small>❤️ {tweet.likes} likes | 🔄 {tweet.retweets} retweets</small>
+                    {f'<br><small>🔍 <strong>Palavras-chave:</strong> {", ".join(tweet.palavras)}</small>' if tweet.palavras else ''}
+                </div>
+            </div>
+            <div style="text-align: right; min-width: 120px;">
+                <div style="background: {cor}15; padding: 10px; border-radius: 8px; border: 2px solid {cor}30;">
+                    <strong style="color: {cor};">{emoji} {sentimento}</strong>
+                    <br>
+                    <small>Score: {tweet.score}</small>
+                </div>
+            </div>
+        </div>
+    </div>
+    """
+
+@dados(ttl=TTL_CORPUS)
+def corpora_pontuados():
+    """Corpus de todos os tópicos pontuado ao mesmo tempo (uma thread por tópico)"""
+    sistema = obter_sistema()
+    return em_paralelo(sistema.pontuar_corpus, sistema.topicos_populares)
+
+@dados(ttl=TTL_CORPUS)
+def graficos_distribuicao(detalhado, positivos, negativos, neutros):
+    """Gráficos de barras e pizza (dicts do plotly) por contagens: montar com o
+    plotly express custa mais que o resto do rerun"""
+    df = pd.DataFrame({
+        'Categoria': CATEGORIAS,
+        'Quantidade': list(detalhado)
+    })
+    
+    fig = px.bar(df, x='Categoria', y='Quantidade', 
+               color='Categoria',
+               color_discrete_map={
+                   'Muito Positivo': '#00b894',
+                   'Positivo': '#00cec9', 
+                   'Neutro': '#fdcb6e',
+                   'Negativo': '#e17055',
+                   'Muito Negativo': '#d63031'
+               })
+    
+    fig_pizza = px.pie(
+        names=['Positivos', 'Negativos', 'Neutros'],
+        values=[positivos, negativos, neutros],
+        color=['Positivos', 'Negativos', 'Neutros'],
+        color_discrete_map={
+            'Positivos': '#00b894',
+            'Negativos': '#e17055',
+            'Neutros': '#fdcb6e'
+        }
+    )
+    fig_pizza.update_traces(textposition='inside', textinfo='percent+label')
+    return fig.to_dict(), fig_pizza.to_dict()
+
+@dados(ttl=TTL_BANCO)
+def historico_banco(limite):
+    return obter_sistema().db.obter_historico(limite)
+
+@dados(ttl=TTL_BANCO)
+def estatisticas_banco():
+    return obter_sistema().db.obter_estatisticas()
 
 def main():
-    sistema = SistemaAnaliseCompleto()
+    sistema = obter_sistema()
     
     # Header premium
     st.markdown('<h1 class="main-header">🤖 SISTEMA COMPLETO DE ANÁLISE</h1>', unsafe_allow_html=True)
@@ -373,7 +479,7 @@ def main():
         with aba_principal:
             topico = st.selectbox(
                 "Selecione o tópico:",
-                list(sistema.topicos_populares.keys())
+                list(sistema.topicos_populares.keys()) + [TODOS]
             )
             
             quantidade = st.slider("Tweets para analisar:", 8, 20, 12)
@@ -382,10 +488,12 @@ def main():
                 st.session_state.analisar = True
                 st.session_state.topico = topico
                 st.session_state.quantidade = quantidade
+                st.session_state.tweets = None      # nova análise: sorteia e salva de novo
+                st.session_state.comparacao = None
         
         with aba_historico:
             st.subheader("📜 Últimas Análises")
-            historico = sistema.db.obter_historico(5)
+            historico = historico_banco(5)
             
             if historico:
                 for analise in historico:
@@ -397,29 +505,52 @@ def main():
         
         with aba_estatisticas:
             st.subheader("📊 Estatísticas Gerais")
-            stats = sistema.db.obter_estatisticas()
+            stats = estatisticas_banco()
             
             st.metric("Total de Análises", stats['total_analises'])
             st.metric("Tópicos Únicos", stats['topicos_unicos'])
             st.metric("Tweets Analisados", stats['total_tweets'])
+        
+        mostrar_estatisticas()
     
     # Conteúdo principal
-    if st.session_state.get('analisar', False):
+    if st.session_state.get('analisar', False) and st.session_state.topico == TODOS:
+        with st.spinner("🧭 Analisando todos os tópicos..."):
+            # Sorteio e gravação só no clique, como na análise de um tópico
+            if st.session_state.get('comparacao') is None:
+                inicio = time.perf_counter()
+                resultados = sistema.analisar_todos(st.session_state.quantidade, corpora_pontuados())
+                segundos = time.perf_counter() - inicio
+                for topico, tweets in resultados.items():
+                    sistema.db.salvar_analise(topico, tweets, tweets.agregado())
+                st.session_state.comparacao = (resultados, segundos)
+                historico_banco.clear()
+                estatisticas_banco.clear()
+        mostrar_comparacao(*st.session_state.comparacao)
+    
+    elif st.session_state.get('analisar', False):
         topico = st.session_state.topico
         quantidade = st.session_state.quantidade
         
         with st.spinner("🔍 Analisando sentimentos..."):
-            tweets = sistema.buscar_tweets_simulados(topico, quantidade)
+            # Sorteio e gravação só no clique; os reruns reaproveitam a análise da sessão
+            tweets = st.session_state.get('tweets')
+            if tweets is None:
+                tweets = sistema.buscar_tweets_simulados(topico, quantidade, corpus_pontuado(topico))
+                sistema.db.salvar_analise(topico, tweets, tweets.agregado())
+                st.session_state.tweets = tweets
+                historico_banco.clear()
+                estatisticas_banco.clear()
             
-            # Salvar no banco de dados
-            sistema.db.salvar_analise(topico, tweets, {})
+            # Uma única passada conta todas as categorias
+            agregado = tweets.agregado()
             
             # Métricas premium
             st.subheader(f"📊 Análise: {topico}")
             
-            total_positivo = sum(1 for t in tweets if "POSITIVO" in t['sentimento'])
-            total_negativo = sum(1 for t in tweets if "NEGATIVO" in t['sentimento'])
-            total_neutro = sum(1 for t in tweets if "NEUTRO" in t['sentimento'])
+            total_positivo = agregado.positivos
+            total_negativo = agregado.negativos
+            total_neutro = agregado.neutros
             
             # Grid de métricas
             col1, col2, col3, col4 = st.columns(4)
@@ -429,7 +560,7 @@ def main():
                 <div class="premium-card positive-card">
                     <h3>😊 Positivos</h3>
                     <h2 style="color: #00b894;">{total_positivo}</h2>
-                    <p>{total_positivo/len(tweets)*100:.1f}% do total</p>
+                    <p>{agregado.percentual(total_positivo):.1f}% do total</p>
                 </div>
                 """, unsafe_allow_html=True)
             
@@ -438,7 +569,7 @@ def main():
                 <div class="premium-card negative-card">
                     <h3>😠 Negativos</h3>
                     <h2 style="color: #e17055;">{total_negativo}</h2>
-                    <p>{total_negativo/len(tweets)*100:.1f}% do total</p>
+                    <p>{agregado.percentual(total_negativo):.1f}% do total</p>
                 </div>
                 """, unsafe_allow_html=True)
             
@@ -447,13 +578,15 @@ def main():
                 <div class="premium-card neutral-card">
                     <h3>😐 Neutros</h3>
                     <h2 style="color: #fdcb6e;">{total_neutro}</h2>
-                    <p>{total_neutro/len(tweets)*100:.1f}% do total</p>
+                    <p>{agregado.percentual(total_neutro):.1f}% do total</p>
                 </div>
                 """, unsafe_allow_html=True)
             
             with col4:
-                sentimento_geral = "😊 Positivo" if total_positivo > total_negativo else "😠 Negativo" if total_negativo > total_positivo else "😐 Neutro"
-                cor_geral = "#00b894" if total_positivo > total_negativo else "#e17055" if total_negativo > total_positivo else "#fdcb6e"
+                sentimento_geral, cor_geral = {
+                    POSITIVO: ("😊 Positivo", "#00b894"),
+                    NEGATIVO: ("😠 Negativo", "#e17055"),
+                }.get(agregado.sentimento_geral(), ("😐 Neutro", "#fdcb6e"))
                 st.markdown(f"""
                 <div class="premium-card" style="border-left-color: {cor_geral}">
                     <h3>🎭 Sentimento Geral</h3>
@@ -462,78 +595,28 @@ def main():
                 </div>
                 """, unsafe_allow_html=True)
             
-            # Visualizações
+            # Visualizações (em cache pelas contagens: iguais em todo rerun)
+            fig, fig_pizza = graficos_distribuicao(tuple(agregado.detalhado()), total_positivo,
+                                                   total_negativo, total_neutro)
             st.markdown("---")
             col1, col2 = st.columns(2)
             
             with col1:
                 st.subheader("📈 Distribuição de Sentimentos")
                 
-                df = pd.DataFrame({
-                    'Categoria': ['Muito Positivo', 'Positivo', 'Neutro', 'Negativo', 'Muito Negativo'],
-                    'Quantidade': [
-                        sum(1 for t in tweets if "MUITO POSITIVO" in t['sentimento']),
-                        sum(1 for t in tweets if t['sentimento'] == "😊 POSITIVO"),
-                        sum(1 for t in tweets if t['sentimento'] == "😐 NEUTRO"),
-                        sum(1 for t in tweets if t['sentimento'] == "😠 NEGATIVO"),
-                        sum(1 for t in tweets if "MUITO NEGATIVO" in t['sentimento'])
-                    ]
-                })
-                
-                fig = px.bar(df, x='Categoria', y='Quantidade', 
-                           color='Categoria',
-                           color_discrete_map={
-                               'Muito Positivo': '#00b894',
-                               'Positivo': '#00cec9', 
-                               'Neutro': '#fdcb6e',
-                               'Negativo': '#e17055',
-                               'Muito Negativo': '#d63031'
-                           })
                 st.plotly_chart(fig, use_container_width=True)
             
             with col2:
                 st.subheader("🎯 Análise Detalhada")
                 
-                fig_pizza = px.pie(
-                    names=['Positivos', 'Negativos', 'Neutros'],
-                    values=[total_positivo, total_negativo, total_neutro],
-                    color=['Positivos', 'Negativos', 'Neutros'],
-                    color_discrete_map={
-                        'Positivos': '#00b894',
-                        'Negativos': '#e17055',
-                        'Neutros': '#fdcb6e'
-                    }
-                )
-                fig_pizza.update_traces(textposition='inside', textinfo='percent+label')
                 st.plotly_chart(fig_pizza, use_container_width=True)
             
             # Tweets individuais
             st.markdown("---")
             st.subheader(f"🐦 Análise Individual dos Tweets")
             
-            for i, tweet in enumerate(tweets, 1):
-                st.markdown(f"""
-                <div class="tweet-card" style="border-left-color: {tweet['cor']}">
-                    <div style="display: flex; justify-content: space-between; align-items: start;">
-                        <div style="flex: 1;">
-                            <h4 style="margin: 0; color: #2d3436;">{tweet['texto']}</h4>
-                            <div style="margin-top: 8px;">
-                                <small>👤 @{tweet['usuario']} | 📅 {tweet['data']}</small>
-                                <br>
-                                <small>❤️ {tweet['likes']} likes | 🔄 {tweet['retweets']} retweets</small>
-                                {f'<br><small>🔍 <strong>Palavras-chave:</strong> {", ".join(tweet["palavras_chave"])}</small>' if tweet['palavras_chave'] else ''}
-                            </div>
-                        </div>
-                        <div style="text-align: right; min-width: 120px;">
-                            <div style="background: {tweet['cor']}15; padding: 10px; border-radius: 8px; border: 2px solid {tweet['cor']}30;">
-                                <strong style="color: {tweet['cor']};">{tweet['emoji']} {tweet['sentimento']}</strong>
-                                <br>
-                                <small>Score: {tweet['score']}</small>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+            # Só a página visível vai para o navegador, em um bloco HTML
+            mostrar_resultados(tweets, sistema.ROTULOS, cartao_tweet, chave="analise")
     
     else:
         # Tela inicial premium
@@ -584,4 +667,5 @@ if __name__ == "__main__":
     if 'analisar' not in st.session_state:
         st.session_state.analisar = False
     
-    main()
\ No newline at end of file
+    with medir_execucao():
+        main()
\ No newline at end of file
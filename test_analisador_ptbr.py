@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🧪 TESTES DO ANALISADOR PT-BR
+Lote e frase única dão o mesmo resultado; lote vazio não chega ao sklearn.
+"""
+
+import contextlib
+import io
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import analisador_ptbr
+
+
+def test_lote_vazio():
+    assert analisador_ptbr.analisar_lote_ptbr([]) == []
+    assert analisador_ptbr.analisar_lote_ptbr(iter([])) == []
+
+
+def test_lote_igual_a_frase_unica():
+    frases = ["achei top demais show de bola", "produto fantástico sensacionalmente ruim", "golpe completo furada"]
+    for frase, (sentimento, confianca, palavras) in zip(frases, analisador_ptbr.analisar_lote_ptbr(frases)):
+        detalhado = analisador_ptbr.analisar_detalhado_ptbr(frase)
+        assert (sentimento, palavras) == (detalhado[0], detalhado[2])
+        assert abs(confianca - detalhado[1]) < 1e-9
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🧪 TESTES DOS ARTEFATOS DE MODELO
+O pipeline carregado do disco (vocabulário em array de largura fixa) tem
+que dar as mesmas probabilidades do pipeline treinado em memória.
+"""
+
+import numpy as np
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.naive_bayes import MultinomialNB
+from sklearn.pipeline import make_pipeline
+
+import artefatos
+
+TEXTOS = ["produto fantástico", "sensacional demais", "atendimento excelente",
+          "muito ruim", "péssimo e decepcionante", "entrega horrível"]
+ROTULOS = [1, 1, 1, 0, 0, 0]
+
+
+def test_carregado_igual_ao_treinado_com_termos_longos_e_desconhecidos(tmp_path):
+    treinado = make_pipeline(CountVectorizer(), MultinomialNB()).fit(TEXTOS, ROTULOS)
+    artefatos.salvar_modelo(treinado, "teste", "v1", diretorio=str(tmp_path))
+    carregado = artefatos.carregar_modelo("teste", diretorio=str(tmp_path))
+
+    frases = ["fantástico sensacionalzzz", "produto fantástico sensacionalmente ruim",
+              "decepcionantemente", "palavra desconhecida", "", "sensacional"]
+    np.testing.assert_array_equal(carregado.predict_proba(frases), treinado.predict_proba(frases))
+    np.testing.assert_array_equal(carregado[0].transform(frases).toarray(),
+                                  treinado[0].transform(frases).toarray())
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🧪 TESTES DO REGISTRO DE BACKENDS
+O contrato de analisar_lote vale igual para todos os backends disponíveis.
+"""
+
+import pytest
+
+import backends
+
+
+@pytest.mark.parametrize("nome", backends.disponiveis())
+def test_lote_vazio(nome):
+    lote = backends.obter(nome).analisar_lote([])
+    assert len(lote.scores) == 0 and len(lote.rotulos) == 0
+
+
+@pytest.mark.parametrize("nome", [nome for nome in ('nb_ptbr', 'nb_ml') if nome in backends.disponiveis()])
+def test_naive_bayes_sem_evidencia_e_neutro(nome):
+    lote = backends.obter(nome).analisar_lote(["", "xyzzy qwerty", "adorei muito", "odiei horrível"])
+    assert list(lote.rotulos) == [backends.NEUTRO, backends.NEUTRO, backends.POSITIVO, backends.NEGATIVO]
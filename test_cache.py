@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🧪 TESTES DO CACHE LRU
+Acertos, remoção do mais antigo e troca de versão, inclusive no meio de um
+cálculo.
+"""
+
+from cache import CacheLRU
+
+
+def test_acerto_e_remocao_do_mais_antigo():
+    cache = CacheLRU(capacidade=2, versao="v1")
+    for texto in ("a", "b", "a", "c"):
+        cache.obter(texto, str.upper, versao="v1")
+    assert cache.obter("a", lambda texto: "recalculado", versao="v1") == "A"
+    assert cache.obter("b", lambda texto: "recalculado", versao="v1") == "recalculado"
+    assert cache.estatisticas()['remocoes'] == 2
+
+
+def test_nova_versao_esvazia():
+    cache = CacheLRU(versao="v1")
+    cache.obter("texto", lambda texto: "v1", versao="v1")
+    assert cache.obter("texto", lambda texto: "v2", versao="v2") == "v2"
+    assert cache.estatisticas()['invalidacoes'] == 1
+
+
+def test_invalidado_durante_o_calculo_nao_guarda():
+    cache = CacheLRU(versao="v1")
+
+    def calcular(texto):
+        cache.invalidar("v2")       # outra thread trocou o léxico no meio da análise
+        return "resultado da v1"
+
+    assert cache.obter("texto", calcular, versao="v1") == "resultado da v1"
+    assert len(cache) == 0
+    assert cache.obter("texto", lambda texto: "resultado da v2", versao="v2") == "resultado da v2"
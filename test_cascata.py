@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🧪 TESTES DA PONTUAÇÃO EM CASCATA
+O score de cada texto tem o sinal do código, decida o léxico ou o modelo.
+"""
+
+import pytest
+
+import backends
+import cascata
+
+TEXTOS = ["golpe amei", "ruim", "triste feliz show", "", "xyzzy qwerty",
+          "amei adorei perfeito maravilhoso", "péssimo horrível odiei lixo", "produto chegou hoje"]
+
+
+def sinal(valor):
+    return (valor > 0) - (valor < 0)
+
+
+def test_sinal_do_score_igual_ao_do_codigo():
+    lote = backends.obter('cascata').analisar_lote(TEXTOS)
+    assert len(lote) == len(TEXTOS)
+    for texto, score, codigo in zip(TEXTOS, lote.scores, lote.rotulos):
+        assert sinal(score) == sinal(codigo), texto
+
+
+def test_comparar_sem_textos():
+    with pytest.raises(ValueError, match="Nenhum texto"):
+        cascata.comparar([])
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🧪 TESTES DA COLETA EM MASSA
+Contra a APILocal: paginação sem repetidos e retomada sem perder tweets
+quando a meta corta a coleta antes do checkpoint anterior.
+"""
+
+import coleta
+
+
+def ids(paginas):
+    return [tweet['id'] for pagina in paginas for tweet in pagina]
+
+
+def test_segue_max_id_sem_repetidos():
+    api = coleta.APILocal(quantidade=1000)
+    estatisticas = {}
+    coletados = ids(coleta.coletar_paginas(api, "marca", estatisticas=estatisticas))
+    assert sorted(coletados) == sorted(api._ids) and len(set(coletados)) == len(coletados)
+    assert estatisticas['completa'] and estatisticas['duplicados'] > 0
+
+
+def test_meta_menor_que_o_acumulado_completa_a_lacuna(tmp_path):
+    api = coleta.APILocal(quantidade=500)
+    caminho = str(tmp_path / "estado.json")
+    ids(coleta.coletar(api, "marca", estado=coleta.EstadoColeta(caminho)))
+    checkpoint = coleta.EstadoColeta(caminho).ultimo_id("marca")
+    assert checkpoint == api._ids[-1]
+
+    api.publicar(500)
+    primeira = ids(coleta.coletar(api, "marca", meta=300, estado=coleta.EstadoColeta(caminho)))
+    assert primeira == api._ids[:-301:-1]          # os 300 mais novos
+    estado = coleta.EstadoColeta(caminho)
+    assert estado.ultimo_id("marca") == checkpoint
+    assert estado.lacuna("marca") == {'max_id': min(primeira) - 1, 'topo': max(primeira)}
+
+    api.publicar(50)
+    segunda = ids(coleta.coletar(api, "marca", meta=300, estado=coleta.EstadoColeta(caminho)))
+    novos = [id_ for id_ in api._ids if id_ > checkpoint]
+    assert sorted(primeira + segunda) == novos and len(segunda) == 250
+    estado = coleta.EstadoColeta(caminho)
+    assert estado.ultimo_id("marca") == api._ids[-1] and estado.lacuna("marca") is None
+
+    # Nada novo: a próxima execução não traz nada
+    assert ids(coleta.coletar(api, "marca", meta=300, estado=coleta.EstadoColeta(caminho))) == []
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🧪 TESTES DAS EXPLICAÇÕES (NAIVE BAYES)
+Só termos que aparecem no texto entram na explicação, com o pipeline
+treinado em memória ou carregado do disco.
+"""
+
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.naive_bayes import MultinomialNB
+from sklearn.pipeline import make_pipeline
+
+import artefatos
+from explicacoes import ExplicadorNB
+
+TEXTOS = ["produto fantástico", "sensacional demais", "atendimento excelente",
+          "muito ruim", "péssimo e decepcionante", "entrega horrível"]
+ROTULOS = [1, 1, 1, 0, 0, 0]
+
+
+def treinado():
+    return make_pipeline(CountVectorizer(), MultinomialNB()).fit(TEXTOS, ROTULOS)
+
+
+def test_explica_com_termos_do_texto():
+    classe, probabilidade, termos = ExplicadorNB(treinado()).explicar("produto fantástico, muito fantástico")
+    assert classe == 1 and probabilidade > 0.5
+    assert termos[0][0] == "fantástico"
+
+
+def test_termo_longo_nao_credita_prefixo(tmp_path):
+    artefatos.salvar_modelo(treinado(), "teste", "v1", diretorio=str(tmp_path))
+    explicador = ExplicadorNB(artefatos.carregar_modelo("teste", diretorio=str(tmp_path)))
+
+    frases = ["fantástico sensacionalmente", "decepcionantemente ruim"]
+    for frase, (_, _, termos) in zip(frases, explicador.explicar_lote(frases)):
+        assert {termo for termo, _ in termos} <= set(frase.split())
+    assert explicador.explicar_lote(frases) == ExplicadorNB(treinado()).explicar_lote(frases)
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🧪 TESTES DA SELEÇÃO DE MODELO
+Classes pequenas demais para o k-fold estratificado dão um erro claro.
+"""
+
+import pytest
+
+import selecionar_modelo
+
+TEXTOS = ["adorei o produto", "muito bom mesmo", "excelente compra", "odiei tudo", "péssimo atendimento"]
+CONFIGURACOES = [{'ngram_range': (1, 1), 'max_features': None}]
+
+
+@pytest.mark.parametrize("rotulos", [[1, 1, 1, 1, 0], [1, 1, 1, 1, 1]])
+def test_classe_com_menos_de_dois_exemplos(rotulos):
+    with pytest.raises(ValueError, match="pelo menos 2 exemplos"):
+        selecionar_modelo.validar(TEXTOS, rotulos, CONFIGURACOES, alphas=[1.0], workers=1)
+
+
+def test_folds_limitados_pela_menor_classe():
+    metricas, folds, tarefas = selecionar_modelo.validar(TEXTOS, [1, 1, 1, 0, 0], CONFIGURACOES,
+                                                         alphas=[1.0], workers=1)
+    assert folds == 2 and tarefas == 2
+    assert len(metricas[(0, 1.0)][0]) == 2
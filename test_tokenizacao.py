@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🧪 TESTES DA TOKENIZAÇÃO COMPARTILHADA
+AnalisadorTokens gera os mesmos termos do CountVectorizer e o cache por
+texto só entra quando pedido.
+"""
+
+import pytest
+from sklearn.feature_extraction.text import CountVectorizer
+
+import tokenizacao
+
+FRASES = ["", "a", "Show de bola!", "top demais, nota dez", "não comprem: dinheiro jogado fora #golpe",
+          "o produto chegou e é ótimo ótimo ótimo"]
+
+
+@pytest.mark.parametrize("ngram_range", [(1, 1), (1, 2), (1, 3), (2, 2), (2, 4)])
+def test_mesmos_termos_do_count_vectorizer(ngram_range):
+    sklearn = CountVectorizer(ngram_range=ngram_range).build_analyzer()
+    analisador = tokenizacao.AnalisadorTokens(ngram_range)
+    for frase in FRASES:
+        assert analisador(frase) == sklearn(tokenizacao.tokenizar(frase).sem_pontuacao)
+
+
+def test_cache_opcional():
+    tokenizacao.limpar_cache()
+    assert tokenizacao.tokenizar("tweet repetido") is not tokenizacao.tokenizar("tweet repetido")
+    primeiro = tokenizacao.tokenizar("tweet repetido", cache=True)
+    assert tokenizacao.tokenizar_lote(["tweet repetido"], cache=True)[0] is primeiro
+    assert tokenizacao.tokenizar_lote([primeiro])[0] is primeiro
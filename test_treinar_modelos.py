@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🧪 TESTES DO TREINAMENTO DOS MODELOS
+--diretorio grava os artefatos na pasta pedida, não só na padrão.
+"""
+
+import os
+
+import artefatos
+import treinar_modelos
+
+
+def test_grava_no_diretorio_pedido(tmp_path, capsys):
+    treinar_modelos.main(['ptbr', '--diretorio', str(tmp_path)])
+    versao = artefatos.versao_atual('ptbr', str(tmp_path))
+    assert versao and os.path.exists(tmp_path / 'ptbr' / versao / 'meta.json')
+    assert artefatos.carregar_modelo('ptbr', diretorio=str(tmp_path)) is not None
+
+    # Segunda vez: a versão já está lá
+    treinar_modelos.main(['ptbr', '--diretorio', str(tmp_path)])
+    assert "já treinada" in capsys.readouterr().out
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+✂️ TOKENIZAÇÃO ÚNICA COMPARTILHADA
+Cada texto é passado para minúsculas uma vez só e o resultado
+(TextoTokenizado) é entregue a todos os backends do mesmo lote. As variações
+que cada um precisa são "visões" derivadas do mesmo texto, calculadas na
+primeira vez que algum backend pede e reaproveitadas pelos outros:
+
+- tokens:    minúsculas + split (o que o léxico enxerga)
+- sem_ruido: sem URLs, menções e hashtags (limpar_texto do twitter_sentimentos)
+- sem_pontuacao / palavras: sem caracteres especiais (base do preprocessar_ptbr)
+
+AnalisadorTokens entra no lugar do analisador do CountVectorizer: monta os
+n-gramas direto das visões, sem rodar a regex de tokens do sklearn, e gera
+exatamente os mesmos termos. Assim uma cascata ou um ensemble (léxico +
+modelo) não paga a tokenização duas vezes.
+
+O cache por texto do processo é opcional (cache=True): só compensa quando
+os mesmos textos voltam em outras chamadas; com textos novos e um backend
+só, a contabilidade do LRU custa mais do que tokenizar de novo.
+"""
+
+import re
+
+from cache import cache_nomeado
+
+# URLs, menções e hashtags (mesma expressão do pipeline.limpar)
+_RE_RUIDO = re.compile(r'http\S+|@\w+|#\w+')
+# Tudo que não é letra, número ou espaço (mesma classe do preprocessar_ptbr)
+_RE_PONTUACAO = re.compile(r'[^\w\sáàâãéèêíïóôõöúçñ]')
+
+# Padrão do CountVectorizer que AnalisadorTokens reproduz
+TOKEN_PATTERN_PADRAO = r"(?u)\b\w\w+\b"
+
+# Muda se a tokenização mudar: invalida os caches
+VERSAO_TOKENIZACAO = "1"
+
+
+class TextoTokenizado:
+    __slots__ = ('minusculo', '_tokens', '_visoes')
+
+    def __init__(self, texto):
+        self.minusculo = texto.lower()
+        self._tokens = None
+        self._visoes = {}
+
+    @property
+    def tokens(self):
+        """Minúsculas + split (o que o léxico enxerga), só quando algum backend pede"""
+        if self._tokens is None:
+            self._tokens = self.minusculo.split()
+        return self._tokens
+
+    def visao(self, nome, derivar):
+        """Valor derivado por um backend (ex.: expressões do PT-BR), calculado uma vez por texto"""
+        valor = self._visoes.get(nome)
+        if valor is None:
+            valor = self._visoes[nome] = derivar(self)
+        return valor
+
+    @property
+    def sem_ruido(self):
+        return self.visao('sem_ruido', _sem_ruido)
+
+    @property
+    def sem_pontuacao(self):
+        """Texto sem caracteres especiais (string: os espaços do que foi removido ficam)"""
+        return self.visao('sem_pontuacao', _sem_pontuacao)
+
+    @property
+    def palavras(self):
+        return self.visao('palavras', _palavras)
+
+
+def _sem_ruido(tokenizado):
+    return _RE_RUIDO.sub('', tokenizado.minusculo).split()
+
+
+def _sem_pontuacao(tokenizado):
+    return _RE_PONTUACAO.sub('', tokenizado.minusculo)
+
+
+def _palavras(tokenizado):
+    return tokenizado.sem_pontuacao.split()
+
+
+# Chave = o próprio texto: normalizar e tirar hash custaria tanto quanto tokenizar
+_cache = cache_nomeado("tokenizacao.TextoTokenizado", chave=str)
+
+
+def tokenizar(texto, cache=False):
+    """TextoTokenizado do texto; devolve o próprio objeto se já vier tokenizado.
+    cache=True guarda no cache do processo (textos que voltam em outras chamadas)"""
+    if isinstance(texto, TextoTokenizado):
+        return texto
+    if cache:
+        return _cache.obter(texto, TextoTokenizado, versao=VERSAO_TOKENIZACAO)
+    return TextoTokenizado(texto)
+
+
+def tokenizar_lote(textos, cache=False):
+    if cache:
+        return [tokenizar(texto, cache=True) for texto in textos]
+    return [texto if isinstance(texto, TextoTokenizado) else TextoTokenizado(texto) for texto in textos]
+
+
+def limpar_cache():
+    """Esvazia o cache de tokens (ex.: para medir sem textos já vistos)"""
+    _cache.invalidar(VERSAO_TOKENIZACAO)
+
+
+def suporta_tokens(vetorizador):
+    """True se o vetorizador usa o analisador padrão de palavras que AnalisadorTokens reproduz"""
+    parametros = vetorizador.get_params()
+    return (parametros.get('analyzer') == 'word'
+            and parametros.get('token_pattern') == TOKEN_PATTERN_PADRAO
+            and parametros.get('lowercase', True)
+            and parametros.get('tokenizer') is None
+            and parametros.get('preprocessor') is None
+            and parametros.get('stop_words') is None
+            and parametros.get('strip_accents') is None)
+
+
+class AnalisadorTokens:
+    """Analisador para CountVectorizer/HashingVectorizer a partir de uma visão dos tokens"""
+
+    def __init__(self, ngram_range=(1, 1), visao='palavras', derivar=_palavras):
+        self.ngram_range = tuple(ngram_range)
+        self.visao = visao
+        self.derivar = derivar
+        # Os n-gramas também viram uma visão: texto já visto não monta de novo
+        self.nome = f"{visao}:{self.ngram_range[0]}-{self.ngram_range[1]}"
+
+    def __call__(self, documento):
+        return tokenizar(documento).visao(self.nome, self._ngramas)
+
+    def _ngramas(self, tokenizado):
+        tokens = tokenizado.visao(self.visao, self.derivar)
+        # As visões só têm caracteres de palavra: a regex do sklearn vira "2+ caracteres"
+        tokens = [token for token in tokens if len(token) > 1]
+
+        # Mesma ordem do CountVectorizer._word_ngrams
+        minimo, maximo = self.ngram_range
+        if maximo == 1:
+            return tokens
+        termos = list(tokens) if minimo == 1 else []
+        for n in range(max(minimo, 2), min(maximo, len(tokens)) + 1):
+            termos.extend(map(" ".join, zip(*[tokens[i:] for i in range(n)])))
+        return termos
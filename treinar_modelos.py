@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🏋️ TREINAMENTO DOS MODELOS (UMA VEZ)
+Treina os pipelines de analisador_ptbr e ml_sentimentos e grava os
+artefatos versionados em modelos/<nome>/<versao>/. Depois disso, importar
+os analisadores só carrega os arrays (mmap), sem treinar de novo.
+
+Uso:
+    python treinar_modelos.py              # treina o que estiver faltando
+    python treinar_modelos.py ptbr --forcar
+    python treinar_modelos.py --diretorio /srv/modelos   # grava em outra pasta
+"""
+
+import argparse
+import contextlib
+import importlib
+import os
+import sys
+import time
+
+from artefatos import DIRETORIO_MODELOS, salvar_modelo
+
+# nome do artefato → (módulo, função de treino, constante com a versão)
+MODELOS = {
+    'ptbr': ('analisador_ptbr', 'treinar_modelo_ptbr', 'VERSAO_PTBR'),
+    'ml': ('ml_sentimentos', 'treinar_modelo', 'VERSAO_MODELO'),
+}
+
+
+def tamanho_pasta(caminho):
+    return sum(os.path.getsize(os.path.join(caminho, arquivo)) for arquivo in os.listdir(caminho))
+
+
+def treinar(nome, forcar=False, diretorio=DIRETORIO_MODELOS):
+    modulo, funcao, constante = MODELOS[nome]
+    # Importar já carrega (ou treina e grava) a versão atual
+    with contextlib.redirect_stdout(sys.stderr):
+        modulo = importlib.import_module(modulo)
+    versao = getattr(modulo, constante)
+    destino = os.path.join(diretorio, nome, versao)
+    gravado = os.path.exists(os.path.join(destino, "meta.json"))
+    # O import treina e grava só no diretório padrão; em outro, grava aqui
+    padrao = os.path.abspath(diretorio) == os.path.abspath(DIRETORIO_MODELOS)
+
+    if padrao and modulo.treinado and gravado and not forcar:
+        print(f"🏋️ {nome}: versão {versao} treinada e gravada → {destino} "
+              f"({tamanho_pasta(destino) / 1024:.1f} KB)")
+    elif forcar or not gravado:
+        inicio = time.perf_counter()
+        modelo = getattr(modulo, funcao)()
+        duracao = time.perf_counter() - inicio
+        destino = salvar_modelo(modelo, nome, versao, diretorio)
+        print(f"🏋️ {nome}: treinado em {duracao:.2f}s → {destino} "
+              f"({tamanho_pasta(destino) / 1024:.1f} KB)")
+    else:
+        print(f"✅ {nome}: versão {versao} já treinada ({destino})")
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Treina e grava os artefatos dos modelos")
+    parser.add_argument("modelos", nargs="*", metavar="modelo",
+                        help=f"{', '.join(MODELOS)} (padrão: todos)")
+    parser.add_argument("--forcar", action="store_true", help="treina mesmo se a versão já existir")
+    parser.add_argument("--diretorio", default=DIRETORIO_MODELOS)
+    args = parser.parse_args(argumentos)
+
+    for nome in args.modelos or MODELOS:
+        if nome not in MODELOS:
+            parser.error(f"modelo desconhecido: {nome}")
+        treinar(nome, args.forcar, args.diretorio)
+
+
+if __name__ == "__main__":
+    main()
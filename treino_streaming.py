@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🌊 TREINO EM STREAMING (FORA DA MEMÓRIA)
+Treina um MultinomialNB num corpus rotulado em disco (JSONL ou CSV) maior
+que a RAM: o arquivo é lido em mini-lotes, cada lote passa pelo mesmo
+pré-processamento do analisador_ptbr e por um HashingVectorizer (sem
+vocabulário, sem estado) e entra no partial_fit. A memória fica limitada
+ao tamanho do lote mais os 2 × n_features contadores do modelo.
+
+A cada N lotes grava um checkpoint; --retomar continua de onde parou.
+O resultado é um artefato (artefatos.py) que substitui o modelo_ptbr:
+
+    ANALISADOR_MODELO_PTBR=ptbr_stream python analisador_ptbr.py
+
+Uso:
+    python treino_streaming.py corpus.jsonl
+    python treino_streaming.py corpus.csv --campo-rotulo label --lote 20000 --checkpoint 10
+"""
+
+import argparse
+import contextlib
+import hashlib
+import os
+import resource
+import sys
+import time
+
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.naive_bayes import MultinomialNB
+from sklearn.pipeline import Pipeline
+
+import pipeline
+from artefatos import DIRETORIO_MODELOS, carregar_modelo, ler_meta, salvar_modelo
+from pontuar_lote import blocos
+
+CLASSES = np.array([0, 1])
+
+# Rótulos aceitos além de 0/1
+ROTULOS_TEXTO = {'positivo': 1, 'pos': 1, 'positive': 1, 'negativo': 0, 'neg': 0, 'negative': 0}
+
+PARAMETROS_HASHING = {
+    'n_features': 2 ** 20,
+    'ngram_range': (1, 2),
+    'alternate_sign': False,    # MultinomialNB precisa de contagens não negativas
+    'norm': None,
+}
+
+
+def converter_rotulo(valor):
+    """0/1, "0"/"1" ou positivo/negativo → 0 ou 1 (None se não reconhecer)"""
+    if isinstance(valor, str):
+        valor = valor.strip().lower()
+        if valor in ROTULOS_TEXTO:
+            return ROTULOS_TEXTO[valor]
+    try:
+        valor = int(valor)
+    except (TypeError, ValueError):
+        return None
+    return valor if valor in (0, 1) else None
+
+
+def exemplos(caminho, campo_texto=None, campo_rotulo='rotulo', pular=0):
+    """(texto, rótulo ou None) lidos linha a linha do arquivo, pulando os `pular` primeiros"""
+    for i, registro in enumerate(pipeline.de_arquivo(caminho, campo_texto)):
+        if i >= pular:
+            yield registro['texto'], converter_rotulo(registro.get(campo_rotulo))
+
+
+def versao_stream(caminho, parametros):
+    """Versão do artefato: arquivo de origem (nome e tamanho) + parâmetros"""
+    h = hashlib.sha1(repr((os.path.basename(caminho), os.path.getsize(caminho),
+                           sorted(parametros.items()))).encode("utf-8"))
+    return "stream-" + h.hexdigest()[:12]
+
+
+def pico_memoria_mb():
+    """Pico de RSS do processo (ru_maxrss vem em KB no Linux, bytes no macOS)"""
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / 2**20 if sys.platform == 'darwin' else pico / 1024
+
+
+def treinar(caminho, nome='ptbr_stream', campo_texto=None, campo_rotulo='rotulo',
+            tamanho_lote=10_000, checkpoint=20, retomar=False, n_features=PARAMETROS_HASHING['n_features'],
+            diretorio=DIRETORIO_MODELOS):
+    parametros = dict(PARAMETROS_HASHING, n_features=n_features)
+    versao = versao_stream(caminho, parametros)
+
+    modelo, linhas = None, 0
+    meta = ler_meta(nome, versao, diretorio) if retomar else None
+    if meta is not None:
+        modelo = carregar_modelo(nome, versao, diretorio, mmap=False, contagens=True)
+        linhas = meta.get('linhas', 0)
+        print(f"↩️  Retomando {nome}/{versao} a partir da linha {linhas:,}", file=sys.stderr)
+    if modelo is None:
+        modelo = Pipeline([('hashingvectorizer', HashingVectorizer(**parametros)),
+                           ('multinomialnb', MultinomialNB())])
+    vetorizador, classificador = modelo.steps[0][1], modelo.steps[-1][1]
+
+    def gravar(completo):
+        salvar_modelo(modelo, nome, versao, diretorio, atual=completo, contagens=True,
+                      linhas=linhas, completo=completo, origem=os.path.abspath(caminho))
+
+    with contextlib.redirect_stdout(sys.stderr):
+        from analisador_ptbr import preprocessar_ptbr
+
+    inicio = time.perf_counter()
+    fluxo = exemplos(caminho, campo_texto, campo_rotulo, pular=linhas)
+    for numero, lote in enumerate(blocos(fluxo, tamanho_lote), 1):
+        # `linhas` conta registros lidos (inclusive sem rótulo) para o --retomar
+        linhas += len(lote)
+        rotulados = [(preprocessar_ptbr(texto), rotulo) for texto, rotulo in lote if rotulo is not None]
+        if not rotulados:
+            continue
+        textos, rotulos = zip(*rotulados)
+        # transform é sem estado: nada cresce com o tamanho do corpus
+        classificador.partial_fit(vetorizador.transform(textos), np.array(rotulos), classes=CLASSES)
+
+        if numero % checkpoint == 0:
+            gravar(completo=False)
+        vazao = linhas / (time.perf_counter() - inicio)
+        print(f"\r⏳ {linhas:,} exemplos | {vazao:,.0f}/s | pico {pico_memoria_mb():,.0f} MB",
+              end="", file=sys.stderr)
+
+    if not hasattr(classificador, 'classes_'):
+        raise ValueError(f"Nenhum exemplo rotulado em '{caminho}' (campo '{campo_rotulo}')")
+    gravar(completo=True)
+    print(f"\r✅ {linhas:,} exemplos → {os.path.join(diretorio, nome, versao)} "
+          f"| pico {pico_memoria_mb():,.0f} MB", file=sys.stderr)
+    return modelo
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Treina o modelo PT-BR lendo o corpus em streaming")
+    parser.add_argument("entrada", help="arquivo .jsonl ou .csv com texto e rótulo")
+    parser.add_argument("--nome", default="ptbr_stream", help="nome do artefato em modelos/")
+    parser.add_argument("--campo-texto", help="coluna com o texto (padrão: texto/full_text/text)")
+    parser.add_argument("--campo-rotulo", default="rotulo", help="coluna com o rótulo (0/1 ou positivo/negativo)")
+    parser.add_argument("--lote", type=int, default=10_000, help="exemplos por partial_fit")
+    parser.add_argument("--checkpoint", type=int, default=20, help="grava a cada N lotes")
+    parser.add_argument("--retomar", action="store_true", help="continua do último checkpoint")
+    parser.add_argument("--n-features", type=int, default=PARAMETROS_HASHING['n_features'])
+    parser.add_argument("--diretorio", default=DIRETORIO_MODELOS)
+    args = parser.parse_args(argumentos)
+
+    treinar(args.entrada, args.nome, args.campo_texto, args.campo_rotulo, args.lote,
+            args.checkpoint, args.retomar, args.n_features, args.diretorio)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,10 +14,13 @@ except ImportError:
     print("❌ Arquivo config.py não encontrado")
     exit()
 
-import tweepy
-import re
 from datetime import datetime
 
+import pipeline
+from agregador import AgregadorSentimentos
+from cache import cache_nomeado
+from lexico import LexicoCompilado, classificar, MUITO_POSITIVO, POSITIVO, NEUTRO, NEGATIVO, MUITO_NEGATIVO
+
 class TwitterManager:
     def __init__(self):
         self.api = None
@@ -28,6 +31,9 @@ class TwitterManager:
         try:
             print("🔗 Conectando à API do Twitter...")
             
+            # tweepy só carrega quando a conexão é feita (não ao importar o léxico)
+            import tweepy
+            
             # Autenticação
             auth = tweepy.OAuthHandler(
                 TWITTER_KEYS["API_KEY"], 
@@ -54,46 +60,36 @@ class TwitterManager:
             print("💡 Verifique se todas as chaves estão corretas")
             return False
     
-    def buscar_tweets_ptbr(self, query, quantidade=10):
-        """Busca tweets em português"""
+    def iterar_tweets_ptbr(self, query, quantidade=10):
+        """Gera tweets em português conforme as páginas da busca chegam"""
         try:
             print(f"🔍 Buscando {quantidade} tweets sobre: '{query}'")
             
-            # Buscar tweets em português, excluir retweets
-            tweets = self.api.search_tweets(
-                q=f"{query} -filter:retweets lang:pt",
-                count=quantidade,
-                tweet_mode='extended'
-            )
+            from coleta import coletar_paginas
             
-            tweets_data = []
-            for tweet in tweets:
-                # Limpar texto do tweet
-                texto_limpo = re.sub(r'http\S+', '', tweet.full_text)
-                texto_limpo = re.sub(r'@\w+', '', texto_limpo)
-                texto_limpo = re.sub(r'#\w+', '', texto_limpo)
-                texto_limpo = texto_limpo.strip()
-                
-                if texto_limpo and len(texto_limpo) > 10:  # Só tweets com conteúdo
-                    tweets_data.append({
-                        'texto': texto_limpo,
-                        'usuario': tweet.user.screen_name,
-                        'nome': tweet.user.name,
-                        'seguidores': tweet.user.followers_count,
-                        'data': tweet.created_at,
-                        'likes': tweet.favorite_count,
-                        'retweets': tweet.retweet_count,
-                        'localizacao': tweet.user.location or "Não informada"
-                    })
-            
-            print(f"✅ {len(tweets_data)} tweets relevantes encontrados")
-            return tweets_data
+            # Buscar tweets em português, excluir retweets (página a página, sem repetidos)
+            for pagina in coletar_paginas(self.api, f"{query} -filter:retweets lang:pt", meta=quantidade):
+                yield from pagina
             
         except Exception as e:
             print(f"❌ Erro na busca: {e}")
-            return []
+    
+    def buscar_tweets_ptbr(self, query, quantidade=10):
+        """Busca tweets em português (lista já limpa)"""
+        tweets_data = list(pipeline.limpar(self.iterar_tweets_ptbr(query, quantidade)))
+        print(f"✅ {len(tweets_data)} tweets relevantes encontrados")
+        return tweets_data
 
 class AnalisadorPortugues:
+    # Rótulo de cada classe de sentimento
+    ROTULOS = {
+        MUITO_POSITIVO: "😍 MUITO POSITIVO",
+        POSITIVO: "😊 POSITIVO",
+        NEUTRO: "😐 NEUTRO",
+        NEGATIVO: "😠 NEGATIVO",
+        MUITO_NEGATIVO: "🤬 MUITO NEGATIVO",
+    }
+
     def __init__(self):
         # Dicionário completo para português brasileiro
         self.positivas = {
@@ -112,31 +108,16 @@ class AnalisadorPortugues:
             'raiva': 2, 'ódio': 2, 'revolta': 1, 'indignado': 1, 'fracasso': 1,
             'horrivel': 2, 'terrivel': 2, 'pessimo': 2, 'decepcionado': 1
         }
+        
+        self.lexico = LexicoCompilado(
+            self.positivas, self.negativas,
+            cache=cache_nomeado("twitter_pronto.AnalisadorPortugues")
+        )
 
     def analisar(self, texto):
         """Analisa sentimento do texto"""
-        texto = texto.lower()
-        score = 0
-        palavras_detectadas = []
-        
-        for palavra in texto.split():
-            if palavra in self.positivas:
-                score += self.positivas[palavra]
-                palavras_detectadas.append(f"➕{palavra}")
-            elif palavra in self.negativas:
-                score += self.negativas[palavra]
-                palavras_detectadas.append(f"➖{palavra}")
-        
-        if score >= 3:
-            return "😍 MUITO POSITIVO", score, palavras_detectadas
-        elif score >= 1:
-            return "😊 POSITIVO", score, palavras_detectadas
-        elif score <= -3:
-            return "🤬 MUITO NEGATIVO", score, palavras_detectadas
-        elif score <= -1:
-            return "😠 NEGATIVO", score, palavras_detectadas
-        else:
-            return "😐 NEUTRO", score, palavras_detectadas
+        score, palavras_detectadas = self.lexico.analisar(texto)
+        return self.ROTULOS[classificar(score)], score, palavras_detectadas
 
 def main():
     print("🎯 INICIANDO ANALISADOR DE TWEETS REAIS...")
@@ -166,47 +147,45 @@ def main():
                 print("⚠️  Digite um tópico válido")
                 continue
             
-            # Buscar tweets
+            # Pipeline em streaming: cada tweet é limpo, pontuado e mostrado
+            # assim que chega, enquanto a busca continua
             print(f"\n📡 Conectando ao Twitter...")
-            tweets = twitter.buscar_tweets_ptbr(query, 8)
-            
-            if not tweets:
-                print("❌ Nenhum tweet encontrado. Tente outro termo.")
-                continue
+            agregado = AgregadorSentimentos()
+            fluxo = pipeline.montar(
+                pipeline.de_twitter(twitter, query, 8),
+                pipeline.limpar,
+                lambda tweets: pipeline.pontuar(tweets, analisador.analisar),
+                lambda tweets: pipeline.agregar(tweets, agregado)
+            )
             
-            print(f"\n📊 ANALISANDO {len(tweets)} TWEETS REAIS:")
+            print(f"\n📊 ANALISANDO TWEETS REAIS:")
             print("=" * 50)
             
-            resultados = []
-            for i, tweet in enumerate(tweets, 1):
-                sentimento, score, palavras = analisador.analisar(tweet['texto'])
-                
+            for i, tweet in enumerate(fluxo, 1):
                 print(f"\n🐦 TWEET {i}:")
                 print(f"   👤 @{tweet['usuario']} ({tweet['nome']})")
                 print(f"   📍 {tweet['localizacao']}")
                 print(f"   📝 {tweet['texto'][:80]}...")
                 print(f"   📅 {tweet['data'].strftime('%d/%m %H:%M')}")
                 print(f"   ❤️  {tweet['likes']} likes | 🔄 {tweet['retweets']} RTs")
-                print(f"   🎯 {sentimento} (score: {score})")
-                
-                if palavras:
-                    print(f"   🔍 Palavras: {', '.join(palavras[:3])}")
+                print(f"   🎯 {tweet['sentimento']} (score: {tweet['score']})")
                 
-                resultados.append(sentimento)
+                if tweet['palavras_chave']:
+                    print(f"   🔍 Palavras: {', '.join(tweet['palavras_chave'][:3])}")
+            
+            if not agregado.total:
+                print("❌ Nenhum tweet encontrado. Tente outro termo.")
+                continue
             
             # Estatísticas
             print(f"\n📈 RESUMO: SENTIMENTOS SOBRE '{query.upper()}'")
             print("-" * 40)
             
-            total = len(resultados)
-            muito_positivo = resultados.count("😍 MUITO POSITIVO")
-            positivo = resultados.count("😊 POSITIVO") 
-            muito_negativo = resultados.count("🤬 MUITO NEGATIVO")
-            negativo = resultados.count("😠 NEGATIVO")
-            neutro = resultados.count("😐 NEUTRO")
+            total = agregado.total
+            muito_positivo, positivo, neutro, negativo, muito_negativo = agregado.detalhado()
             
-            total_positivo = muito_positivo + positivo
-            total_negativo = muito_negativo + negativo
+            total_positivo = agregado.positivos
+            total_negativo = agregado.negativos
             
             print(f"😍 Muito positivo: {muito_positivo}")
             print(f"😊 Positivo: {positivo}")
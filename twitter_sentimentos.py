@@ -4,17 +4,27 @@
 print("🐦 ANALISADOR DE TWEETS BRASILEIROS EM TEMPO REAL")
 print("=" * 65)
 
-import tweepy
-import pandas as pd
-import re
 from datetime import datetime
 import time
 
+from cache import cache_nomeado
+from lexico import LexicoCompilado, classificar, MUITO_POSITIVO, POSITIVO, NEUTRO, NEGATIVO, MUITO_NEGATIVO
+from tokenizacao import tokenizar
+
 # Configurações (Vamos usar uma forma alternativa sem API keys primeiro)
 print("🔧 Iniciando analisador de tweets...")
 
 # Nosso analisador de sentimentos em português
 class AnalisadorPortugues:
+    # Rótulo de cada classe de sentimento
+    ROTULOS = {
+        MUITO_POSITIVO: "😊 MUITO POSITIVO",
+        POSITIVO: "😊 POSITIVO",
+        NEUTRO: "😐 NEUTRO",
+        NEGATIVO: "😠 NEGATIVO",
+        MUITO_NEGATIVO: "😠 MUITO NEGATIVO",
+    }
+
     def __init__(self):
         # Palavras-chave em português com pesos
         self.palavras_positivas = {
@@ -45,20 +55,24 @@ class AnalisadorPortugues:
             'dinheiro jogado fora', 'não comprem', 'não recomendo',
             'péssima experiência', 'que bagunça', 'que droga'
         ]
+        
+        # Expressões entram no mesmo léxico (autômato montado uma única vez)
+        expressoes = {expressao: 2 for expressao in self.expressoes_positivas}
+        expressoes.update({expressao: -2 for expressao in self.expressoes_negativas})
+        
+        self.lexico = LexicoCompilado(
+            self.palavras_positivas, self.palavras_negativas,
+            formato="{sinal} '{palavra}'", expressoes=expressoes,
+            cache=cache_nomeado("twitter_sentimentos.AnalisadorPortugues")
+        )
 
     def limpar_texto(self, texto):
         """Limpa o texto do tweet"""
         if not texto:
             return ""
         
-        # Remove URLs, menções e hashtags
-        texto = re.sub(r'http\S+', '', texto)
-        texto = re.sub(r'@\w+', '', texto)
-        texto = re.sub(r'#\w+', '', texto)
-        texto = re.sub(r'\n', ' ', texto)
-        texto = re.sub(r'\s+', ' ', texto).strip()
-        
-        return texto.lower()
+        # Sem URLs, menções e hashtags, a partir da tokenização compartilhada
+        return " ".join(tokenizar(texto).sem_ruido)
 
     def analisar_tweet(self, texto):
         """Analisa o sentimento de um tweet"""
@@ -67,41 +81,11 @@ class AnalisadorPortugues:
         if not texto_limpo:
             return "NEUTRO", 0, []
         
-        score = 0
-        palavras_detectadas = []
-        
-        # Verificar expressões compostas primeiro
-        for expressao in self.expressoes_positivas:
-            if expressao in texto_limpo:
-                score += 2
-                palavras_detectadas.append(f"➕ '{expressao}'")
-        
-        for expressao in self.expressoes_negativas:
-            if expressao in texto_limpo:
-                score -= 2
-                palavras_detectadas.append(f"➖ '{expressao}'")
-        
-        # Verificar palavras individuais
-        palavras = texto_limpo.split()
-        for palavra in palavras:
-            if palavra in self.palavras_positivas:
-                score += self.palavras_positivas[palavra]
-                palavras_detectadas.append(f"➕ '{palavra}'")
-            elif palavra in self.palavras_negativas:
-                score += self.palavras_negativas[palavra]
-                palavras_detectadas.append(f"➖ '{palavra}'")
+        # Expressões compostas e palavras individuais numa única passada
+        score, palavras_detectadas = self.lexico.analisar(texto_limpo)
         
         # Classificar baseado no score
-        if score >= 3:
-            return "😊 MUITO POSITIVO", score, palavras_detectadas
-        elif score >= 1:
-            return "😊 POSITIVO", score, palavras_detectadas
-        elif score <= -3:
-            return "😠 MUITO NEGATIVO", score, palavras_detectadas
-        elif score <= -1:
-            return "😠 NEGATIVO", score, palavras_detectadas
-        else:
-            return "😐 NEUTRO", score, palavras_detectadas
+        return self.ROTULOS[classificar(score)], score, palavras_detectadas
 
 # Simulador de tweets brasileiros (enquanto não temos API)
 class SimuladorTweets:
@@ -7,10 +7,12 @@ print("💡 Usando dados simulados baseados em tendências reais")
 print()
 
 from config import TWITTER_KEYS
-import tweepy
 import random
 from datetime import datetime, timedelta
 
+from cache import cache_nomeado
+from lexico import LexicoCompilado, classificar, MUITO_POSITIVO, POSITIVO, NEUTRO, NEGATIVO, MUITO_NEGATIVO
+
 class TwitterSimulacaoRealista:
     def __init__(self):
         # Dados baseados em tendências reais do Twitter
@@ -81,6 +83,15 @@ class TwitterSimulacaoRealista:
         return tweets_com_dados
 
 class AnalisadorPortugues:
+    # Rótulo de cada classe de sentimento
+    ROTULOS = {
+        MUITO_POSITIVO: "😍 MUITO POSITIVO",
+        POSITIVO: "😊 POSITIVO",
+        NEUTRO: "😐 NEUTRO",
+        NEGATIVO: "😠 NEGATIVO",
+        MUITO_NEGATIVO: "🤬 MUITO NEGATIVO",
+    }
+
     def __init__(self):
         self.positivas = {
             'amo': 3, 'adoro': 3, 'incrível': 2, 'fantástico': 2, 'sensacional': 2,
@@ -96,30 +107,15 @@ class AnalisadorPortugues:
             'furada': 2, 'assustadora': 2, 'travando': 1, 'superestimado': 1,
             'meia boca': 2, 'câncer': 3, 'crime': 2, 'injustiça': 1
         }
+        
+        self.lexico = LexicoCompilado(
+            self.positivas, self.negativas,
+            cache=cache_nomeado("twitter_v2.AnalisadorPortugues")
+        )
 
     def analisar(self, texto):
-        texto = texto.lower()
-        score = 0
-        palavras_detectadas = []
-        
-        for palavra in texto.split():
-            if palavra in self.positivas:
-                score += self.positivas[palavra]
-                palavras_detectadas.append(f"➕{palavra}")
-            elif palavra in self.negativas:
-                score += self.negativas[palavra]
-                palavras_detectadas.append(f"➖{palavra}")
-        
-        if score >= 3:
-            return "😍 MUITO POSITIVO", score, palavras_detectadas
-        elif score >= 1:
-            return "😊 POSITIVO", score, palavras_detectadas
-        elif score <= -3:
-            return "🤬 MUITO NEGATIVO", score, palavras_detectadas
-        elif score <= -1:
-            return "😠 NEGATIVO", score, palavras_detectadas
-        else:
-            return "😐 NEUTRO", score, palavras_detectadas
+        score, palavras_detectadas = self.lexico.analisar(texto)
+        return self.ROTULOS[classificar(score)], score, palavras_detectadas
 
 def main():
     print("🎯 ANALISADOR DE SENTIMENTOS - DADOS REALISTAS")